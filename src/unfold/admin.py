@@ -2,19 +2,21 @@ from functools import update_wrapper
 from typing import Any, Optional
 
 from django import forms
+from django.contrib.admin import AdminSite, display, helpers
 from django.contrib.admin import ModelAdmin as BaseModelAdmin
 from django.contrib.admin import StackedInline as BaseStackedInline
 from django.contrib.admin import TabularInline as BaseTabularInline
-from django.contrib.admin import display, helpers
-from django.contrib.admin.options import InlineModelAdmin
+from django.contrib.admin.options import IncorrectLookupParameters, InlineModelAdmin
+from django.contrib.admin.utils import get_fields_from_path, unquote
 from django.contrib.contenttypes.admin import (
     GenericStackedInline as BaseGenericStackedInline,
 )
 from django.contrib.contenttypes.admin import (
     GenericTabularInline as BaseGenericTabularInline,
 )
+from django.core.exceptions import PermissionDenied
 from django.db.models import BLANK_CHOICE_DASH, Model
-from django.http import HttpRequest, HttpResponse
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.urls import URLPattern, path
@@ -31,7 +33,7 @@ from unfold.forms import (
 from unfold.mixins import ActionModelAdminMixin, BaseModelAdminMixin
 from unfold.overrides import FORMFIELD_OVERRIDES_INLINE
 from unfold.typing import FieldsetsType
-from unfold.views import ChangeList
+from unfold.views import ChangeList, FilterSheetChangeList, clear_watched_models
 from unfold.widgets import UnfoldBooleanWidget
 
 checkbox = UnfoldBooleanWidget(
@@ -50,8 +52,12 @@ class ModelAdmin(BaseModelAdminMixin, ActionModelAdminMixin, BaseModelAdmin):
     list_horizontal_scrollbar_top = False
     list_filter_submit = False
     list_filter_sheet = True
+    list_filter_defer = False
     list_fullwidth = False
     list_disable_select_all = False
+    list_count_cache_timeout = None
+    list_count_cache_scope = "user"
+    search_narrowable = False
     list_before_template = None
     list_after_template = None
     change_form_before_template = None
@@ -63,6 +69,12 @@ class ModelAdmin(BaseModelAdminMixin, ActionModelAdminMixin, BaseModelAdmin):
     warn_unsaved_form = False
     checks_class = UnfoldModelAdminChecks
 
+    def __init__(self, model: type[Model], admin_site: AdminSite) -> None:
+        super().__init__(model, admin_site)
+
+        # Models watched by cache invalidation depend on the registered admins
+        clear_watched_models()
+
     def changelist_view(
         self, request: HttpRequest, extra_context: Optional[dict[str, str]] = None
     ) -> TemplateResponse:
@@ -145,11 +157,34 @@ class ModelAdmin(BaseModelAdminMixin, ActionModelAdminMixin, BaseModelAdmin):
             for action in self._get_base_actions_row()
         ]
 
+        filter_urls = [
+            path(
+                "filters/",
+                wrap(self.changelist_filters_view),
+                name=f"{self.opts.app_label}_{self.opts.model_name}_changelist_filters",
+            ),
+            path(
+                "filters/<str:field_path>/choices/",
+                wrap(self.filter_choices_view),
+                name=f"{self.opts.app_label}_{self.opts.model_name}_filter_choices",
+            ),
+        ]
+
+        inline_page_urls = [
+            path(
+                "<path:object_id>/inlines/<str:prefix>/",
+                wrap(self.inline_page_view),
+                name=f"{self.opts.app_label}_{self.opts.model_name}_inline_page",
+            )
+        ]
+
         return (
             custom_urls
             + action_row_urls
             + actions_list_urls
             + action_detail_urls
+            + filter_urls
+            + inline_page_urls
             + urls
         )
 
@@ -186,8 +221,20 @@ class ModelAdmin(BaseModelAdminMixin, ActionModelAdminMixin, BaseModelAdmin):
         return res
 
     def get_changelist(self, request, **kwargs):
+        if getattr(request, "_unfold_list_filter_sheet", False):
+            return FilterSheetChangeList
+
         return ChangeList
 
+    def is_list_filter_deferred(self, request: HttpRequest) -> bool:
+        """
+        While the filter sheet is deferred, filters do not load their choices
+        with the changelist, only together with the sheet.
+        """
+        return self.list_filter_defer and not getattr(
+            request, "_unfold_list_filter_sheet", False
+        )
+
     def get_formset_kwargs(
         self, request: HttpRequest, obj: Model, inline: InlineModelAdmin, prefix: str
     ) -> dict[str, Any]:
@@ -197,14 +244,136 @@ class ModelAdmin(BaseModelAdminMixin, ActionModelAdminMixin, BaseModelAdmin):
             formset_kwargs["request"] = request
             formset_kwargs["per_page"] = inline.per_page
 
+            if getattr(inline, "paginator", None) is not None:
+                formset_kwargs["paginator_class"] = inline.paginator
+
         return formset_kwargs
 
+    def inline_page_view(
+        self, request: HttpRequest, object_id: str, prefix: str
+    ) -> TemplateResponse:
+        """
+        Renders a page of a paginated inline alone, so it can be swapped in
+        the change form without loading the whole form again.
+        """
+        obj = self.get_object(request, unquote(object_id))
+
+        if obj is None or not self.has_view_or_change_permission(request, obj):
+            raise PermissionDenied
+
+        # Same prefixes as Django assigns in _create_formsets
+        prefixes = {}
+
+        for FormSet, inline in self.get_formsets_with_inlines(request, obj):
+            formset_prefix = FormSet.get_default_prefix()
+            prefixes[formset_prefix] = prefixes.get(formset_prefix, 0) + 1
+
+            if prefixes[formset_prefix] != 1 or not formset_prefix:
+                formset_prefix = f"{formset_prefix}-{prefixes[formset_prefix]}"
+
+            if formset_prefix != prefix or not getattr(inline, "per_page", None):
+                continue
+
+            formset = FormSet(
+                **self.get_formset_kwargs(request, obj, inline, formset_prefix)
+            )
+            (inline_admin_formset,) = self.get_inline_formsets(
+                request, [formset], [inline], obj
+            )
+
+            return TemplateResponse(
+                request,
+                inline.template,
+                {
+                    **self.admin_site.each_context(request),
+                    "inline_admin_formset": inline_admin_formset,
+                    "opts": self.opts,
+                    "original": obj,
+                },
+            )
+
+        raise Http404
+
+    def changelist_filters_view(self, request: HttpRequest) -> TemplateResponse:
+        """
+        Renders the filter sheet alone. With list_filter_defer, the changelist
+        loads it the first time the sheet is opened, so filter choices are not
+        computed for requests which only page or sort.
+        """
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        # Only filters are rendered, results are neither counted nor loaded
+        request._unfold_list_filter_sheet = True
+
+        try:
+            cl = self.get_changelist_instance(request)
+        except IncorrectLookupParameters as e:
+            raise Http404 from e
+
+        return TemplateResponse(
+            request,
+            "unfold/helpers/change_list_filter_form.html",
+            {
+                **self.admin_site.each_context(request),
+                "cl": cl,
+                "opts": cl.opts,
+            },
+        )
+
+    def filter_choices_view(
+        self, request: HttpRequest, field_path: str
+    ) -> JsonResponse:
+        """
+        Page of choices of a list filter in lazy choices mode, in the format
+        select2 expects: results with id and text and whether more follow.
+        """
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        list_filter = self.get_lazy_list_filter(request, field_path)
+
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+
+        choices, has_more = list_filter.get_cached_lazy_page(
+            request.GET.get("term", ""), page
+        )
+
+        return JsonResponse(
+            {
+                "results": [
+                    {"id": str(value), "text": label} for value, label in choices
+                ],
+                "pagination": {"more": has_more},
+            }
+        )
+
+    def get_lazy_list_filter(self, request: HttpRequest, field_path: str) -> Any:
+        # Only fields with lazy filters in list_filter are exposed
+        for list_filter in self.get_list_filter(request):
+            if (
+                isinstance(list_filter, (tuple, list))
+                and list_filter[0] == field_path
+                and getattr(list_filter[1], "lazy_choices", False)
+            ):
+                field = get_fields_from_path(self.model, field_path)[-1]
+
+                return list_filter[1](
+                    field, request, {}, self.model, self, field_path=field_path
+                )
+
+        raise Http404
+
 
 class BaseInlineMixin:
     formfield_overrides = FORMFIELD_OVERRIDES_INLINE
     readonly_preprocess_fields = {}
     ordering_field = None
     per_page = None
+    paginator = None
     hide_ordering_field = False
     collapsible = False
 
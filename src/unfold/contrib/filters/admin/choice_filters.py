@@ -4,19 +4,25 @@ from typing import Any
 from django.contrib import admin
 from django.contrib.admin.views.main import ChangeList
 from django.core.validators import EMPTY_VALUES
-from django.db.models import QuerySet
+from django.db.models import Field, Model, QuerySet
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
+from unfold.admin import ModelAdmin
 from unfold.contrib.filters.admin.mixins import (
+    BatchedFacetsMixin,
+    CachedLookupsMixin,
     ChoicesMixin,
+    LazyChoicesMixin,
     MultiValueMixin,
+    RelatedLazyChoicesMixin,
     ValueMixin,
 )
+from unfold.contrib.filters.cache import get_cached_filter_value
 from unfold.contrib.filters.forms import CheckboxForm, HorizontalRadioForm, RadioForm
 
 
-class RadioFilter(admin.SimpleListFilter):
+class RadioFilter(BatchedFacetsMixin, CachedLookupsMixin, admin.SimpleListFilter):
     template = "unfold/filters/filters_field.html"
     form_class = RadioForm
     all_option = ["", _("All")]
@@ -72,7 +78,7 @@ class ChoicesCheckboxFilter(
     all_option = None
 
 
-class BooleanRadioFilter(ValueMixin, admin.BooleanFieldListFilter):
+class BooleanRadioFilter(ValueMixin, BatchedFacetsMixin, admin.BooleanFieldListFilter):
     template = "unfold/filters/filters_field.html"
     form_class = HorizontalRadioForm
     all_option = ["", _("All")]
@@ -108,8 +114,14 @@ class BooleanRadioFilter(ValueMixin, admin.BooleanFieldListFilter):
         }
 
 
-class RelatedCheckboxFilter(MultiValueMixin, admin.RelatedFieldListFilter):
+class RelatedCheckboxFilter(
+    MultiValueMixin,
+    RelatedLazyChoicesMixin,
+    BatchedFacetsMixin,
+    admin.RelatedFieldListFilter,
+):
     template = "unfold/filters/filters_field.html"
+    lazy_template = "unfold/filters/filters_lazy_field.html"
     form_class = CheckboxForm
 
     def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
@@ -139,26 +151,88 @@ class RelatedCheckboxFilter(MultiValueMixin, admin.RelatedFieldListFilter):
                 choices=choices,
                 data={self.lookup_kwarg: self.value()},
             ),
+            **self.get_lazy_context(),
         }
 
 
-class AllValuesCheckboxFilter(MultiValueMixin, admin.AllValuesFieldListFilter):
+class AllValuesCheckboxFilter(
+    MultiValueMixin,
+    LazyChoicesMixin,
+    BatchedFacetsMixin,
+    admin.AllValuesFieldListFilter,
+):
     template = "unfold/filters/filters_field.html"
+    lazy_template = "unfold/filters/filters_lazy_field.html"
     form_class = CheckboxForm
+    # Values come from the admin queryset, which may differ between users
+    # sharing the same permissions
+    cache_timeout = None
+
+    def __init__(
+        self,
+        field: Field,
+        request: HttpRequest,
+        params: dict[str, Any],
+        model: type[Model],
+        model_admin: ModelAdmin,
+        field_path: str,
+    ) -> None:
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+        # Distinct values of the field, not evaluated yet
+        self.lazy_queryset = self.lookup_choices
+
+        if self.choices_deferred:
+            self.lookup_choices = []
+        elif self.lazy_choices:
+            # Loaded once rendered, the filter choices endpoint reads only pages
+            self.lookup_choices = None
+        else:
+            self.lookup_choices = get_cached_filter_value(
+                self,
+                request,
+                model_admin,
+                field_path,
+                "lookups",
+                lambda: list(self.lazy_queryset),
+            )
+
+    def get_lookup_choices(self) -> list[Any]:
+        if self.lookup_choices is None:
+            self.lookup_choices = [value for value, _label in self.get_lazy_choices()]
+
+        return self.lookup_choices
+
+    def get_facet_counts(
+        self, pk_attname: str, filtered_qs: QuerySet
+    ) -> dict[str, Any]:
+        self.get_lookup_choices()
+
+        return super().get_facet_counts(pk_attname, filtered_qs)
+
+    def get_lazy_queryset(self) -> QuerySet:
+        return self.lazy_queryset
+
+    def search_lazy_queryset(self, queryset: QuerySet, search_term: str) -> QuerySet:
+        return queryset.filter(**{f"{self.field.name}__icontains": search_term})
+
+    def filter_lazy_queryset(self, queryset: QuerySet, values: list[str]) -> QuerySet:
+        return queryset.filter(**{f"{self.field.name}__in": values})
 
     def choices(self, changelist: ChangeList) -> Generator[dict[str, Any], None, None]:
+        lookup_choices = self.get_lookup_choices()
         add_facets = getattr(changelist, "add_facets", False)
         facet_counts = self.get_facet_queryset(changelist) if add_facets else None
 
         if add_facets:
             choices = []
 
-            for i, val in enumerate(self.lookup_choices):
+            for i, val in enumerate(lookup_choices):
                 count = facet_counts[f"{i}__c"]
                 choice = (val, f"{val} ({count})")
                 choices.append(choice)
         else:
-            choices = [[val, val] for _i, val in enumerate(self.lookup_choices)]
+            choices = [[val, val] for _i, val in enumerate(lookup_choices)]
 
         if len(choices) == 0:
             return
@@ -170,4 +244,5 @@ class AllValuesCheckboxFilter(MultiValueMixin, admin.AllValuesFieldListFilter):
                 choices=choices,
                 data={self.lookup_kwarg: self.value()},
             ),
+            **self.get_lazy_context(),
         }
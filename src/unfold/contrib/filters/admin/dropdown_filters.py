@@ -3,20 +3,23 @@ from typing import Any
 
 from django.contrib import admin
 from django.contrib.admin.views.main import ChangeList
-from django.db.models import Field, Model
+from django.db.models import Model
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
 from unfold.admin import ModelAdmin
 from unfold.contrib.filters.admin.mixins import (
+    BatchedFacetsMixin,
+    CachedLookupsMixin,
     DropdownMixin,
     MultiValueMixin,
+    RelatedLazyChoicesMixin,
     ValueMixin,
 )
-from unfold.contrib.filters.forms import DropdownForm
+from unfold.contrib.filters.forms import DropdownForm, LazyDropdownForm
 
 
-class DropdownFilter(admin.SimpleListFilter):
+class DropdownFilter(CachedLookupsMixin, admin.SimpleListFilter):
     template = "unfold/filters/filters_field.html"
     form_class = DropdownForm
     all_option = ["", _("All")]
@@ -71,20 +74,13 @@ class MultipleChoicesDropdownFilter(MultiValueMixin, ChoicesDropdownFilter):
     multiple = True
 
 
-class RelatedDropdownFilter(ValueMixin, DropdownMixin, admin.RelatedFieldListFilter):
-    def __init__(
-        self,
-        field: Field,
-        request: HttpRequest,
-        params: dict[str, str],
-        model: type[Model],
-        model_admin: ModelAdmin,
-        field_path: str,
-    ) -> None:
-        super().__init__(field, request, params, model, model_admin, field_path)
-        self.model_admin = model_admin
-        self.request = request
-
+class RelatedDropdownFilter(
+    ValueMixin,
+    DropdownMixin,
+    RelatedLazyChoicesMixin,
+    BatchedFacetsMixin,
+    admin.RelatedFieldListFilter,
+):
     def choices(self, changelist: ChangeList) -> Generator[dict[str, Any], None, None]:
         add_facets = getattr(changelist, "add_facets", False)
         facet_counts = self.get_facet_queryset(changelist) if add_facets else None
@@ -100,6 +96,19 @@ class RelatedDropdownFilter(ValueMixin, DropdownMixin, admin.RelatedFieldListFil
         else:
             choices = [self.all_option, *self.lookup_choices]
 
+        if self.lazy_choices:
+            yield {
+                "form": LazyDropdownForm(
+                    label=_(" By %(filter_title)s ") % {"filter_title": self.title},
+                    name=self.lookup_kwarg,
+                    choices=choices,
+                    url=self.get_lazy_url(),
+                    data={self.lookup_kwarg: self.value()},
+                    multiple=self.multiple if hasattr(self, "multiple") else False,
+                ),
+            }
+            return
+
         yield {
             "form": self.form_class(
                 label=_(" By %(filter_title)s ") % {"filter_title": self.title},
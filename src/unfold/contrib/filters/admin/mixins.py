@@ -1,20 +1,311 @@
+import functools
 from collections.abc import Generator
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from django.contrib.admin.views.main import ChangeList
 from django.core.validators import EMPTY_VALUES
-from django.db.models import QuerySet
+from django.db.models import Model, QuerySet
 from django.db.models.fields import BLANK_CHOICE_DASH, Field
 from django.forms import ValidationError
 from django.http import HttpRequest
+from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from unfold.admin import ModelAdmin
+from unfold.contrib.filters.cache import get_cached_filter_value
 from unfold.contrib.filters.forms import (
     AutocompleteDropdownForm,
     DropdownForm,
     RangeNumericForm,
 )
+from unfold.widgets import CHECKBOX_CLASSES, INPUT_CLASSES
+
+
+class BatchedFacetsMixin:
+    """
+    Reads facet counts from the changelist, which counts facets of all
+    filters in a single query, instead of querying for each filter alone.
+    """
+
+    batch_facets = True
+
+    def get_facet_queryset(self, changelist: ChangeList) -> dict[str, Any]:
+        get_filter_facets = getattr(changelist, "get_filter_facets", None)
+
+        if get_filter_facets is not None:
+            facet_counts = get_filter_facets(self)
+
+            if facet_counts is not None:
+                return facet_counts
+
+        return super().get_facet_queryset(changelist)
+
+
+def is_list_filter_deferred(request: HttpRequest, model_admin: ModelAdmin) -> bool:
+    is_deferred = getattr(model_admin, "is_list_filter_deferred", None)
+
+    return is_deferred is not None and is_deferred(request)
+
+
+class DeferredChoicesMixin:
+    """
+    Choices are not loaded while the filter sheet is deferred. The filter
+    still narrows the changelist, so it is kept without them.
+    """
+
+    choices_deferred = False
+
+    def has_output(self) -> bool:
+        return self.choices_deferred or super().has_output()
+
+
+def cache_lookups(lookups: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps lookups() of a simple list filter so its choices are read from the
+    filter cache and not loaded at all while the filter sheet is deferred.
+    """
+
+    @functools.wraps(lookups)
+    def cached_lookups(self: Any, request: HttpRequest, model_admin: ModelAdmin) -> Any:
+        if self.computing_lookups:
+            # Called through super() by lookups() of a subclass
+            return lookups(self, request, model_admin)
+
+        if self.choices_deferred:
+            return []
+
+        def compute() -> list[tuple[Any, str]]:
+            self.computing_lookups = True
+
+            try:
+                return list(lookups(self, request, model_admin) or ())
+            finally:
+                self.computing_lookups = False
+
+        return get_cached_filter_value(
+            self, request, model_admin, self.parameter_name, "lookups", compute
+        )
+
+    return cached_lookups
+
+
+class CachedLookupsMixin(DeferredChoicesMixin):
+    """
+    Caches choices returned by lookups() of simple list filters for
+    `cache_timeout` seconds. Only changes of the admin model invalidate them,
+    lookups reading other models are refreshed after the timeout.
+    """
+
+    cache_timeout = None
+    computing_lookups = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # lookups() is implemented by subclasses and called by SimpleListFilter
+        if "lookups" in cls.__dict__:
+            cls.lookups = cache_lookups(cls.__dict__["lookups"])
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        params: dict[str, Any],
+        model: type[Model],
+        model_admin: ModelAdmin,
+    ) -> None:
+        self.choices_deferred = is_list_filter_deferred(request, model_admin)
+
+        super().__init__(request, params, model, model_admin)
+
+
+class LazyChoicesMixin(DeferredChoicesMixin):
+    """
+    In lazy choices mode, only selected choices and the first page of the
+    others are rendered. Remaining choices are loaded from the filter choices
+    endpoint of the model admin while searching or scrolling.
+    """
+
+    lazy_choices = False
+    lazy_choices_per_page = 20
+    lazy_template = None
+    cache_timeout = None
+
+    def __init__(
+        self,
+        field: Field,
+        request: HttpRequest,
+        params: dict[str, Any],
+        model: type[Model],
+        model_admin: ModelAdmin,
+        field_path: str,
+    ) -> None:
+        self.request = request
+        self.model_admin = model_admin
+        self.has_more_choices = False
+        self.choices_deferred = is_list_filter_deferred(request, model_admin)
+
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+        if self.lazy_choices and self.lazy_template:
+            self.template = self.lazy_template
+
+    def get_lazy_queryset(self) -> QuerySet:
+        raise NotImplementedError
+
+    def search_lazy_queryset(self, queryset: QuerySet, search_term: str) -> QuerySet:
+        raise NotImplementedError
+
+    def filter_lazy_queryset(self, queryset: QuerySet, values: list[str]) -> QuerySet:
+        raise NotImplementedError
+
+    def get_lazy_choice(self, item: Any) -> tuple[Any, str]:
+        return item, str(item)
+
+    def get_lazy_values(self) -> list[str]:
+        values = (
+            self.lookup_val if isinstance(self.lookup_val, list) else [self.lookup_val]
+        )
+
+        return [value for value in values if value not in EMPTY_VALUES]
+
+    def get_lazy_page(
+        self, search_term: str = "", page: int = 1
+    ) -> tuple[list[tuple[Any, str]], bool]:
+        """
+        Choices on the page and whether another page follows, found out by
+        loading one more row instead of counting all of them.
+        """
+        queryset = self.get_lazy_queryset()
+
+        if search_term:
+            queryset = self.search_lazy_queryset(queryset, search_term)
+
+        offset = (page - 1) * self.lazy_choices_per_page
+        items = list(queryset[offset : offset + self.lazy_choices_per_page + 1])
+
+        return (
+            [
+                self.get_lazy_choice(item)
+                for item in items[: self.lazy_choices_per_page]
+            ],
+            len(items) > self.lazy_choices_per_page,
+        )
+
+    def get_cached_lazy_page(
+        self, search_term: str = "", page: int = 1
+    ) -> tuple[list[tuple[Any, str]], bool]:
+        return get_cached_filter_value(
+            self,
+            self.request,
+            self.model_admin,
+            self.field_path,
+            "choices",
+            lambda: self.get_lazy_page(search_term, page),
+            (search_term, page),
+        )
+
+    def get_lazy_choices(self) -> list[tuple[Any, str]]:
+        choices, self.has_more_choices = self.get_cached_lazy_page()
+        rendered = {str(value) for value, _label in choices}
+        missing = [value for value in self.get_lazy_values() if value not in rendered]
+        selected = []
+
+        if missing:
+            try:
+                selected = [
+                    self.get_lazy_choice(item)
+                    for item in self.filter_lazy_queryset(
+                        self.get_lazy_queryset(), missing
+                    )
+                ]
+            except (ValueError, ValidationError):
+                pass
+
+        return [*selected, *choices]
+
+    def get_lazy_url(self) -> str:
+        opts = self.model_admin.opts
+
+        return reverse(
+            f"{self.model_admin.admin_site.name}:{opts.app_label}_{opts.model_name}_filter_choices",
+            kwargs={"field_path": self.field_path},
+        )
+
+    def get_lazy_context(self) -> dict[str, Any]:
+        if not self.lazy_choices:
+            return {}
+
+        return {
+            "name": self.lookup_kwarg,
+            "lazy_url": self.get_lazy_url(),
+            "has_more_choices": self.has_more_choices,
+            "search_class": " ".join(INPUT_CLASSES),
+            "option_class": " ".join(CHECKBOX_CLASSES),
+        }
+
+
+class RelatedLazyChoicesMixin(LazyChoicesMixin):
+    def field_choices(
+        self, field: Field, request: HttpRequest, model_admin: ModelAdmin
+    ) -> list[tuple[Any, str]]:
+        if self.choices_deferred:
+            return []
+
+        if self.lazy_choices:
+            return self.get_lazy_choices()
+
+        field_choices = super().field_choices
+
+        return get_cached_filter_value(
+            self,
+            request,
+            model_admin,
+            self.field_path,
+            "lookups",
+            lambda: field_choices(field, request, model_admin),
+        )
+
+    def get_lazy_queryset(self) -> QuerySet:
+        get_limit_choices_to = getattr(self.field, "get_limit_choices_to", None)
+        limit_choices_to = (
+            get_limit_choices_to()
+            if get_limit_choices_to is not None
+            else self.field.limit_choices_to
+        )
+        queryset = self.field.related_model._default_manager.complex_filter(
+            limit_choices_to or {}
+        )
+        ordering = self.field_admin_ordering(self.field, self.request, self.model_admin)
+
+        if ordering:
+            return queryset.order_by(*ordering)
+
+        # Pages need a stable order
+        return queryset if queryset.ordered else queryset.order_by("pk")
+
+    def search_lazy_queryset(self, queryset: QuerySet, search_term: str) -> QuerySet:
+        """
+        Search is delegated to the admin of the related model, the same way
+        as for autocomplete fields. Without search fields, nothing matches.
+        """
+        related_admin = self.model_admin.admin_site._registry.get(
+            self.field.related_model
+        )
+
+        if related_admin is None or not related_admin.get_search_fields(self.request):
+            return queryset.none()
+
+        queryset, may_have_duplicates = related_admin.get_search_results(
+            self.request, queryset, search_term
+        )
+
+        return queryset.distinct() if may_have_duplicates else queryset
+
+    def filter_lazy_queryset(self, queryset: QuerySet, values: list[str]) -> QuerySet:
+        return queryset.filter(**{f"{self.field.target_field.attname}__in": values})
+
+    def get_lazy_choice(self, item: Model) -> tuple[Any, str]:
+        return getattr(item, self.field.target_field.attname), str(item)
 
 
 class ValueMixin:
@@ -51,7 +342,7 @@ class DropdownMixin:
         return queryset
 
 
-class ChoicesMixin:
+class ChoicesMixin(BatchedFacetsMixin):
     template = "unfold/filters/filters_field.html"
 
     def choices(self, changelist: ChangeList) -> Generator[dict[str, Any], None, None]:
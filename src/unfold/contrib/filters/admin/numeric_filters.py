@@ -4,7 +4,7 @@ from django.contrib import admin
 from django.contrib.admin.options import ModelAdmin
 from django.contrib.admin.views.main import ChangeList
 from django.core.validators import EMPTY_VALUES
-from django.db.models import Max, Min, Model, QuerySet
+from django.db.models import Count, Max, Min, Model, QuerySet
 from django.db.models.fields import (
     AutoField,
     DecimalField,
@@ -16,6 +16,7 @@ from django.forms import ValidationError
 from django.http import HttpRequest
 
 from unfold.contrib.filters.admin.mixins import RangeNumericMixin
+from unfold.contrib.filters.cache import get_cached_filter_value
 from unfold.contrib.filters.forms import SingleNumericForm, SliderNumericForm
 
 
@@ -129,6 +130,7 @@ class SliderNumericFilter(RangeNumericFilter):
 
     template = "unfold/filters/filters_numeric_slider.html"
     field = None
+    cache_timeout = None
     form_class = SliderNumericForm
 
     def __init__(
@@ -143,18 +145,18 @@ class SliderNumericFilter(RangeNumericFilter):
         super().__init__(field, request, params, model, model_admin, field_path)
 
         self.field = field
+        self.model_admin = model_admin
         self.q = model_admin.get_queryset(request)
 
     def choices(self, changelist: ChangeList) -> tuple[dict[str, Any], ...]:
-        total = self.q.all().count()
-        min_value = self.q.all().aggregate(min=Min(self.parameter_name)).get("min", 0)
-
-        if total > 1:
-            max_value = (
-                self.q.all().aggregate(max=Max(self.parameter_name)).get("max", 0)
-            )
-        else:
-            max_value = None
+        min_value, max_value = get_cached_filter_value(
+            self,
+            self.request,
+            self.model_admin,
+            self.field_path,
+            "bounds",
+            self.get_bounds,
+        )
 
         if isinstance(self.field, (FloatField, DecimalField)):
             decimals = self.MAX_DECIMALS
@@ -191,6 +193,15 @@ class SliderNumericFilter(RangeNumericFilter):
             },
         )
 
+    def get_bounds(self) -> tuple[Any, Any]:
+        bounds = self.q.aggregate(
+            total=Count("pk"),
+            min=Min(self.parameter_name),
+            max=Max(self.parameter_name),
+        )
+
+        return bounds["min"], bounds["max"] if bounds["total"] > 1 else None
+
     def _get_min_step(self, precision: int) -> float:
         result_format = f"{{:.{precision - 1}f}}"
         return float(result_format.format(0) + "1")
@@ -3,12 +3,13 @@ from typing import Any
 from django.contrib import admin
 from django.contrib.admin.options import ModelAdmin
 from django.contrib.admin.views.main import ChangeList
-from django.db.models import Field, Model
+from django.db.models import Field, Model, QuerySet
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
 from unfold.contrib.filters.admin.mixins import ValueMixin
 from unfold.contrib.filters.forms import SearchForm
+from unfold.utils import get_search_regex
 
 
 class TextFilter(admin.SimpleListFilter):
@@ -53,6 +54,16 @@ class FieldTextFilter(ValueMixin, admin.FieldListFilter):
     def expected_parameters(self) -> list[str]:
         return [self.lookup_kwarg]
 
+    def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
+        value = self.value()
+        search_regex = get_search_regex(value) if value else None
+
+        # Arabic terms match regardless of diacritics, tatweel and letter forms
+        if search_regex is not None:
+            return queryset.filter(**{f"{self.field_path}__iregex": search_regex})
+
+        return super().queryset(request, queryset)
+
     def choices(self, changelist: ChangeList) -> tuple[dict[str, Any], ...]:
         return (
             {
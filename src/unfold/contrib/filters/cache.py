@@ -0,0 +1,164 @@
+import hashlib
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+from django.contrib.admin import ListFilter, ModelAdmin
+from django.contrib.admin.sites import all_sites
+from django.contrib.admin.utils import NotRelationField, get_fields_from_path
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.utils import translation
+
+from unfold.utils import get_permission_scope
+from unfold.views import watch_models
+
+FILTER_CACHE_PREFIX = "unfold_filters"
+
+
+def get_filter_models(model: type[Model], field_path: str) -> list[type[Model]]:
+    """
+    Model of the admin and all models on the way to the filtered field, as
+    changes in any of them can change the values offered by the filter.
+    """
+    models = [model._meta.concrete_model]
+
+    try:
+        fields = get_fields_from_path(model, field_path)
+    except (FieldDoesNotExist, NotRelationField):
+        return models
+
+    for field in fields:
+        if field.is_relation and field.related_model is not None:
+            models.append(field.related_model._meta.concrete_model)
+
+    return models
+
+
+def get_filter_cache_version_key(model: type[Model]) -> str:
+    return (
+        f"{FILTER_CACHE_PREFIX}_version_{model._meta.concrete_model._meta.label_lower}"
+    )
+
+
+def get_filter_cache_version(model: type[Model]) -> str:
+    """
+    Cached values are stored under versions of the models they were computed
+    from. Versions are replaced on every change, which invalidates all values
+    computed from the model at once.
+    """
+    cache_key = get_filter_cache_version_key(model)
+    version = cache.get(cache_key)
+
+    if version is None:
+        cache.add(cache_key, uuid4().hex, None)
+        version = cache.get(cache_key)
+
+    return version
+
+
+def get_filter_cache_key(
+    list_filter: ListFilter,
+    request: HttpRequest,
+    model_admin: ModelAdmin,
+    field_path: str,
+    kind: str,
+    params: tuple = (),
+) -> str:
+    filter_class = type(list_filter)
+    scope = [
+        f"{filter_class.__module__}.{filter_class.__qualname__}",
+        model_admin.admin_site.name,
+        model_admin.model._meta.label_lower,
+        field_path,
+        kind,
+        params,
+        translation.get_language(),
+        get_permission_scope(request.user),
+        [
+            get_filter_cache_version(model)
+            for model in get_filter_models(model_admin.model, field_path)
+        ],
+    ]
+
+    scope_hash = hashlib.sha256(repr(scope).encode()).hexdigest()[:32]
+
+    return f"{FILTER_CACHE_PREFIX}_{kind}_{scope_hash}"
+
+
+def get_cached_filter_value(
+    list_filter: ListFilter,
+    request: HttpRequest,
+    model_admin: ModelAdmin,
+    field_path: str,
+    kind: str,
+    compute: Callable[[], Any],
+    params: tuple = (),
+) -> Any:
+    """
+    Returns the value computed by the filter, cached for `cache_timeout`
+    seconds of the filter class. Without the timeout, nothing is cached.
+    Values are cached only when changes of all models they are computed from
+    invalidate them, see get_cached_filter_models(). Params tell apart values
+    of the same kind, like pages of choices.
+    """
+    timeout: Optional[int] = getattr(list_filter, "cache_timeout", None)
+
+    if timeout is None:
+        return compute()
+
+    if not get_cached_filter_models().issuperset(
+        get_filter_models(model_admin.model, field_path)
+    ):
+        return compute()
+
+    cache_key = get_filter_cache_key(
+        list_filter, request, model_admin, field_path, kind, params
+    )
+    value = cache.get(cache_key)
+
+    if value is None:
+        # Wrapped so None computed by the filter is cached as well
+        value = (compute(),)
+        cache.set(cache_key, value, timeout)
+
+    return value[0]
+
+
+@watch_models
+def get_cached_filter_models() -> frozenset[type[Model]]:
+    """
+    Models watched for changes which invalidate cached filter values: the
+    model of every registered admin with a caching filter and the models on
+    the way to the filtered field. Filters are read from the list_filter
+    attribute, as get_list_filter needs a request. Filters returned only by
+    an overridden get_list_filter are therefore not cached.
+    """
+    models = set()
+
+    for site in all_sites:
+        for model, model_admin in site._registry.items():
+            for list_filter in model_admin.list_filter:
+                if isinstance(list_filter, (tuple, list)):
+                    field_path, filter_class = list_filter[0], list_filter[1]
+                else:
+                    # Simple list filters are cached under their parameter
+                    field_path = getattr(list_filter, "parameter_name", None) or ""
+                    filter_class = list_filter
+
+                if getattr(filter_class, "cache_timeout", None) is None:
+                    continue
+
+                models.update(get_filter_models(model, field_path))
+
+    return frozenset(models)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_filter_cache(sender: type[Model], **kwargs: Any) -> None:
+    if sender._meta.concrete_model in get_cached_filter_models():
+        cache.delete(get_filter_cache_version_key(sender))
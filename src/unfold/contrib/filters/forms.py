@@ -98,6 +98,9 @@ class CheckboxForm(forms.Form):
             widget=self.widget,
         )
 
+    class Media:
+        js = ("unfold/filters/js/admin-lazy-choices.js",)
+
 
 class RadioForm(CheckboxForm):
     field = ChoiceField
@@ -160,6 +163,33 @@ class DropdownForm(forms.Form):
         }
 
 
+class LazyDropdownForm(DropdownForm):
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        choices: tuple,
+        url: str,
+        multiple: bool = False,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(name, label, choices, multiple, *args, **kwargs)
+
+        # Select2 loads the choices from the url while searching or scrolling
+        self.fields[name].widget.attrs.update(
+            {
+                "class": "admin-autocomplete",
+                "data-ajax--url": url,
+                "data-ajax--cache": "true",
+                "data-ajax--delay": 250,
+                "data-ajax--type": "GET",
+                "data-allow-clear": "true",
+                "data-placeholder": "",
+            }
+        )
+
+
 class SingleNumericForm(forms.Form):
     def __init__(self, name: str, *args, **kwargs) -> None:
         self.name = name
@@ -404,5 +404,12 @@
     };
 
     window.addEventListener('load', DateTimeShortcuts.init);
+
+    // Deferred filter sheets are loaded after the page
+    document.addEventListener('htmx:load', function(event) {
+        if (event.target !== document.body && event.target.querySelector('.vCustomDateField, .vCustomTimeField')) {
+            DateTimeShortcuts.init();
+        }
+    });
     window.DateTimeShortcuts = DateTimeShortcuts;
 }
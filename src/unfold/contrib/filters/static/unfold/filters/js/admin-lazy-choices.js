@@ -0,0 +1,106 @@
+"use strict";
+{
+  const SEARCH_DELAY = 250;
+
+  const getList = (container) => {
+    return container.querySelector(`#${CSS.escape(`id_${container.dataset.name}`)}`);
+  };
+
+  const loadChoices = (container, page) => {
+    const url = new URL(container.dataset.url, window.location.href);
+    const requestId = (Number(container.dataset.requestId) || 0) + 1;
+
+    url.searchParams.set("term", container.querySelector(".lazy-choices-search").value);
+    url.searchParams.set("page", page);
+    container.dataset.requestId = requestId;
+
+    return fetch(url, { headers: { Accept: "application/json" } })
+      .then((response) => response.json())
+      .then((data) => {
+        // Responses to outdated searches are dropped
+        if (Number(container.dataset.requestId) !== requestId) {
+          return;
+        }
+
+        renderChoices(container, data, page);
+      });
+  };
+
+  const renderChoices = (container, data, page) => {
+    const list = getList(container);
+    const template = container.querySelector(".lazy-choices-option");
+
+    if (page === 1) {
+      // Checked choices stay, so they are still submitted with the filters
+      list.querySelectorAll("input:not(:checked)").forEach((input) => {
+        input.closest("label").parentElement.remove();
+      });
+    }
+
+    const rendered = new Set(
+      Array.from(list.querySelectorAll("input")).map((input) => input.value)
+    );
+
+    data.results.forEach((result) => {
+      if (rendered.has(result.id)) {
+        return;
+      }
+
+      const option = template.content.cloneNode(true);
+      option.querySelector("input").value = result.id;
+      option.querySelector("span").textContent = result.text;
+      list.appendChild(option);
+    });
+
+    container.dataset.page = page;
+    container
+      .querySelector(".lazy-choices-more")
+      .classList.toggle("hidden", !data.pagination.more);
+  };
+
+  const initLazyChoices = (container) => {
+    if (container.dataset.initialized) {
+      return;
+    }
+
+    container.dataset.initialized = true;
+
+    const search = container.querySelector(".lazy-choices-search");
+    const more = container.querySelector(".lazy-choices-more");
+    let timeout = null;
+
+    search.addEventListener("input", () => {
+      clearTimeout(timeout);
+      timeout = setTimeout(() => loadChoices(container, 1), SEARCH_DELAY);
+    });
+
+    // Enter in the search would submit the filters
+    search.addEventListener("keydown", (event) => {
+      if (event.key === "Enter") {
+        event.preventDefault();
+      }
+    });
+
+    more.addEventListener("click", () => {
+      loadChoices(container, Number(container.dataset.page) + 1);
+    });
+
+    // Next page is loaded once the button is scrolled into view
+    new IntersectionObserver((entries) => {
+      entries.forEach((entry) => {
+        if (entry.isIntersecting && !more.classList.contains("hidden")) {
+          more.click();
+        }
+      });
+    }).observe(more);
+  };
+
+  document.addEventListener("DOMContentLoaded", () => {
+    document.querySelectorAll(".lazy-choices").forEach(initLazyChoices);
+  });
+
+  // Deferred filter sheets are loaded after the page
+  document.addEventListener("htmx:load", (event) => {
+    event.target.querySelectorAll(".lazy-choices").forEach(initLazyChoices);
+  });
+}
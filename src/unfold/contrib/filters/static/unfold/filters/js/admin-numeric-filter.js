@@ -1,4 +1,4 @@
-document.addEventListener('DOMContentLoaded', function() {
+function initNumericFilterSliders() {
     Array.from(document.getElementsByClassName('admin-numeric-filter-slider')).forEach(function(slider) {
         if (Array.from(slider.classList).includes("noUi-target")) {
             return;
@@ -32,4 +32,9 @@ document.addEventListener('DOMContentLoaded', function() {
             to.value = values[1];
         });
     });
-});
+}
+
+document.addEventListener('DOMContentLoaded', initNumericFilterSliders);
+
+// Deferred filter sheets are loaded after the page
+document.addEventListener('htmx:load', initNumericFilterSliders);
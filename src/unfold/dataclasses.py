@@ -1,5 +1,6 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Callable, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from unfold.enums import ActionVariant
 
@@ -39,3 +40,19 @@ class DropdownItem:
     title: str
     link: Union[str, Callable]
     icon: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class NavigationItem:
+    data: Mapping[str, Any]
+    link: Any
+    active: Any = None
+    permission: Union[str, Callable, None] = None
+    badge: Optional[Callable] = None
+    items: tuple["NavigationItem", ...] = ()
+
+
+@dataclass(frozen=True)
+class NavigationGroup:
+    data: Mapping[str, Any]
+    items: tuple[NavigationItem, ...] = ()
@@ -1,5 +1,5 @@
 from collections.abc import Generator
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from django import forms
 from django.contrib.admin.forms import (
@@ -8,6 +8,7 @@ from django.contrib.admin.forms import (
 from django.contrib.admin.forms import (
     AdminPasswordChangeForm as BaseAdminOwnPasswordChangeForm,
 )
+from django.contrib.admin.views.main import PAGE_VAR
 from django.contrib.auth.forms import (
     AdminPasswordChangeForm as BaseAdminPasswordChangeForm,
 )
@@ -19,6 +20,7 @@ from django.forms import BaseInlineFormSet
 from django.http import HttpRequest
 
 from unfold.fields import UnfoldAdminField, UnfoldAdminReadonlyField
+from unfold.paginator import CURSOR_VAR, KeysetPaginator
 
 try:
     from django.contrib.auth.forms import AdminUserCreationForm as BaseUserCreationForm
@@ -195,27 +197,42 @@ class PaginationFormSetMixin:
     queryset: Optional[QuerySet] = None
     request: Optional[HttpRequest] = None
     per_page: Optional[int] = None
+    paginator_class: type[Paginator] = Paginator
 
     def __init__(
         self,
         request: Optional[HttpRequest] = None,
         per_page: Optional[int] = None,
         *args,
+        paginator_class: Optional[type[Paginator]] = None,
         **kwargs,
     ):
         self.request = request
         self.per_page = per_page
 
+        if paginator_class is not None:
+            self.paginator_class = paginator_class
+
         super().__init__(*args, **kwargs)
 
         if self.per_page:
-            self.paginator = Paginator(self.queryset, self.per_page)
-            self.page = self.get_page(self.paginator, self.get_page_num())
+            self.paginator = self.paginator_class(self.queryset, self.per_page)
+
+            if isinstance(self.paginator, KeysetPaginator):
+                self.page = self.paginator.get_keyset_page(
+                    self.get_cursor(), self.get_page_num()
+                )
+            else:
+                self.page = self.get_page(self.paginator, self.get_page_num())
+
             self._queryset = self.page.object_list
 
     def get_pagination_key(self) -> str:
         return f"{self.prefix}-page"
 
+    def get_cursor_key(self) -> str:
+        return f"{self.prefix}-{CURSOR_VAR}"
+
     def get_page_num(self) -> int:
         page = self.request.GET.get(self.get_pagination_key())
         if page and page.isnumeric() and page > "0":
@@ -227,6 +244,21 @@ class PaginationFormSetMixin:
 
         return 1
 
+    def get_cursor(self) -> Optional[str]:
+        return self.request.GET.get(self.get_cursor_key()) or self.request.POST.get(
+            self.get_cursor_key()
+        )
+
+    def get_page_params(self, params: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Parameters of a keyset page prefixed for this formset. Orderings which
+        can't be continued by values are paginated by page numbers instead of
+        cursors.
+        """
+        keys = {CURSOR_VAR: self.get_cursor_key(), PAGE_VAR: self.get_pagination_key()}
+
+        return {keys[key]: value for key, value in (params or {}).items()}
+
     def get_page(self, paginator: Paginator, page: int) -> Page:
         if page <= paginator.num_pages:
             return paginator.page(page)
@@ -0,0 +1,114 @@
+from collections.abc import Iterable
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from django.http import HttpRequest
+
+MATCH_CACHE_SIZE = 1024
+
+
+class LinkIndex:
+    """
+    Prefix tree of configured link paths. All indexed links which are active
+    for the current path are found with a single walk over the path.
+    """
+
+    def __init__(self, index_path: str, links: Iterable[Any] = ()) -> None:
+        self.index_path = index_path
+        self.root = {}
+        self.links = {}
+        self.matches = {}
+
+        for link in links:
+            self.add(link)
+
+    def add(self, link: Any) -> None:
+        link = str(link)
+
+        if link in self.links:
+            return
+
+        # Local references stay valid while other threads clear shared dicts
+        parsed = self.parse(link)
+        self.links[link] = parsed
+        link_path = parsed[0]
+
+        if not link_path.startswith("/"):
+            return
+
+        node = self.root
+
+        for char in link_path:
+            node = node.setdefault(char, {})
+
+        # Empty string never appears as a path character so it marks the end of a link
+        node[""] = True
+        self.matches.clear()
+
+    def parse(self, link: str) -> tuple[str, dict[str, list[str]]]:
+        parsed = urlparse(link)
+        return parsed.path, parse_qs(parsed.query)
+
+    def match(self, path: str) -> frozenset[str]:
+        """
+        Returns all indexed link paths which are prefixes of the path.
+        """
+        cached = self.matches.get(path)
+
+        if cached is not None:
+            return cached
+
+        matches = []
+        node = self.root
+
+        for position, char in enumerate(path):
+            node = node.get(char)
+
+            if node is None:
+                break
+
+            if "" in node:
+                matches.append(path[: position + 1])
+
+        if len(self.matches) >= MATCH_CACHE_SIZE:
+            self.matches.clear()
+
+        result = frozenset(matches)
+        self.matches[path] = result
+
+        return result
+
+    def is_active(self, request: HttpRequest, link: Any, is_tab: bool = False) -> bool:
+        link = str(link)
+
+        if link in self.links:
+            link_path, query_params = self.links[link]
+            is_indexed = True
+        else:
+            link_path, query_params = self.parse(link)
+            is_indexed = False
+
+        # Dashboard
+        if link_path == request.path == self.index_path:
+            return True
+
+        if link_path in ("", self.index_path):
+            return False
+
+        if not link_path.startswith("/"):
+            is_matching = link_path in request.path
+        elif is_indexed:
+            is_matching = link_path in self.match(request.path)
+        else:
+            is_matching = request.path.startswith(link_path)
+
+        if not is_matching:
+            return False
+
+        # In case of tabs, we need to check if the query params are the same
+        if is_tab and query_params:
+            request_params = parse_qs(request.GET.urlencode())
+
+            return all(request_params.get(k) == v for k, v in query_params.items())
+
+        return True
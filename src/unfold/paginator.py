@@ -1,21 +1,449 @@
-from django.core.paginator import Page, Paginator
+import base64
+import binascii
+import datetime
+import json
+from functools import reduce
+from operator import or_
+from typing import Any, Optional
+
+from django.contrib.admin.utils import NotRelationField, get_fields_from_path
+from django.contrib.admin.views.main import PAGE_VAR
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connections, transaction
+from django.db.models import F, OrderBy, Q, QuerySet
 from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+CURSOR_VAR = "cursor"
+
+CURSOR_NEXT = "next"
+CURSOR_PREVIOUS = "previous"
 
 
 class InfinitePage(Page):
-    def has_next(self):
-        if len(self.object_list) == 0:
-            return False
+    def __init__(
+        self,
+        object_list: Any,
+        number: int,
+        paginator: Paginator,
+        has_next: bool = False,
+    ) -> None:
+        super().__init__(object_list, number, paginator)
 
-        return self.number < self.paginator.num_pages
+        self._has_next = has_next
+
+    def has_next(self) -> bool:
+        return self._has_next
 
 
 class InfinitePaginator(Paginator):
+    """
+    Fetches one row more than fits on the page to find out if there is a next
+    page, so the number of rows is never counted.
+    """
+
     template_name = "unfold/helpers/pagination_infinite.html"
 
     @cached_property
     def count(self):
+        # Only keeps page numbers valid, pages never depend on it
         return 9_999_999_999
 
-    def _get_page(self, *args, **kwargs):
-        return InfinitePage(*args, **kwargs)
+    def get_elided_page_range(self, *args: Any, **kwargs: Any) -> list:
+        return []
+
+    def page(self, number: Any) -> InfinitePage:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        rows = list(self.object_list[bottom : top + 1])
+
+        if isinstance(self.object_list, QuerySet):
+            # Page keeps a queryset, e.g. for list_editable formsets, without
+            # running the query again for the rows already fetched
+            object_list = self.object_list[bottom:top]
+            object_list._result_cache = rows[: self.per_page]
+            object_list._prefetch_done = True
+        else:
+            object_list = rows[: self.per_page]
+
+        return InfinitePage(object_list, number, self, len(rows) > self.per_page)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Uses row estimates of the database planner instead of counting the rows
+    when there are at least `estimate_threshold` of them. Smaller results and
+    backends without estimates are counted exactly.
+    """
+
+    estimate_threshold = 100_000
+
+    @cached_property
+    def estimate(self) -> Optional[int]:
+        return self.get_estimate()
+
+    @property
+    def is_estimated(self) -> bool:
+        return self.estimate is not None and self.estimate >= self.estimate_threshold
+
+    @cached_property
+    def count(self) -> int:
+        if self.is_estimated:
+            return self.estimate
+
+        return super().count
+
+    def validate_number(self, number: Any) -> int:
+        if not self.is_estimated:
+            return super().validate_number(number)
+
+        # Estimate can be lower than the real count so the last pages stay valid
+        try:
+            number = int(number)
+        except (TypeError, ValueError) as e:
+            raise PageNotAnInteger(_("That page number is not an integer")) from e
+
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+
+        return number
+
+    def page(self, number: Any) -> Page:
+        if not self.is_estimated:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
+
+    def get_estimate(self) -> Optional[int]:
+        if not isinstance(self.object_list, QuerySet):
+            return None
+
+        query = self.object_list.query
+        connection = connections[self.object_list.db]
+        is_filtered = bool(
+            query.where
+            or query.distinct
+            or query.combinator
+            or query.group_by
+            or query.is_sliced
+        )
+
+        try:
+            # Failed query must not break the transaction of the request
+            with transaction.atomic(using=self.object_list.db):
+                with connection.cursor() as cursor:
+                    if is_filtered:
+                        estimate = self.get_query_estimate(connection, cursor)
+                    else:
+                        estimate = self.get_table_estimate(connection, cursor)
+        except DatabaseError:
+            return None
+
+        return int(estimate) if estimate is not None and estimate >= 0 else None
+
+    def get_table_estimate(self, connection: Any, cursor: Any) -> Optional[float]:
+        """
+        Number of rows in the table kept by statistics of the database.
+        """
+        db_table = self.object_list.model._meta.db_table
+
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+                [connection.ops.quote_name(db_table)],
+            )
+        elif connection.vendor == "mysql":
+            cursor.execute(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s",
+                [db_table],
+            )
+        elif connection.vendor == "sqlite":
+            # Filled by ANALYZE, first number of the statistics is row count
+            cursor.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = %s ORDER BY idx IS NULL",
+                [db_table],
+            )
+            row = cursor.fetchone()
+            return float(row[0].split()[0]) if row else None
+        else:
+            return None
+
+        row = cursor.fetchone()
+
+        # Tables which were never analyzed have negative or missing statistics
+        return float(row[0]) if row and row[0] is not None else None
+
+    def get_query_estimate(self, connection: Any, cursor: Any) -> Optional[float]:
+        """
+        Number of rows which the planner expects the query to return.
+        """
+        sql, params = self.object_list.order_by().query.sql_with_params()
+
+        if connection.vendor == "postgresql":
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            return float(plan[0]["Plan"]["Plan Rows"])
+
+        if connection.vendor == "mysql":
+            cursor.execute(f"EXPLAIN {sql}", params)
+            columns = [column[0].lower() for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+            # Estimates of joined tables multiply, only single table is reliable
+            if len(rows) != 1 or rows[0].get("rows") is None:
+                return None
+
+            return float(rows[0]["rows"]) * float(rows[0].get("filtered") or 100) / 100
+
+        return None
+
+
+class KeysetPage(Page):
+    def __init__(
+        self,
+        object_list: list[Any],
+        number: int,
+        paginator: Paginator,
+        next_params: Optional[dict[str, Any]] = None,
+        previous_params: Optional[dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(object_list, number, paginator)
+
+        self.next_params = next_params
+        self.previous_params = previous_params
+
+    def has_next(self) -> bool:
+        return self.next_params is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_params is not None
+
+
+class KeysetPaginator(Paginator):
+    """
+    Continues after the ordering values of the last displayed row instead of
+    skipping rows by OFFSET, so deep pages cost the same as the first one.
+    Primary key is added to the ordering as a tiebreak and nothing is counted.
+    Orderings which can't be compared by values, like nullable fields or
+    expressions, are paginated by page numbers without counting instead.
+    """
+
+    template_name = "unfold/helpers/pagination_keyset.html"
+
+    def get_elided_page_range(self, *args: Any, **kwargs: Any) -> list:
+        return []
+
+    @cached_property
+    def keyset(self) -> Optional[tuple[tuple[str, bool, Any], ...]]:
+        """
+        Field paths of the ordering together with direction and model field.
+        """
+        model = self.object_list.model
+        ordering = self.object_list.query.order_by or model._meta.ordering
+        keyset = []
+
+        for item in ordering:
+            if isinstance(item, str) and item != "?":
+                name, descending = item.lstrip("-+"), item.startswith("-")
+            elif isinstance(item, OrderBy) and isinstance(item.expression, F):
+                name, descending = item.expression.name, item.descending
+            else:
+                return None
+
+            if name == "pk":
+                name = model._meta.pk.name
+
+            try:
+                fields = get_fields_from_path(model, name)
+            except (FieldDoesNotExist, NotRelationField):
+                return None
+
+            # Relations are ordered by the ordering of the related model and
+            # nulls can't be compared by values
+            if fields[-1].is_relation or any(field.null for field in fields):
+                return None
+
+            keyset.append((name, descending, fields[-1]))
+
+        if model._meta.pk.name not in [name for name, _descending, _field in keyset]:
+            keyset.append((model._meta.pk.name, False, model._meta.pk))
+
+        return tuple(keyset)
+
+    def get_ordering(self, reverse: bool = False) -> list[str]:
+        return [
+            f"-{name}" if descending != reverse else name
+            for name, descending, _field in self.keyset
+        ]
+
+    def encode_cursor(self, direction: str, values: tuple[Any, ...]) -> str:
+        # DjangoJSONEncoder drops microseconds below milliseconds, which would
+        # continue from a different row than the last displayed one
+        values = [
+            value.isoformat()
+            if isinstance(value, (datetime.date, datetime.time))
+            else value
+            for value in values
+        ]
+        data = json.dumps(
+            [direction, self.get_ordering(), values], cls=DjangoJSONEncoder
+        )
+
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: Optional[str]) -> tuple[Optional[str], list[Any]]:
+        if not cursor:
+            return None, []
+
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            direction, ordering, values = json.loads(data)
+        except (binascii.Error, ValueError, TypeError):
+            return None, []
+
+        # Cursors created for a different ordering start from the beginning
+        if ordering != self.get_ordering() or len(values) != len(self.keyset):
+            return None, []
+
+        try:
+            values = [
+                field.to_python(value)
+                for (_name, _descending, field), value in zip(self.keyset, values)
+            ]
+        except ValidationError:
+            return None, []
+
+        return direction, values
+
+    def get_keyset_filter(self, values: list[Any], reverse: bool = False) -> Q:
+        """
+        Rows after the values in the ordering: (a > x) OR (a = x AND b > y)...
+        """
+        conditions = []
+
+        for i, (name, descending, _field) in enumerate(self.keyset):
+            lookup = "lt" if descending != reverse else "gt"
+            condition = Q(**{f"{name}__{lookup}": values[i]})
+
+            for j, (previous_name, _descending, _field) in enumerate(self.keyset[:i]):
+                condition &= Q(**{previous_name: values[j]})
+
+            conditions.append(condition)
+
+        return reduce(or_, conditions)
+
+    def get_keys(
+        self, values: Optional[list[Any]] = None, reverse: bool = False
+    ) -> list[tuple[Any, ...]]:
+        """
+        Ordering values of at most one row more than fits on the page. Only
+        the ordered columns are selected so the query can be answered from an
+        index, full rows are loaded afterwards by primary key.
+        """
+        queryset = self.object_list
+
+        if values is not None:
+            queryset = queryset.filter(self.get_keyset_filter(values, reverse))
+
+        return list(
+            queryset.order_by(*self.get_ordering(reverse)).values_list(
+                *[name for name, _descending, _field in self.keyset]
+            )[: self.per_page + 1]
+        )
+
+    def get_keyset_page(self, cursor: Optional[str], number: int = 1) -> KeysetPage:
+        if self.keyset is None:
+            return self.get_offset_page(number)
+
+        direction, values = self.decode_cursor(cursor)
+        previous_params = None
+
+        if direction == CURSOR_PREVIOUS:
+            keys = self.get_keys(values, reverse=True)
+
+            if len(keys) > self.per_page:
+                keys = keys[: self.per_page][::-1]
+
+                return self.get_page_from_keys(
+                    keys,
+                    next_params={CURSOR_VAR: self.encode_cursor(CURSOR_NEXT, keys[-1])},
+                    previous_params={
+                        CURSOR_VAR: self.encode_cursor(CURSOR_PREVIOUS, keys[0])
+                    },
+                )
+
+            # Nothing more before, so the first page is displayed in full
+            keys = self.get_keys()
+        elif direction == CURSOR_NEXT:
+            keys = self.get_keys(values)
+            previous_params = (
+                {CURSOR_VAR: self.encode_cursor(CURSOR_PREVIOUS, keys[0])}
+                if keys
+                else {}
+            )
+        else:
+            keys = self.get_keys()
+
+        next_params = None
+
+        if len(keys) > self.per_page:
+            keys = keys[: self.per_page]
+            next_params = {CURSOR_VAR: self.encode_cursor(CURSOR_NEXT, keys[-1])}
+
+        return self.get_page_from_keys(keys, next_params, previous_params)
+
+    def get_page_from_keys(
+        self,
+        keys: list[tuple[Any, ...]],
+        next_params: Optional[dict[str, Any]] = None,
+        previous_params: Optional[dict[str, Any]] = None,
+    ) -> KeysetPage:
+        pk_index = [name for name, _descending, _field in self.keyset].index(
+            self.object_list.model._meta.pk.name
+        )
+        object_list = self.object_list.filter(
+            pk__in=[key[pk_index] for key in keys]
+        ).order_by(*self.get_ordering())
+
+        return KeysetPage(object_list, 1, self, next_params, previous_params)
+
+    def get_offset_page(self, number: int) -> KeysetPage:
+        """
+        Page numbers without counting, for orderings which can't be continued
+        by values. One row more is fetched to know if there is a next page.
+        """
+        offset = (number - 1) * self.per_page
+        pks = list(
+            self.object_list.values_list("pk", flat=True)[
+                offset : offset + self.per_page + 1
+            ]
+        )
+        next_params = previous_params = None
+
+        if len(pks) > self.per_page:
+            pks = pks[: self.per_page]
+            next_params = {PAGE_VAR: number + 1}
+
+        if number > 1:
+            previous_params = {PAGE_VAR: number - 1}
+
+        return KeysetPage(
+            self.object_list.filter(pk__in=pks),
+            number,
+            self,
+            next_params,
+            previous_params,
+        )
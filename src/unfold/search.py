@@ -0,0 +1,443 @@
+import hashlib
+import sqlite3
+import threading
+import uuid
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any, Optional
+
+from django.apps import apps
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import translation
+from django.utils.module_loading import import_string
+from django.utils.text import capfirst
+
+from unfold.settings import get_config
+from unfold.utils import get_search_key
+
+DEFAULT_SEARCH_INDEX_BACKEND = "unfold.search.SQLiteSearchIndex"
+
+# Trigram tokenizer matches substrings of at least three characters
+TRIGRAM_LENGTH = 3
+
+# Number of records read from the database and inserted at once while indexing
+BUILD_CHUNK_SIZE = 2000
+
+_search_index = None
+
+
+class BaseSearchIndex:
+    """
+    Search index behind the command palette. App and model names are indexed
+    for all installed models, records only for the configured models.
+    """
+
+    def __init__(self, models: Iterable[str] = (), **options: Any) -> None:
+        self.models = frozenset(label.lower() for label in models)
+        self.options = options
+
+    def is_indexed(self, model: type[Model]) -> bool:
+        return model._meta.label_lower in self.models
+
+    def search_models(self, search_term: str) -> list[str]:
+        """
+        Returns labels of models which app or model name contains the search
+        term, in the active language.
+        """
+        raise NotImplementedError
+
+    def search_records(
+        self,
+        model: type[Model],
+        search_term: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[tuple[Any, str]]:
+        """
+        Returns primary keys and titles of the model records which title
+        contains all words of the search term, in a stable order so results
+        can be read page by page.
+        """
+        raise NotImplementedError
+
+    def update_record(self, instance: Model) -> None:
+        raise NotImplementedError
+
+    def delete_record(self, model: type[Model], pk: Any) -> None:
+        raise NotImplementedError
+
+    def get_model_names(self) -> Iterable[tuple[str, str, str]]:
+        for model in apps.get_models():
+            yield (
+                model._meta.label_lower,
+                str(model._meta.app_config.verbose_name),
+                str(capfirst(model._meta.verbose_name_plural)),
+            )
+
+
+class SQLiteSearchIndex(BaseSearchIndex):
+    """
+    Search index stored in a local SQLite FTS5 table, in memory by default.
+    Names are indexed once per language and set of installed models, records
+    once per model, on first use. Afterwards, records are kept up to date by
+    model signals. Folded search keys are stored next to the titles so
+    differently written Arabic terms are matched by a single index lookup.
+
+    Records of a model are read from the database without holding the lock
+    shared by all searches, so indexing a large table blocks only searches of
+    the same model. Read records are staged under a label of their own and
+    published in a single transaction together with the changes saved while
+    the model was not indexed yet, so no update is lost. All writes run in
+    immediate transactions, so processes sharing one index file index every
+    model only once.
+    """
+
+    def __init__(
+        self, models: Iterable[str] = (), path: str = ":memory:", **options: Any
+    ) -> None:
+        super().__init__(models, **options)
+
+        self.lock = threading.Lock()
+        self.build_locks: dict[str, threading.Lock] = {}
+        self.names_keys: dict[str, str] = {}
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self.tokenizer = self.get_tokenizer()
+
+        with self.write():
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS unfold_search_built (key TEXT PRIMARY KEY)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS unfold_search_changes ("
+                "label TEXT, pk TEXT, title TEXT, key TEXT, PRIMARY KEY (label, pk))"
+            )
+            self.connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS unfold_search_names USING fts5("
+                f"language UNINDEXED, label UNINDEXED, app_key, model_key, tokenize='{self.tokenizer}')"
+            )
+            self.connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS unfold_search_records USING fts5("
+                f"label UNINDEXED, pk UNINDEXED, title UNINDEXED, key, tokenize='{self.tokenizer}')"
+            )
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self.lock:
+            # Takes the write lock of the database file right away, so other
+            # processes cannot interleave between checks and writes
+            self.connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                yield
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+            self.connection.execute("COMMIT")
+
+    def get_tokenizer(self) -> str:
+        try:
+            self.connection.execute(
+                "CREATE VIRTUAL TABLE temp.t USING fts5(a, tokenize='trigram')"
+            )
+            self.connection.execute("DROP TABLE temp.t")
+        except sqlite3.OperationalError:
+            # SQLite older than 3.34 matches word prefixes instead of substrings
+            return "unicode61 remove_diacritics 2"
+
+        return "trigram"
+
+    def is_built(self, key: str) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM unfold_search_built WHERE key = ?", (key,)
+            ).fetchone()
+            is not None
+        )
+
+    def build_names(self, language: str) -> str:
+        """
+        Indexes names in the language and returns the value of the language
+        column they are stored under. Names are versioned by the installed
+        models, so added or renamed models are indexed again while processes
+        still running the previous models keep reading their own names.
+        """
+        if language in self.names_keys:
+            return self.names_keys[language]
+
+        names = sorted(self.get_model_names())
+        version = hashlib.md5(repr(names).encode(), usedforsecurity=False).hexdigest()
+        names_key = f"{language}:{version}"
+        key = f"names:{names_key}"
+
+        with self.write():
+            if not self.is_built(key):
+                self.connection.executemany(
+                    "INSERT INTO unfold_search_names VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            names_key,
+                            label,
+                            get_search_key(app_name),
+                            get_search_key(model_name),
+                        )
+                        for label, app_name, model_name in names
+                    ],
+                )
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO unfold_search_built VALUES (?)", (key,)
+                )
+
+        self.names_keys[language] = names_key
+
+        return names_key
+
+    def build_records(self, model: type[Model]) -> None:
+        label = model._meta.label_lower
+        key = f"records:{label}"
+
+        with self.lock:
+            if self.is_built(key):
+                return
+
+            build_lock = self.build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self.lock:
+                # Built by another thread while waiting for the build lock
+                if self.is_built(key):
+                    return
+
+            staging_label = f"{label}#{uuid.uuid4().hex}"
+            records = []
+
+            for instance in model._default_manager.all().iterator(
+                chunk_size=BUILD_CHUNK_SIZE
+            ):
+                records.append((staging_label, *self.get_record(instance)[1:]))
+
+                if len(records) >= BUILD_CHUNK_SIZE:
+                    self.insert_records(records)
+                    records = []
+
+            self.insert_records(records)
+            self.publish_records(label, staging_label, key)
+
+    def insert_records(self, records: list[tuple[str, str, str, str]]) -> None:
+        with self.write():
+            self.connection.executemany(
+                "INSERT INTO unfold_search_records VALUES (?, ?, ?, ?)", records
+            )
+
+    def publish_records(self, label: str, staging_label: str, key: str) -> None:
+        with self.write():
+            if self.is_built(key):
+                # Published by another process in the meantime
+                self.connection.execute(
+                    "DELETE FROM unfold_search_records WHERE label = ?",
+                    (staging_label,),
+                )
+                return
+
+            # Removes records of unfinished builds as well
+            self.connection.execute(
+                "DELETE FROM unfold_search_records WHERE label = ? "
+                "OR substr(label, 1, ?) = ? AND label != ?",
+                (label, len(label) + 1, f"{label}#", staging_label),
+            )
+            self.connection.execute(
+                "UPDATE unfold_search_records SET label = ? WHERE label = ?",
+                (label, staging_label),
+            )
+
+            # Changes saved while the records were read
+            changes = self.connection.execute(
+                "SELECT pk, title, key FROM unfold_search_changes WHERE label = ?",
+                (label,),
+            ).fetchall()
+
+            for pk, title, search_key in changes:
+                self.write_record(
+                    label, pk, None if title is None else (title, search_key)
+                )
+
+            self.connection.execute(
+                "DELETE FROM unfold_search_changes WHERE label = ?", (label,)
+            )
+            self.connection.execute(
+                "INSERT OR IGNORE INTO unfold_search_built VALUES (?)", (key,)
+            )
+
+    def write_record(
+        self, label: str, pk: str, values: Optional[tuple[str, str]]
+    ) -> None:
+        self.connection.execute(
+            "DELETE FROM unfold_search_records WHERE label = ? AND pk = ?",
+            (label, pk),
+        )
+
+        if values is not None:
+            self.connection.execute(
+                "INSERT INTO unfold_search_records VALUES (?, ?, ?, ?)",
+                (label, pk, *values),
+            )
+
+    def save_record(
+        self, label: str, pk: str, values: Optional[tuple[str, str]]
+    ) -> None:
+        """
+        Stores the title and search key of a record, or removes the record
+        when values are None.
+        """
+        with self.write():
+            if self.is_built(f"records:{label}"):
+                self.write_record(label, pk, values)
+            else:
+                # Applied once the model is indexed, the build may have read
+                # the record before it changed
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO unfold_search_changes VALUES (?, ?, ?, ?)",
+                    (label, pk, *(values or (None, None))),
+                )
+
+    def get_record(self, instance: Model) -> tuple[str, str, str, str]:
+        title = str(instance)
+
+        return (
+            instance._meta.label_lower,
+            str(instance.pk),
+            title,
+            get_search_key(title),
+        )
+
+    def get_match_clause(
+        self, column: str, search_term: str, words: bool = True
+    ) -> tuple[str, list[str]]:
+        conditions = []
+        params = []
+
+        search_key = get_search_key(search_term)
+
+        for word in search_key.split() if words else [search_key]:
+            if self.tokenizer == "trigram" and len(word) < TRIGRAM_LENGTH:
+                # Too short for trigrams, scanned with LIKE instead
+                conditions.append(f"{column} LIKE ? ESCAPE '\\'")
+                escaped = (
+                    word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                )
+                params.append(f"%{escaped}%")
+            else:
+                conditions.append(f"{column} MATCH ?")
+                phrase = '"{}"'.format(word.replace('"', '""'))
+                params.append(phrase if self.tokenizer == "trigram" else f"{phrase}*")
+
+        return " AND ".join(conditions) or "1", params
+
+    def search_models(self, search_term: str) -> list[str]:
+        language = translation.get_language() or ""
+        app_clause, app_params = self.get_match_clause(
+            "app_key", search_term, words=False
+        )
+        model_clause, model_params = self.get_match_clause(
+            "model_key", search_term, words=False
+        )
+
+        names_key = self.build_names(language)
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT label FROM unfold_search_names WHERE language = ? "
+                f"AND (({app_clause}) OR ({model_clause}))",
+                [names_key, *app_params, *model_params],
+            ).fetchall()
+
+        return [label for (label,) in rows]
+
+    def search_records(
+        self,
+        model: type[Model],
+        search_term: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[tuple[Any, str]]:
+        clause, params = self.get_match_clause("key", search_term)
+        query = (
+            "SELECT pk, title FROM unfold_search_records "
+            f"WHERE label = ? AND {clause} ORDER BY rowid"
+        )
+        params = [model._meta.label_lower, *params]
+
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        elif offset:
+            query += " LIMIT -1 OFFSET ?"
+            params.append(offset)
+
+        self.build_records(model)
+
+        with self.lock:
+            rows = self.connection.execute(query, params).fetchall()
+
+        return [(model._meta.pk.to_python(pk), title) for pk, title in rows]
+
+    def update_record(self, instance: Model) -> None:
+        label, pk, title, search_key = self.get_record(instance)
+        self.save_record(label, pk, (title, search_key))
+
+    def delete_record(self, model: type[Model], pk: Any) -> None:
+        self.save_record(model._meta.label_lower, str(pk), None)
+
+
+def get_search_index() -> Optional[BaseSearchIndex]:
+    """
+    Returns the configured search index or None when it is disabled. The index
+    is created only once and recreated when the configuration changes.
+    """
+    global _search_index
+
+    config = get_config()["COMMAND"].get("search_index")
+
+    if not config:
+        return None
+
+    if _search_index is not None and _search_index[0] is config:
+        return _search_index[1]
+
+    options = dict(config) if isinstance(config, Mapping) else {}
+    backend = import_string(options.pop("backend", DEFAULT_SEARCH_INDEX_BACKEND))
+    _search_index = (config, backend(**options))
+
+    return _search_index[1]
+
+
+@receiver(setting_changed)
+def reset_search_index(setting: str, **kwargs: Any) -> None:
+    global _search_index
+
+    if setting == "UNFOLD":
+        _search_index = None
+
+
+@receiver(post_save)
+def update_search_index(sender: type[Model], instance: Model, **kwargs: Any) -> None:
+    search_index = get_search_index()
+
+    if search_index is not None and search_index.is_indexed(sender):
+        transaction.on_commit(lambda: search_index.update_record(instance))
+
+
+@receiver(post_delete)
+def delete_search_index(sender: type[Model], instance: Model, **kwargs: Any) -> None:
+    search_index = get_search_index()
+
+    if search_index is not None and search_index.is_indexed(sender):
+        # Primary key is cleared on the instance once the deletion is done
+        pk = instance.pk
+        transaction.on_commit(lambda: search_index.delete_record(sender, pk))
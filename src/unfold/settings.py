@@ -1,6 +1,10 @@
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Optional
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 CONFIG_DEFAULTS = {
     "SITE_TITLE": None,
@@ -66,6 +70,14 @@ CONFIG_DEFAULTS = {
     },
     "COMMAND": {
         "search_models": False,  # Enable search in the models
+        "search_models_limit": 10,  # Maximum number of records per model
+        "search_results_limit": 50,  # Maximum number of records in total
+        "search_time_budget": 2,  # Seconds after which other models are skipped
+        "search_concurrency": None,  # Number of threads searching models at once
+        "search_cache_timeout": 10,  # Seconds to cache search results, 0 disables it
+        "search_cache_scope": "user",  # Share cached records per "user" or "permissions"
+        "search_index": None,  # Prebuilt search index, True or backend options
+        "navigation_index": False,  # Filter apps and models in the browser
         "show_history": False,  # Enable history in the command search
         "search_callback": None,  # Inject a custom callback to the search form
     },
@@ -73,6 +85,7 @@ CONFIG_DEFAULTS = {
         "show_search": False,
         "command_search": False,
         "show_all_applications": False,
+        "cache_permissions": False,  # Share permission results between same users
         "navigation": [],
     },
     "TABS": [],
@@ -84,23 +97,60 @@ CONFIG_DEFAULTS = {
 }
 
 
-def get_config(settings_name=None):
+_config_cache: dict[str, Mapping[str, Any]] = {}
+
+
+def merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
+    result = dict1.copy()
+
+    for key, value in dict2.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = merge_dicts(result[key], value)
+        else:
+            result[key] = value
+
+    return result
+
+
+def freeze_dict(value: dict[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType({key: freeze_value(item) for key, item in value.items()})
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Dictionaries become read-only mappings and lists become tuples, at any
+    depth, so items of the shared configuration cannot be changed in place.
+    """
+    if isinstance(value, dict):
+        return freeze_dict(value)
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+
+    return value
+
+
+def get_config(settings_name: Optional[str] = None) -> Mapping[str, Any]:
+    """
+    Returns read-only configuration merged with defaults. The result is computed
+    only once per settings name and reset when the setting changes.
+    """
     if settings_name is None:
         settings_name = "UNFOLD"
 
-    def merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
-        result = dict1.copy()
+    try:
+        return _config_cache[settings_name]
+    except KeyError:
+        pass
+
+    config = freeze_dict(
+        merge_dicts(CONFIG_DEFAULTS, getattr(settings, settings_name, {}))
+    )
+    _config_cache[settings_name] = config
 
-        for key, value in dict2.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = merge_dicts(result[key], value)
-            else:
-                result[key] = value
+    return config
 
-        return result
 
-    return merge_dicts(CONFIG_DEFAULTS, getattr(settings, settings_name, {}))
+@receiver(setting_changed)
+def reset_config(setting: str, **kwargs: Any) -> None:
+    _config_cache.pop(setting, None)
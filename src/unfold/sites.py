@@ -1,20 +1,45 @@
-import copy
+import hashlib
+import json
+import threading
 import time
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import Any, Callable, Optional, Union
-from urllib.parse import parse_qs, urlparse
 
-from django.contrib.admin import AdminSite
+from django.apps import apps as django_apps
+from django.contrib.admin import AdminSite, ModelAdmin
 from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import EMPTY_VALUES
-from django.http import HttpRequest, HttpResponse
+from django.db import connections
+from django.db.models import Field, Model, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+    JsonResponse,
+)
 from django.template.response import TemplateResponse
-from django.urls import URLPattern, path, reverse, reverse_lazy
+from django.urls import NoReverseMatch, URLPattern, path, reverse, reverse_lazy
+from django.utils import translation
+from django.utils.cache import patch_cache_control
 from django.utils.functional import lazy
+from django.utils.http import parse_etags, quote_etag
 from django.utils.module_loading import import_string
-from django.utils.text import slugify
-
-from unfold.dataclasses import DropdownItem, Favicon, SearchResult
+from django.utils.text import capfirst
+
+from unfold.dataclasses import (
+    DropdownItem,
+    Favicon,
+    NavigationGroup,
+    NavigationItem,
+    SearchResult,
+)
 
 try:
     from django.contrib.auth.decorators import login_not_required
@@ -24,8 +49,10 @@ except ImportError:
         return func
 
 
+from unfold.navigation import LinkIndex
+from unfold.search import BaseSearchIndex, get_search_index
 from unfold.settings import get_config
-from unfold.utils import hex_to_rgb
+from unfold.utils import get_search_key, hex_to_rgb
 from unfold.widgets import (
     BUTTON_CLASSES,
     CHECKBOX_CLASSES,
@@ -35,6 +62,16 @@ from unfold.widgets import (
     SWITCH_CLASSES,
 )
 
+NAVIGATION_PERMISSIONS_CACHE_SIZE = 1024
+
+SEARCH_CHUNK_SIZE = 2000
+
+NARROWABLE_LOOKUPS = ("contains", "icontains", "startswith", "istartswith")
+
+# Names of apps and models depend only on permissions, everything else may come
+# from querysets which differ between users with the same permissions
+SHARED_SEARCH_CACHE_KINDS = ("apps",)
+
 
 class UnfoldAdminSite(AdminSite):
     default_site = "unfold.admin.UnfoldAdminSite"
@@ -45,6 +82,11 @@ class UnfoldAdminSite(AdminSite):
 
         super().__init__(name)
 
+        self._compiled_navigation = None
+        self._link_index = None
+        self._search_cache_stats = Counter()
+        self._search_cache_lock = threading.Lock()
+
         if self.login_form is None:
             self.login_form = AuthenticationForm
 
@@ -57,6 +99,11 @@ class UnfoldAdminSite(AdminSite):
         urlpatterns = (
             [
                 path("search/", self.admin_view(self.search), name="search"),
+                path(
+                    "search/navigation/",
+                    self.admin_view(self.navigation_index),
+                    name="navigation_index",
+                ),
                 path(
                     "toggle-sidebar/",
                     self.admin_view(self.toggle_sidebar),
@@ -69,7 +116,25 @@ class UnfoldAdminSite(AdminSite):
 
         return urlpatterns
 
-    def each_context(self, request: HttpRequest) -> dict[str, Any]:
+    def each_context(
+        self, request: HttpRequest, refresh: bool = False
+    ) -> dict[str, Any]:
+        """
+        Context is computed once per request and user. Repeated calls within the
+        same request return a copy of the stored result unless refresh is set.
+        """
+        cached = request.__dict__.setdefault("_unfold_each_context", {})
+        cache_key = (self.name, getattr(request.user, "pk", None))
+
+        if not refresh and cache_key in cached:
+            return {**cached[cache_key]}
+
+        context = self._build_each_context(request)
+        cached[cache_key] = context
+
+        return {**context}
+
+    def _build_each_context(self, request: HttpRequest) -> dict[str, Any]:
         context = super().each_context(request)
 
         sidebar_config = self._get_config("SIDEBAR", request)
@@ -118,6 +183,9 @@ class UnfoldAdminSite(AdminSite):
             "command_show_history": self._get_config("COMMAND", request).get(
                 "show_history"
             ),
+            "command_navigation_index": self._get_config("COMMAND", request).get(
+                "navigation_index"
+            ),
             "sidebar_command_search": self._get_config("SIDEBAR", request).get(
                 "command_search"
             ),
@@ -174,21 +242,126 @@ class UnfoldAdminSite(AdminSite):
 
         return HttpResponse(status=HTTPStatus.OK)
 
+    def navigation_index(
+        self, request: HttpRequest, extra_context: Optional[dict[str, Any]] = None
+    ) -> HttpResponse:
+        """
+        Apps, models and sidebar items visible to the user, filtered in the
+        browser instead of searching them on the server on every keystroke. The
+        version changes with the content so unchanged indexes are revalidated
+        by ETag without sending them again.
+        """
+        timeout = self._get_config("COMMAND", request).get("search_cache_timeout")
+        cache_key = self._get_search_cache_key(request, "navigation", "")
+        cached = cache.get(cache_key) if timeout else None
+
+        if cached is None:
+            items = self._get_navigation_index(request)
+            version = hashlib.sha256(
+                json.dumps(items, cls=DjangoJSONEncoder).encode()
+            ).hexdigest()[:16]
+            cached = (version, items)
+
+            if timeout:
+                cache.set(cache_key, cached, timeout=timeout)
+
+        version, items = cached
+        etag = quote_etag(version)
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = JsonResponse({"version": version, "items": items})
+
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return response
+
+    def _get_navigation_index(self, request: HttpRequest) -> list[dict[str, Any]]:
+        navigation, permissions_cache = self._get_compiled_navigation(request)
+        permissions = iter(
+            self._get_navigation_permissions(request, navigation, permissions_cache)
+        )
+        items = []
+
+        for group in navigation:
+            items.extend(
+                self._get_navigation_index_items(
+                    group.items, permissions, group.data.get("title")
+                )
+            )
+
+        # Searching for an empty term returns all models from the app list
+        for result in self._search_apps(super().get_app_list(request), ""):
+            items.append(
+                {
+                    "title": str(result.title),
+                    "description": str(result.description),
+                    "link": str(result.link or ""),
+                    "icon": result.icon,
+                }
+            )
+
+        links = set()
+        results = []
+
+        for item in items:
+            if item["link"] and item["link"] not in links:
+                links.add(item["link"])
+                # Browsers match the folded search term against this key
+                item["key"] = "\n".join(
+                    [get_search_key(item["title"]), get_search_key(item["description"])]
+                )
+                results.append(item)
+
+        return results
+
+    def _get_navigation_index_items(
+        self,
+        items: tuple[NavigationItem, ...],
+        permissions: Iterator[bool],
+        description: Optional[str],
+    ) -> Iterator[dict[str, Any]]:
+        # Permissions are consumed in the same order as in _get_navigation_items
+        for item in items:
+            has_permission = next(permissions)
+            nested = list(
+                self._get_navigation_index_items(
+                    item.items, permissions, item.data.get("title")
+                )
+            )
+
+            if not has_permission:
+                continue
+
+            # Links from callbacks depend on the request and are not indexed
+            if not callable(item.link):
+                yield {
+                    "title": str(item.data.get("title", "")),
+                    "description": str(description or ""),
+                    "link": str(item.link or ""),
+                    "icon": item.data.get("icon"),
+                }
+
+            yield from nested
+
     def _search_apps(
         self, app_list: list[dict[str, Any]], search_term: str
     ) -> list[SearchResult]:
         results = []
         apps = []
+        search_key = get_search_key(search_term)
 
         for app in app_list:
-            if search_term in app["name"].lower():
+            if search_key in get_search_key(app["name"]):
                 apps.append(app)
                 continue
 
             models = []
 
             for model in app["models"]:
-                if search_term in model["name"].lower():
+                if search_key in get_search_key(model["name"]):
                     models.append(model)
 
             if len(models) > 0:
@@ -211,86 +384,367 @@ class UnfoldAdminSite(AdminSite):
     def _search_models(
         self, request: HttpRequest, app_list: list[dict[str, Any]], search_term: str
     ) -> list[SearchResult]:
-        results = []
+        found = sorted(
+            self._iter_search_models(request, app_list, search_term),
+            key=lambda position_results: position_results[0],
+        )
+        results = [
+            result for _position, model_results in found for result in model_results
+        ]
+        results.sort(key=lambda result: self._get_search_rank(result, search_term))
+
+        return results[
+            : self._get_config("COMMAND", request).get("search_results_limit")
+        ]
 
+    def _iter_search_models(
+        self, request: HttpRequest, app_list: list[dict[str, Any]], search_term: str
+    ) -> Iterator[tuple[int, list[SearchResult]]]:
+        """
+        Yields results of every searched model together with the position of
+        the model, as soon as the model is searched. Searching stops once the
+        results limit is reached or the time budget is spent.
+        """
+        command_config = self._get_config("COMMAND", request)
+        results_limit = command_config.get("search_results_limit")
+        concurrency = command_config.get("search_concurrency")
+        admin_instances = list(self._get_searchable_admins(request, app_list))
+        args = (search_term, command_config.get("search_models_limit"))
+
+        if concurrency:
+            found = self._iter_search_models_concurrently(
+                request,
+                admin_instances,
+                *args,
+                command_config.get("search_time_budget"),
+                concurrency,
+            )
+        else:
+            found = self._iter_search_models_sequentially(
+                request,
+                admin_instances,
+                *args,
+                command_config.get("search_time_budget"),
+            )
+
+        total = 0
+
+        try:
+            for position, model_results in found:
+                yield position, model_results
+
+                total += len(model_results)
+
+                if results_limit is not None and total >= results_limit:
+                    break
+        finally:
+            found.close()
+
+    def _iter_search_models_sequentially(
+        self,
+        request: HttpRequest,
+        admin_instances: list[ModelAdmin],
+        search_term: str,
+        limit: Optional[int],
+        time_budget: Optional[float],
+    ) -> Iterator[tuple[int, list[SearchResult]]]:
+        start_time = time.monotonic()
+
+        for position, admin_instance in enumerate(admin_instances):
+            yield (
+                position,
+                self._search_model(request, admin_instance, search_term, limit),
+            )
+
+            # Remaining models are skipped once the time budget is spent
+            if time_budget is not None and time.monotonic() - start_time > time_budget:
+                break
+
+    def _iter_search_models_concurrently(
+        self,
+        request: HttpRequest,
+        admin_instances: list[ModelAdmin],
+        search_term: str,
+        limit: Optional[int],
+        timeout: Optional[float],
+        concurrency: int,
+    ) -> Iterator[tuple[int, list[SearchResult]]]:
+        """
+        Searches models in a bounded thread pool and yields results in the
+        order the searches finish. Models which did not finish within the
+        timeout are dropped.
+        """
+        if not admin_instances:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(admin_instances)),
+            thread_name_prefix="unfold_search",
+        )
+        language = translation.get_language()
+        futures = {
+            executor.submit(
+                self._search_model_in_thread,
+                language,
+                request,
+                admin_instance,
+                search_term,
+                limit,
+            ): position
+            for position, admin_instance in enumerate(admin_instances)
+        }
+
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                yield futures[future], future.result()
+        except FuturesTimeoutError:
+            pass
+        finally:
+            # Running searches are not interrupted, their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_model_in_thread(
+        self, language: Optional[str], *args: Any
+    ) -> list[SearchResult]:
+        try:
+            with translation.override(language):
+                return self._search_model(*args)
+        finally:
+            # Database connections are per thread so they have to be closed here
+            connections.close_all()
+
+    def _get_searchable_admins(
+        self, request: HttpRequest, app_list: list[dict[str, Any]]
+    ) -> Iterator[ModelAdmin]:
         for app in app_list:
             for model in app["models"]:
                 admin_instance = self._registry.get(model["model"])
-                search_fields = admin_instance.get_search_fields(request)
 
-                if not search_fields:
-                    continue
+                if admin_instance.get_search_fields(request):
+                    yield admin_instance
 
-                pks = []
+    def _search_model(
+        self,
+        request: HttpRequest,
+        admin_instance: ModelAdmin,
+        search_term: str,
+        limit: Optional[int] = None,
+    ) -> list[SearchResult]:
+        opts = admin_instance.model._meta
+        cache_kind = f"model_{opts.label_lower}_{limit}"
+        qs = admin_instance.get_queryset(request)
+        cached_term, cached = self._get_search_cache(
+            request,
+            cache_kind,
+            search_term,
+            prefixes=self._is_search_narrowable(request, admin_instance, search_term),
+        )
 
-                qs = admin_instance.get_queryset(request)
-                search_results, _has_duplicates = admin_instance.get_search_results(
-                    request, qs, search_term
-                )
+        if cached_term == search_term:
+            self._count_search_cache("hits")
+            return cached["results"]
 
-                for item in search_results:
-                    if item.pk in pks:
-                        continue
+        if cached is not None and cached["complete"]:
+            # All records matching the longer search term are among the
+            # records matching its prefix so only these are searched again
+            self._count_search_cache("narrowed")
+            qs = qs.filter(pk__in=cached["pks"])
+        else:
+            self._count_search_cache("misses")
 
-                    pks.append(item.pk)
+        search_index = get_search_index()
 
-                    link = reverse_lazy(
-                        f"{self.name}:{admin_instance.model._meta.app_label}_{admin_instance.model._meta.model_name}_change",
-                        args=(item.pk,),
-                    )
+        if search_index is not None and search_index.is_indexed(admin_instance.model):
+            pks, titles = self._search_model_index(
+                search_index, qs, admin_instance.model, search_term, limit
+            )
+        else:
+            pks = self._search_model_pks(
+                request, admin_instance, qs, search_term, limit
+            )
+            objects = qs.filter(pk__in=pks) if pks else []
+            titles = {item.pk: str(item) for item in objects}
 
-                    results.append(
-                        SearchResult(
-                            title=str(item),
-                            description=f"{item._meta.app_label.capitalize()} - {item._meta.verbose_name.capitalize()}",
-                            link=link,
-                            icon="data_object",
-                        )
-                    )
+        results = []
+
+        for pk in pks:
+            if pk not in titles:
+                continue
+
+            link = reverse_lazy(
+                f"{self.name}:{opts.app_label}_{opts.model_name}_change",
+                args=(pk,),
+            )
+
+            results.append(
+                SearchResult(
+                    title=titles[pk],
+                    description=f"{opts.app_label.capitalize()} - {opts.verbose_name.capitalize()}",
+                    link=link,
+                    icon="data_object",
+                )
+            )
+
+        self._set_search_cache(
+            request,
+            cache_kind,
+            search_term,
+            {
+                "results": results,
+                "pks": pks,
+                "complete": limit is None or len(pks) < limit,
+            },
+        )
 
         return results
 
+    def _search_model_pks(
+        self,
+        request: HttpRequest,
+        admin_instance: ModelAdmin,
+        qs: QuerySet,
+        search_term: str,
+        limit: Optional[int] = None,
+    ) -> list[Any]:
+        search_results, _has_duplicates = admin_instance.get_search_results(
+            request, qs, search_term
+        )
+
+        # Only primary keys are read while scanning matches, full rows are
+        # loaded just for the records which are displayed
+        pks = []
+        seen = set()
+
+        for pk in search_results.values_list("pk", flat=True).iterator(
+            chunk_size=limit or SEARCH_CHUNK_SIZE
+        ):
+            if pk in seen:
+                continue
+
+            seen.add(pk)
+            pks.append(pk)
+
+            if limit is not None and len(pks) >= limit:
+                break
+
+        return pks
+
+    def _search_model_index(
+        self,
+        search_index: BaseSearchIndex,
+        qs: QuerySet,
+        model: type[Model],
+        search_term: str,
+        limit: Optional[int] = None,
+    ) -> tuple[list[Any], dict[Any, str]]:
+        titles = {}
+        pks = []
+        offset = 0
+        page_size = limit or SEARCH_CHUNK_SIZE
+
+        # Records found in the index are shown only when the user can see them
+        # in the admin queryset, so the index is read page by page until enough
+        # visible records are found
+        while limit is None or len(pks) < limit:
+            chunk = dict(
+                search_index.search_records(
+                    model, search_term, limit=page_size, offset=offset
+                )
+            )
+
+            if not chunk:
+                break
+
+            titles.update(chunk)
+            visible = set(qs.filter(pk__in=list(chunk)).values_list("pk", flat=True))
+            pks.extend(pk for pk in chunk if pk in visible)
+            offset += page_size
+
+            if len(chunk) < page_size:
+                break
+
+        return pks[:limit], titles
+
+    def _is_search_narrowable(
+        self, request: HttpRequest, admin_instance: ModelAdmin, search_term: str
+    ) -> bool:
+        """
+        Results can be narrowed down from a shorter search term only when every
+        search field matches substrings or prefixes of the search term. Quoted
+        phrases are split differently while being typed, so their prefixes are
+        not searched the same way. Overridden get_search_results may match
+        records differently, so it has to be declared narrowable by the admin.
+        """
+        if '"' in search_term or "'" in search_term:
+            return False
+
+        get_search_results = type(admin_instance).get_search_results
+
+        if get_search_results is not ModelAdmin.get_search_results and not getattr(
+            admin_instance, "search_narrowable", False
+        ):
+            return False
+
+        for field_name in admin_instance.get_search_fields(request):
+            if field_name.startswith(("=", "@")):
+                return False
+
+            lookup = field_name.rsplit(LOOKUP_SEP, 1)[-1]
+
+            if lookup in Field.get_lookups() and lookup not in NARROWABLE_LOOKUPS:
+                return False
+
+        return True
+
+    def _get_search_rank(self, result: SearchResult, search_term: str) -> int:
+        title = get_search_key(result.title)
+        search_term = get_search_key(search_term)
+
+        if title == search_term:
+            return 0
+
+        if title.startswith(search_term):
+            return 1
+
+        if search_term in title:
+            return 2
+
+        return 3
+
     def search(
         self, request: HttpRequest, extra_context: Optional[dict[str, Any]] = None
     ) -> TemplateResponse:
         start_time = time.time()
 
-        CACHE_TIMEOUT = 10
-
         search_term = request.GET.get("s")
         extended_search = "extended" in request.GET
-        app_list = super().get_app_list(request)
         template_name = "unfold/helpers/search_results.html"
 
         if search_term in EMPTY_VALUES:
             return HttpResponse()
 
         search_term = search_term.lower()
-        cache_key = f"unfold_search_{request.user.pk}_{slugify(search_term)}"
-        cache_results = cache.get(cache_key)
+        command_config = self._get_config("COMMAND", request)
 
         if extended_search:
             template_name = "unfold/helpers/command_results.html"
 
-        if cache_results:
-            results = cache_results
-        else:
-            results = self._search_apps(app_list, search_term)
-            search_models = self._get_config("COMMAND", request).get("search_models")
-            search_callback = self._get_config("COMMAND", request).get(
-                "search_callback"
-            )
+        results = self._search_apps_cached(request, search_term)
 
-            if extended_search:
-                if search_callback:
-                    results.extend(
-                        self._get_value(search_callback, request, search_term)
-                    )
+        if extended_search:
+            search_callback = command_config.get("search_callback")
 
-                if search_models is True:
-                    results.extend(self._search_models(request, app_list, search_term))
+            if search_callback:
+                results.extend(
+                    self._search_callback_cached(request, search_callback, search_term)
+                )
 
-            cache.set(cache_key, results, timeout=CACHE_TIMEOUT)
+            if command_config.get("search_models") is True:
+                results.extend(
+                    self._search_models(
+                        request, super().get_app_list(request), search_term
+                    )
+                )
 
         execution_time = time.time() - start_time
 
@@ -300,15 +754,207 @@ class UnfoldAdminSite(AdminSite):
             context={
                 "results": results,
                 "execution_time": execution_time,
-                "command_show_history": self._get_config("COMMAND", request).get(
-                    "show_history"
-                ),
+                "command_show_history": command_config.get("show_history"),
             },
             headers={
                 "HX-Trigger": "search",
             },
         )
 
+    def _search_apps_cached(
+        self, request: HttpRequest, search_term: str
+    ) -> list[SearchResult]:
+        cached_term, cached = self._get_search_cache(
+            request, "apps", search_term, prefixes=True
+        )
+
+        if cached_term == search_term:
+            self._count_search_cache("hits")
+            return cached
+
+        if cached is not None:
+            # Apps and models matching the longer search term are always among
+            # the results of its prefix, matching on the same names
+            self._count_search_cache("narrowed")
+            search_key = get_search_key(search_term)
+            results = [
+                result
+                for result in cached
+                if search_key in get_search_key(result.title)
+                or search_key in get_search_key(result.description)
+            ]
+        else:
+            self._count_search_cache("misses")
+            search_index = get_search_index()
+
+            if search_index is not None:
+                results = self._search_apps_index(request, search_index, search_term)
+            else:
+                results = self._search_apps(super().get_app_list(request), search_term)
+
+        self._set_search_cache(request, "apps", search_term, results)
+
+        return results
+
+    def _search_apps_index(
+        self, request: HttpRequest, search_index: BaseSearchIndex, search_term: str
+    ) -> list[SearchResult]:
+        """
+        Same results as searching the app list, but only models found in the
+        search index are checked for permissions.
+        """
+        results = []
+
+        for label in search_index.search_models(search_term):
+            model = django_apps.get_model(label)
+            model_admin = self._registry.get(model)
+
+            if model_admin is None or not model_admin.has_module_permission(request):
+                continue
+
+            perms = model_admin.get_model_perms(request)
+
+            if True not in perms.values():
+                continue
+
+            admin_url = None
+
+            if perms.get("change") or perms.get("view"):
+                try:
+                    admin_url = reverse(
+                        f"admin:{model._meta.app_label}_{model._meta.model_name}_changelist",
+                        current_app=self.name,
+                    )
+                except NoReverseMatch:
+                    pass
+
+            results.append(
+                SearchResult(
+                    title=str(capfirst(model._meta.verbose_name_plural)),
+                    description=model._meta.app_config.verbose_name,
+                    link=admin_url,
+                    icon="tag",
+                )
+            )
+
+        results.sort(
+            key=lambda result: (str(result.description).lower(), result.title.lower())
+        )
+
+        return results
+
+    def _search_callback_cached(
+        self, request: HttpRequest, search_callback: Any, search_term: str
+    ) -> list[SearchResult]:
+        cached_term, cached = self._get_search_cache(request, "callback", search_term)
+
+        if cached_term == search_term:
+            self._count_search_cache("hits")
+            return cached
+
+        self._count_search_cache("misses")
+        results = list(self._get_value(search_callback, request, search_term))
+        self._set_search_cache(request, "callback", search_term, results)
+
+        return results
+
+    def _get_search_cache(
+        self,
+        request: HttpRequest,
+        kind: str,
+        search_term: str,
+        prefixes: bool = False,
+    ) -> tuple[Optional[str], Any]:
+        """
+        Returns the cached search term together with its cached value. When
+        prefixes are allowed and the search term itself is not cached, the
+        value of its longest cached prefix is returned instead.
+        """
+        if not self._get_config("COMMAND", request).get("search_cache_timeout"):
+            return None, None
+
+        terms = [search_term]
+
+        if prefixes:
+            terms.extend(search_term[:i] for i in range(len(search_term) - 1, 0, -1))
+
+        keys = {self._get_search_cache_key(request, kind, term): term for term in terms}
+        values = cache.get_many(list(keys))
+
+        for key, term in keys.items():
+            if key in values:
+                return term, values[key]
+
+        return None, None
+
+    def _set_search_cache(
+        self, request: HttpRequest, kind: str, search_term: str, value: Any
+    ) -> None:
+        timeout = self._get_config("COMMAND", request).get("search_cache_timeout")
+
+        if timeout:
+            cache.set(
+                self._get_search_cache_key(request, kind, search_term),
+                value,
+                timeout=timeout,
+            )
+
+    def _get_search_cache_key(
+        self, request: HttpRequest, kind: str, search_term: str
+    ) -> str:
+        term_hash = hashlib.sha256(search_term.encode()).hexdigest()[:32]
+        scope = self._get_search_cache_scope(request)
+
+        if kind == "navigation":
+            # Sidebar permission callbacks may depend on more than permissions
+            shared = self._get_config("SIDEBAR", request).get("cache_permissions")
+        else:
+            shared = (
+                kind in SHARED_SEARCH_CACHE_KINDS
+                or self._get_config("COMMAND", request).get("search_cache_scope")
+                == "permissions"
+            )
+
+        if not shared:
+            scope = f"{scope}_{request.user.pk}"
+
+        return f"unfold_search_{scope}_{kind}_{term_hash}"
+
+    def _get_search_cache_scope(self, request: HttpRequest) -> str:
+        """
+        Users with the same permissions see the same apps and models, so their
+        cached results are shared between them.
+        """
+        if "_unfold_search_cache_scope" not in request.__dict__:
+            is_active, is_staff, is_superuser, permissions = (
+                self._get_permission_cache_key(request)
+            )
+            scope = [
+                self.name,
+                translation.get_language(),
+                is_active,
+                is_staff,
+                is_superuser,
+                sorted(permissions),
+            ]
+            request.__dict__["_unfold_search_cache_scope"] = hashlib.sha256(
+                repr(scope).encode()
+            ).hexdigest()[:32]
+
+        return request.__dict__["_unfold_search_cache_scope"]
+
+    def _count_search_cache(self, outcome: str) -> None:
+        with self._search_cache_lock:
+            self._search_cache_stats[outcome] += 1
+
+    def get_search_cache_stats(self) -> dict[str, int]:
+        with self._search_cache_lock:
+            return {
+                "hits": self._search_cache_stats["hits"],
+                "narrowed": self._search_cache_stats["narrowed"],
+                "misses": self._search_cache_stats["misses"],
+            }
+
     def password_change(
         self, request: HttpRequest, extra_context: Optional[dict[str, Any]] = None
     ) -> HttpResponse:
@@ -328,65 +974,178 @@ class UnfoldAdminSite(AdminSite):
         return PasswordChangeView.as_view(**defaults)(request)
 
     def get_sidebar_list(self, request: HttpRequest) -> list[dict[str, Any]]:
-        navigation = self._get_value(
-            self._get_config("SIDEBAR", request).get("navigation"), request
+        navigation, permissions_cache = self._get_compiled_navigation(request)
+        permissions = iter(
+            self._get_navigation_permissions(request, navigation, permissions_cache)
         )
-        tabs = self._get_value(self._get_config("TABS", request), request) or []
         results = []
 
-        for group in copy.deepcopy(navigation):
-            group["items"] = self._get_navigation_items(request, group["items"], tabs)
-            results.append(group)
+        for group in navigation:
+            results.append(
+                {
+                    **group.data,
+                    "items": self._get_navigation_items(
+                        request, group.items, permissions
+                    ),
+                }
+            )
 
         return results
 
-    def _get_navigation_items(
-        self, request: HttpRequest, items: list[dict], tabs: list[dict] = None
-    ) -> list:
-        allowed_items = []
+    def _get_compiled_navigation(
+        self, request: HttpRequest
+    ) -> tuple[tuple[NavigationGroup, ...], Optional[dict]]:
+        """
+        Navigation defined directly in settings is compiled only once and reused
+        until the settings change. Navigation returned by a callback is compiled
+        on every request and its permissions are never cached.
+        """
+        sidebar = get_config(self.settings_name)["SIDEBAR"]
+        navigation = sidebar.get("navigation") if isinstance(sidebar, Mapping) else None
+
+        if not isinstance(navigation, (list, tuple)):
+            navigation = self._get_value(
+                self._get_config("SIDEBAR", request).get("navigation"), request
+            )
+            return self._compile_navigation(navigation or []), None
+
+        if (
+            self._compiled_navigation is None
+            or self._compiled_navigation[0] is not navigation
+        ):
+            self._compiled_navigation = (
+                navigation,
+                self._compile_navigation(navigation),
+                {},
+            )
+
+        if not sidebar.get("cache_permissions"):
+            return self._compiled_navigation[1], None
+
+        return self._compiled_navigation[1], self._compiled_navigation[2]
+
+    def _compile_navigation(
+        self, navigation: list[dict[str, Any]]
+    ) -> tuple[NavigationGroup, ...]:
+        return tuple(
+            NavigationGroup(
+                data=MappingProxyType(
+                    {key: value for key, value in group.items() if key != "items"}
+                ),
+                items=self._compile_navigation_items(group["items"]),
+            )
+            for group in navigation
+        )
+
+    def _compile_navigation_items(
+        self, items: list[dict[str, Any]]
+    ) -> tuple[NavigationItem, ...]:
+        compiled = []
 
         for item in items:
-            link = item.get("link")
+            badge = None
 
-            if "active" in item:
-                item["active"] = self._get_value(item["active"], request)
-            else:
-                item["active"] = self._get_is_active(
-                    request, item.get("link_callback") or link
+            if "badge" in item and isinstance(item["badge"], str):
+                try:
+                    badge = import_string(item["badge"])
+                except ImportError:
+                    pass
+
+            compiled.append(
+                NavigationItem(
+                    data=MappingProxyType(dict(item)),
+                    link=item.get("link"),
+                    active=self._import_callback(item.get("active")),
+                    permission=self._import_callback(item.get("permission")),
+                    badge=badge,
+                    items=self._compile_navigation_items(item.get("items", [])),
                 )
+            )
+
+        return tuple(compiled)
+
+    def _get_navigation_permissions(
+        self,
+        request: HttpRequest,
+        navigation: tuple[NavigationGroup, ...],
+        cache: Optional[dict] = None,
+    ) -> tuple[bool, ...]:
+        """
+        Permission flags of all navigation items in depth-first order. When the
+        cache is provided, flags are shared between users with the same set of
+        permissions.
+        """
+
+        def walk(items: tuple[NavigationItem, ...]) -> Iterator[bool]:
+            for item in items:
+                yield self._call_permission_callback(item.permission, request)
+                yield from walk(item.items)
+
+        if cache is None:
+            return tuple(flag for group in navigation for flag in walk(group.items))
+
+        cache_key = self._get_permission_cache_key(request)
+
+        if cache_key not in cache:
+            if len(cache) >= NAVIGATION_PERMISSIONS_CACHE_SIZE:
+                cache.clear()
+
+            cache[cache_key] = tuple(
+                flag for group in navigation for flag in walk(group.items)
+            )
 
-            # Checks if any tab item is active and then marks the sidebar link as active
-            if (
-                tabs
-                and self._get_is_tab_active(request, tabs, link)
-                and "active" not in item
-            ):
-                item["active"] = True
+        return cache[cache_key]
+
+    def _get_permission_cache_key(self, request: HttpRequest) -> tuple:
+        user = request.user
+
+        return (
+            user.is_active,
+            user.is_staff,
+            user.is_superuser,
+            frozenset() if user.is_superuser else frozenset(user.get_all_permissions()),
+        )
+
+    def _get_navigation_items(
+        self,
+        request: HttpRequest,
+        items: tuple[NavigationItem, ...],
+        permissions: Iterator[bool],
+    ) -> list:
+        results = []
+
+        for item in items:
+            result = {**item.data}
 
             # Link callback
-            if isinstance(link, Callable):
-                item["link_callback"] = lazy(link)(request)
+            if isinstance(item.link, Callable):
+                result["link_callback"] = lazy(item.link)(request)
+
+            if "active" in item.data:
+                result["active"] = (
+                    item.active(request) if callable(item.active) else item.active
+                )
+            else:
+                result["active"] = self._get_is_active(
+                    request, result.get("link_callback") or item.link
+                )
 
             # Permission callback
-            item["has_permission"] = self._call_permission_callback(
-                item.get("permission"), request
-            )
+            result["has_permission"] = next(permissions)
 
             # Badge callbacks
-            if "badge" in item and isinstance(item["badge"], str):
-                try:
-                    callback = import_string(item["badge"])
-                    item["badge_callback"] = lazy(callback)(request)
-                except ImportError:
-                    pass
+            if item.badge is not None:
+                result["badge_callback"] = lazy(item.badge)(request)
 
             # Process nested items
-            if "items" in item:
-                item["items"] = self._get_navigation_items(request, item["items"])
+            if "items" in item.data:
+                result["items"] = self._get_navigation_items(
+                    request, item.items, permissions
+                )
 
-            allowed_items.append(item)
+            results.append(result)
 
-        return allowed_items
+        return results
 
     def _get_account_links(self, request: HttpRequest) -> list[dict[str, Any]]:
         links = []
@@ -406,11 +1165,14 @@ class UnfoldAdminSite(AdminSite):
         return links
 
     def get_tabs_list(self, request: HttpRequest) -> list[dict[str, Any]]:
-        tabs = copy.deepcopy(self._get_config("TABS", request))
+        tabs = self._get_config("TABS", request)
 
         if not tabs:
             return []
 
+        # Settings are read-only, tabs and their items are annotated on copies
+        tabs = [{**tab, "items": [dict(item) for item in tab["items"]]} for tab in tabs]
+
         for tab in tabs:
             allowed_items = []
 
@@ -454,6 +1216,15 @@ class UnfoldAdminSite(AdminSite):
 
         return False
 
+    def _import_callback(self, value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                return import_string(value)
+            except ImportError:
+                pass
+
+        return value
+
     def _replace_values(self, target: dict, source: dict, request: HttpRequest):
         for key in source.keys():
             if source[key] is not None and callable(source[key]):
@@ -466,52 +1237,48 @@ class UnfoldAdminSite(AdminSite):
     def _get_is_active(
         self, request: HttpRequest, link: Union[str, Callable], is_tab: bool = False
     ) -> bool:
-        if not isinstance(link, str):
-            link = str(link)
-
-        index_path = reverse_lazy(f"{self.name}:index")
-        link_path = urlparse(link).path
+        return self._get_link_index().is_active(request, link, is_tab)
 
-        # Dashboard
-        if link_path == request.path == index_path:
-            return True
+    def _get_link_index(self) -> LinkIndex:
+        """
+        Links from static SIDEBAR and TABS settings are indexed only once and the
+        index is rebuilt when the settings change.
+        """
+        config = get_config(self.settings_name)
 
-        if link_path != "" and link_path in request.path and link_path != index_path:
-            query_params = parse_qs(urlparse(link).query)
-            request_params = parse_qs(request.GET.urlencode())
+        if self._link_index is None or self._link_index[0] is not config:
+            self._link_index = (
+                config,
+                LinkIndex(
+                    str(reverse_lazy(f"{self.name}:index")),
+                    self._get_static_links(config),
+                ),
+            )
 
-            # In case of tabs, we need to check if the query params are the same
-            if is_tab and not all(
-                request_params.get(k) == v for k, v in query_params.items()
-            ):
-                return False
+        return self._link_index[1]
 
-            return True
+    def _get_static_links(self, config: Mapping[str, Any]) -> list[Any]:
+        links = []
 
-        return False
+        def collect(items: list[dict]) -> None:
+            for item in items:
+                if item.get("link") is not None and not callable(item["link"]):
+                    links.append(item["link"])
 
-    def _get_is_tab_active(
-        self, request: HttpRequest, tabs: list[dict], link: str
-    ) -> bool:
-        for tab in tabs:
-            has_primary_link = False
-            has_tab_link_active = False
+                collect(item.get("items", []))
 
-            for tab_item in tab["items"]:
-                if link == tab_item["link"]:
-                    has_primary_link = True
-                    continue
+        sidebar = config["SIDEBAR"]
+        navigation = sidebar.get("navigation") if isinstance(sidebar, Mapping) else None
 
-                if self._get_is_active(
-                    request, tab_item.get("link_callback") or tab_item["link"]
-                ):
-                    has_tab_link_active = True
-                    continue
+        if isinstance(navigation, (list, tuple)):
+            for group in navigation:
+                collect(group["items"])
 
-            if has_primary_link and has_tab_link_active:
-                return True
+        if isinstance(config["TABS"], (list, tuple)):
+            for tab in config["TABS"]:
+                collect(tab["items"])
 
-        return False
+        return links
 
     def _get_config(self, key: str, *args) -> Any:
         config = get_config(self.settings_name)
@@ -524,7 +1291,7 @@ class UnfoldAdminSite(AdminSite):
     ) -> Union[dict[str, str], str, None]:
         images = self._get_config(key, *args)
 
-        if isinstance(images, dict):
+        if isinstance(images, Mapping):
             if "light" in images and "dark" in images:
                 return {
                     "light": self._get_value(images["light"], *args),
@@ -551,27 +1318,28 @@ class UnfoldAdminSite(AdminSite):
         def hex_to_values(value: str) -> str:
             return ", ".join(str(item) for item in hex_to_rgb(value))
 
+        result = {}
+
         for name, weights in colors.items():
             weights = self._get_value(weights, *args)
-            colors[name] = weights
+            result[name] = dict(weights)
 
             for weight, value in weights.items():
                 if value[0] == "#":
-                    colors[name][weight] = hex_to_values(value)
+                    result[name][weight] = hex_to_values(value)
                 elif value.startswith("rgb"):
-                    colors[name][weight] = rgb_to_values(value)
+                    result[name][weight] = rgb_to_values(value)
                 elif isinstance(value, str) and all(
                     part.isdigit() for part in value.split()
                 ):
-                    colors[name][weight] = ", ".join(value.split(" "))
-                pass
+                    result[name][weight] = ", ".join(value.split(" "))
 
-        return colors
+        return result
 
     def _get_list(self, key: str, *args) -> list[Any]:
         items = get_config(self.settings_name)[key]
 
-        if isinstance(items, list):
+        if isinstance(items, (list, tuple)):
             return [self._get_value(item, *args) for item in items]
 
         return []
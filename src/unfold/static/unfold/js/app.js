@@ -44,13 +44,46 @@ function searchForm() {
   };
 }
 
+/*************************************************************
+ * Search key, same folding as unfold.utils.get_search_key
+ *************************************************************/
+const getSearchKey = (value) => {
+  return value
+    .normalize("NFKD")
+    .replace(/[\p{Mn}\u0640]/gu, "")
+    .replace(/\u0671/g, "\u0627")
+    .replace(/[\u0649\u06cc]/g, "\u064a")
+    .toLowerCase();
+};
+
 /*************************************************************
  * Search dropdown
  *************************************************************/
-function searchDropdown() {
+function searchDropdown(indexUrl) {
   return {
     openSearchResults: false,
     currentIndex: 0,
+    index: undefined,
+    results: [],
+    async loadIndex() {
+      if (this.index !== undefined) {
+        return;
+      }
+
+      // Revalidated by ETag so the index is downloaded again only when changed
+      const response = await fetch(indexUrl, { cache: "no-cache" });
+      this.index = (await response.json()).items;
+      this.filterIndex(this.$refs.searchInput.value);
+    },
+    filterIndex(value) {
+      const searchKey = getSearchKey(value);
+
+      this.currentIndex = 0;
+      this.results =
+        searchKey && this.index
+          ? this.index.filter((item) => item.key.includes(searchKey))
+          : [];
+    },
     applyShortcut(event) {
       if (
         event.key === "t" &&
@@ -77,8 +110,13 @@ function searchDropdown() {
         .length;
     },
     selectItem() {
-      const href = this.items[this.currentIndex - 1].querySelector("a").href;
-      window.location = href;
+      const item = document
+        .getElementById("search-results")
+        .querySelectorAll("li")[this.currentIndex - 1];
+
+      if (item) {
+        window.location = item.querySelector("a").href;
+      }
     },
   };
 }
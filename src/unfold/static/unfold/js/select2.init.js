@@ -46,6 +46,20 @@
       .djangoAdminSelect2();
   });
 
+  // Deferred filter sheets are loaded after the page
+  document.addEventListener("htmx:load", (event) => {
+    $(event.target)
+      .find(".unfold-admin-autocomplete.admin-autocomplete")
+      .djangoCustomSelect2();
+
+    $(event.target)
+      .find(".admin-autocomplete")
+      .not(".unfold-admin-autocomplete")
+      .not(".select2-hidden-accessible")
+      .not("[name*=__prefix__]")
+      .djangoAdminSelect2();
+  });
+
   document.addEventListener("formset:added", (event) => {
     $(event.target).find(".admin-autocomplete").djangoAdminSelect2();
   });
@@ -23,6 +23,12 @@ from unfold.widgets import UnfoldAdminMoneyWidget, UnfoldAdminSplitDateTimeWidge
 
 register = Library()
 
+APPROXIMATE_COUNT_SUFFIXES = (
+    (1_000_000_000, "B"),
+    (1_000_000, "M"),
+    (1_000, "K"),
+)
+
 
 def _get_tabs_list(
     context: RequestContext, page: str, opts: Optional[Options] = None
@@ -49,7 +55,7 @@ def _get_tabs_list(
                 if str(opts) == tab_model and page == "changelist":
                     tabs_list = tab["items"]
                     break
-            elif isinstance(tab_model, dict) and str(opts) == tab_model["name"]:
+            elif isinstance(tab_model, Mapping) and str(opts) == tab_model["name"]:
                 is_detail = tab_model.get("detail", False)
 
                 if (page == "changeform" and is_detail) or (
@@ -109,6 +115,24 @@ def class_name(value: Any) -> str:
     return value.__class__.__name__
 
 
+@register.filter
+def approximate_count(value: Any) -> str:
+    """
+    Shortens estimated number of rows, e.g. 1234567 to ~1.2M.
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return value
+
+    for limit, suffix in APPROXIMATE_COUNT_SUFFIXES:
+        if value >= limit:
+            rounded = f"{value / limit:.1f}".removesuffix(".0")
+            return f"~{rounded}{suffix}"
+
+    return f"~{value}"
+
+
 @register.filter
 def is_list(value: Any) -> str:
     return isinstance(value, list)
@@ -576,6 +600,30 @@ def infinite_paginator_url(cl, i):
     return cl.get_query_string({PAGE_VAR: i})
 
 
+@register.simple_tag
+def keyset_paginator_url(cl, params):
+    return cl.get_query_string(params)
+
+
+@register.simple_tag(takes_context=True)
+def inline_keyset_paginator_query(
+    context: RequestContext,
+    formset: Any,
+    params: Optional[dict[str, Any]],
+    preserve_query: bool = True,
+) -> str:
+    request = context.get("request")
+    result = request.GET.copy() if preserve_query else QueryDict(mutable=True)
+
+    for key in (formset.get_cursor_key(), formset.get_pagination_key()):
+        result.pop(key, None)
+
+    for key, value in formset.get_page_params(params).items():
+        result[key] = value
+
+    return result.urlencode()
+
+
 @register.simple_tag
 def elided_page_range(
     paginator: Paginator, number: int
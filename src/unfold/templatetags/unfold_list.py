@@ -1,6 +1,6 @@
 import datetime
 from collections.abc import Generator
-from typing import Any, Optional, Union
+from typing import Any, NamedTuple, Optional, Union
 
 from django.contrib.admin.templatetags.admin_list import (
     ResultList,
@@ -9,13 +9,18 @@ from django.contrib.admin.templatetags.admin_list import (
 )
 from django.contrib.admin.templatetags.admin_urls import add_preserved_filters
 from django.contrib.admin.templatetags.base import InclusionAdminNode
-from django.contrib.admin.utils import label_for_field, lookup_field
+from django.contrib.admin.utils import (
+    FieldIsAForeignKeyColumnName,
+    _get_non_gfk_field,
+    label_for_field,
+    lookup_field,
+)
 from django.contrib.admin.views.main import (
     ORDER_VAR,
     PAGE_VAR,
     ChangeList,
 )
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 from django.db import models
 from django.db.models import Model
 from django.forms import Form
@@ -38,124 +43,156 @@ from unfold.widgets import UnfoldBooleanWidget
 
 register = Library()
 
+ROW_CLASSES_LTR = [
+    "align-middle",
+    "flex",
+    "border-t",
+    "border-base-200",
+    "font-normal",
+    "gap-4",
+    "min-w-0",
+    "overflow-hidden",
+    "px-3",
+    "py-2",
+    "text-left",
+    "before:flex",
+    "before:capitalize",
+    "before:content-[attr(data-label)]",
+    "before:items-center",
+    "before:font-semibold",
+    "before:text-font-important-light",
+    "before:mr-auto",
+    "first:border-t-0",
+    "lg:before:hidden",
+    "lg:first:border-t",
+    "lg:py-3",
+    "lg:table-cell",
+    "dark:border-base-800",
+    "dark:before:text-font-important-dark",
+]
+
+# For RTL, swap left/right, margin, padding, and text alignment
+ROW_CLASSES_RTL = [
+    "align-middle",
+    "flex",
+    "border-t",
+    "border-base-200",
+    "font-normal",
+    "gap-4",
+    "min-w-0",
+    "overflow-hidden",
+    "px-3",
+    "py-2",
+    "text-right",
+    "before:flex",
+    "before:capitalize",
+    "before:content-[attr(data-label)]",
+    "before:items-center",
+    "before:font-semibold",
+    "before:text-font-important-light",
+    "before:ml-auto",  # was mr-auto
+    "first:border-t-0",
+    "lg:before:hidden",
+    "lg:first:border-t",
+    "lg:py-3",
+    "lg:table-cell",
+    "dark:border-base-800",
+    "dark:before:text-font-important-dark",
+]
+
+CHECKBOX_CLASSES_LTR = [
+    "action-checkbox",
+    "align-middle",
+    "flex",
+    "items-center",
+    "px-3",
+    "py-2",
+    "text-left",
+    "before:block",
+    "before:capitalize",
+    "before:content-[attr(data-label)]",
+    "before:font-semibold",
+    "before:mr-auto",
+    "before:text-font-important-light",
+    "lg:before:hidden",
+    "lg:border-t",
+    "lg:border-base-200",
+    "lg:table-cell",
+    "dark:lg:border-base-800",
+    "dark:before:text-font-important-dark",
+]
+
+CHECKBOX_CLASSES_RTL = [
+    "action-checkbox",
+    "align-middle",
+    "flex",
+    "items-center",
+    "px-3",
+    "py-2",
+    "text-right",
+    "before:block",
+    "before:capitalize",
+    "before:content-[attr(data-label)]",
+    "before:font-semibold",
+    "before:ml-auto",  # was mr-auto
+    "before:text-font-important-light",
+    "lg:before:hidden",
+    "lg:border-t",
+    "lg:border-base-200",
+    "lg:table-cell",
+    "dark:lg:border-base-800",
+    "dark:before:text-font-important-dark",
+]
+
+LINK_CLASSES_LTR = [
+    "text-font-important-light",
+    "dark:text-font-important-dark",
+]
+
+LINK_CLASSES_RTL = [
+    "text-font-important-light",
+    "dark:text-font-important-dark",
+    "rtl",  # Optionally add a class for custom styling
+]
+
+
+class DirectionalClasses(NamedTuple):
+    row: str
+    checkbox: str
+    link: str
+    dir_attr: str
+
+
+# Pre-joined class strings keyed by get_language_bidi()
+DIRECTIONAL_CLASSES = {
+    False: DirectionalClasses(
+        row=" ".join(ROW_CLASSES_LTR),
+        checkbox=" ".join(CHECKBOX_CLASSES_LTR),
+        link=" ".join(LINK_CLASSES_LTR),
+        dir_attr=' dir="ltr"',
+    ),
+    True: DirectionalClasses(
+        row=" ".join(ROW_CLASSES_RTL),
+        checkbox=" ".join(CHECKBOX_CLASSES_RTL),
+        link=" ".join(LINK_CLASSES_RTL),
+        dir_attr=' dir="rtl"',
+    ),
+}
+
+
 def get_directional_classes():
     """
     Returns a tuple of (row_classes, checkbox_classes, link_classes) adjusted for RTL/LTR.
     """
-    is_rtl = get_language_bidi()
-    # Directional classes
-    if is_rtl:
-        # For RTL, swap left/right, margin, padding, and text alignment
-        row_classes = [
-            "align-middle",
-            "flex",
-            "border-t",
-            "border-base-200",
-            "font-normal",
-            "gap-4",
-            "min-w-0",
-            "overflow-hidden",
-            "px-3",
-            "py-2",
-            "text-right",
-            "before:flex",
-            "before:capitalize",
-            "before:content-[attr(data-label)]",
-            "before:items-center",
-            "before:font-semibold",
-            "before:text-font-important-light",
-            "before:ml-auto",  # was mr-auto
-            "first:border-t-0",
-            "lg:before:hidden",
-            "lg:first:border-t",
-            "lg:py-3",
-            "lg:table-cell",
-            "dark:border-base-800",
-            "dark:before:text-font-important-dark",
-        ]
-        checkbox_classes = [
-            "action-checkbox",
-            "align-middle",
-            "flex",
-            "items-center",
-            "px-3",
-            "py-2",
-            "text-right",
-            "before:block",
-            "before:capitalize",
-            "before:content-[attr(data-label)]",
-            "before:font-semibold",
-            "before:ml-auto",  # was mr-auto
-            "before:text-font-important-light",
-            "lg:before:hidden",
-            "lg:border-t",
-            "lg:border-base-200",
-            "lg:table-cell",
-            "dark:lg:border-base-800",
-            "dark:before:text-font-important-dark",
-        ]
-        link_classes = [
-            "text-font-important-light",
-            "dark:text-font-important-dark",
-            "rtl",  # Optionally add a class for custom styling
-        ]
-    else:
-        row_classes = [
-            "align-middle",
-            "flex",
-            "border-t",
-            "border-base-200",
-            "font-normal",
-            "gap-4",
-            "min-w-0",
-            "overflow-hidden",
-            "px-3",
-            "py-2",
-            "text-left",
-            "before:flex",
-            "before:capitalize",
-            "before:content-[attr(data-label)]",
-            "before:items-center",
-            "before:font-semibold",
-            "before:text-font-important-light",
-            "before:mr-auto",
-            "first:border-t-0",
-            "lg:before:hidden",
-            "lg:first:border-t",
-            "lg:py-3",
-            "lg:table-cell",
-            "dark:border-base-800",
-            "dark:before:text-font-important-dark",
-        ]
-        checkbox_classes = [
-            "action-checkbox",
-            "align-middle",
-            "flex",
-            "items-center",
-            "px-3",
-            "py-2",
-            "text-left",
-            "before:block",
-            "before:capitalize",
-            "before:content-[attr(data-label)]",
-            "before:font-semibold",
-            "before:mr-auto",
-            "before:text-font-important-light",
-            "lg:before:hidden",
-            "lg:border-t",
-            "lg:border-base-200",
-            "lg:table-cell",
-            "dark:lg:border-base-800",
-            "dark:before:text-font-important-dark",
-        ]
-        link_classes = [
-            "text-font-important-light",
-            "dark:text-font-important-dark",
-        ]
-    return row_classes, checkbox_classes, link_classes
+    if get_language_bidi():
+        return list(ROW_CLASSES_RTL), list(CHECKBOX_CLASSES_RTL), list(LINK_CLASSES_RTL)
+
+    return list(ROW_CLASSES_LTR), list(CHECKBOX_CLASSES_LTR), list(LINK_CLASSES_LTR)
+
 
 def get_dir_attr():
-    return ' dir="rtl"' if get_language_bidi() else ' dir="ltr"'
+    return DIRECTIONAL_CLASSES[bool(get_language_bidi())].dir_attr
+
 
 def result_headers(cl):
     """
@@ -256,78 +293,234 @@ def result_headers(cl):
         }
 
 
-def items_for_result(
-    cl: ChangeList, result: Model, form
-) -> Generator[SafeText, None, None]:
-    def link_in_col(is_first: bool, field_name: str, cl: ChangeList) -> bool:
+DISPLAY_LABEL = "label"
+DISPLAY_DROPDOWN = "dropdown"
+DISPLAY_HEADER = "header"
+DISPLAY_VALUE = "value"
+DISPLAY_RELATED = "related"
+DISPLAY_FIELD = "field"
+
+LOOKUP_FIELD = "field"
+LOOKUP_CALLABLE = "callable"
+LOOKUP_ATTRIBUTE = "attribute"
+
+
+class CellDisplay(NamedTuple):
+    display: str
+    empty_value_display: str
+    label: Any = False
+    boolean: bool = False
+    nowrap: bool = False
+
+
+class Column:
+    """
+    Lookup and display strategy of a single changelist column. Everything which
+    does not depend on the row is resolved only once.
+    """
+
+    def __init__(
+        self,
+        cl: ChangeList,
+        field_index: int,
+        field_name: str,
+        classes: DirectionalClasses,
+    ) -> None:
+        self.field_index = field_index
+        self.field_name = field_name
+        self.model_admin = cl.model_admin
+        self.empty_value_display = cl.model_admin.get_empty_value_display()
+        self.is_link = False
+        self.table_tag = "td"
+        self.field = None
+        self.attr = None
+        self.cell_display = None
+        row_classes = (
+            f"field-{_coerce_field_name(field_name, field_index)} {classes.row}"
+        )
+        value_classes = (
+            classes.checkbox if field_name == "action_checkbox" else row_classes
+        )
+
+        # Class attributes keyed by (is_value, nowrap), shared by all rows
+        self.classes = {
+            (False, False): row_classes,
+            (False, True): f"{row_classes} nowrap",
+            (True, False): value_classes,
+            (True, True): f"{value_classes} nowrap",
+        }
+        self.class_attrs = {
+            key: mark_safe(f' class="{value}"{classes.dir_attr}')
+            for key, value in self.classes.items()
+        }
+
+        # Same resolution order as django.contrib.admin.utils.lookup_field
+        try:
+            self.field = _get_non_gfk_field(cl.lookup_opts, field_name)
+            self.lookup = LOOKUP_FIELD
+        except (FieldDoesNotExist, FieldIsAForeignKeyColumnName):
+            if callable(field_name):
+                self.attr = field_name
+                self.lookup = LOOKUP_CALLABLE
+            elif hasattr(cl.model_admin, field_name) and field_name != "__str__":
+                self.attr = getattr(cl.model_admin, field_name)
+                self.lookup = LOOKUP_CALLABLE
+            else:
+                self.lookup = LOOKUP_ATTRIBUTE
+
+        if self.lookup != LOOKUP_ATTRIBUTE:
+            self.cell_display = self.get_cell_display(self.field, self.attr)
+
+    def lookup_field(self, result: Model) -> tuple[Any, Any, Any]:
+        if self.lookup == LOOKUP_FIELD:
+            return self.field, None, getattr(result, self.field_name)
+
+        if self.lookup == LOOKUP_CALLABLE:
+            return None, self.attr, self.attr(result)
+
+        return lookup_field(self.field_name, result, self.model_admin)
+
+    def get_cell_display(self, f: Any, attr: Any) -> CellDisplay:
+        if f is None or f.auto_created:
+            empty_value_display = getattr(
+                attr, "empty_value_display", self.empty_value_display
+            )
+            label = getattr(attr, "label", False)
+
+            if label:
+                display = DISPLAY_LABEL
+            elif getattr(attr, "dropdown", False):
+                display = DISPLAY_DROPDOWN
+            elif getattr(attr, "header", False):
+                display = DISPLAY_HEADER
+            else:
+                display = DISPLAY_VALUE
+
+            return CellDisplay(
+                display=display,
+                empty_value_display=empty_value_display,
+                label=label,
+                boolean=getattr(attr, "boolean", False),
+            )
+
+        return CellDisplay(
+            display=DISPLAY_RELATED
+            if isinstance(f.remote_field, models.ManyToOneRel)
+            else DISPLAY_FIELD,
+            empty_value_display=getattr(
+                attr, "empty_value_display", self.empty_value_display
+            ),
+            nowrap=isinstance(
+                f, (models.DateField, models.TimeField, models.ForeignKey)
+            ),
+        )
+
+
+class ColumnPlan:
+    """
+    Column headers and per-column data computed once per changelist and shared
+    by the header row and all result rows.
+    """
+
+    def __init__(self, cl: ChangeList) -> None:
+        self.headers = list(result_headers(cl))
+        self.labels = [header["text"] for header in self.headers]
+        self.num_sorted_fields = sum(
+            1 for header in self.headers if header["sortable"] and header["sorted"]
+        )
+
+        classes = DIRECTIONAL_CLASSES[bool(get_language_bidi())]
+        self.dir_attr = classes.dir_attr
+        self.link_classes = classes.link
+        self.pk_attname = str(cl.to_field) if cl.to_field else cl.lookup_opts.pk.attname
+        self.columns = [
+            Column(
+                cl,
+                field_index,
+                field_name,
+                classes,
+            )
+            for field_index, field_name in enumerate(cl.list_display)
+        ]
+
+        first = True
+
+        for column in self.columns:
+            if self._link_in_col(cl, first, column.field_name):
+                column.is_link = True
+                column.table_tag = "th" if first else "td"
+                first = False
+
+    def _link_in_col(self, cl: ChangeList, is_first: bool, field_name: str) -> bool:
         if cl.list_display_links is None:
             return False
         if is_first and not cl.list_display_links:
             return True
         return field_name in cl.list_display_links
 
-    first = True
-    pk = cl.lookup_opts.pk.attname
-    headers = list(result_headers(cl))
 
-    row_classes_base, checkbox_classes_base, link_classes = get_directional_classes()
-    dir_attr = get_dir_attr()
+def get_column_plan(cl: ChangeList) -> ColumnPlan:
+    if not hasattr(cl, "_unfold_column_plan"):
+        cl._unfold_column_plan = ColumnPlan(cl)
 
-    for field_index, field_name in enumerate(cl.list_display):
-        empty_value_display = cl.model_admin.get_empty_value_display()
-        row_classes = [
-            f"field-{_coerce_field_name(field_name, field_index)}",
-            *row_classes_base,
-        ]
+    return cl._unfold_column_plan
+
+
+def items_for_result(
+    cl: ChangeList, result: Model, form
+) -> Generator[SafeText, None, None]:
+    column_plan = get_column_plan(cl)
+    dir_attr = column_plan.dir_attr
+
+    for column in column_plan.columns:
+        field_name = column.field_name
+        is_value = False
+        nowrap = False
 
         try:
-            f, attr, value = lookup_field(field_name, result, cl.model_admin)
+            f, attr, value = column.lookup_field(result)
         except ObjectDoesNotExist:
-            result_repr = empty_value_display
+            result_repr = column.empty_value_display
         else:
-            empty_value_display = getattr(
-                attr, "empty_value_display", empty_value_display
-            )
-            if f is None or f.auto_created:
-                if field_name == "action_checkbox":
-                    row_classes = checkbox_classes_base
-                boolean = getattr(attr, "boolean", False)
-                label = getattr(attr, "label", False)
-                header = getattr(attr, "header", False)
-                dropdown = getattr(attr, "dropdown", False)
-
-                if label:
-                    result_repr = display_for_label(value, empty_value_display, label)
-                elif dropdown:
-                    result_repr = display_for_dropdown(
-                        result, field_name, value, empty_value_display
-                    )
-                elif header:
-                    result_repr = display_for_header(value, empty_value_display)
-                else:
-                    result_repr = display_for_value(value, empty_value_display, boolean)
+            cell_display = column.cell_display or column.get_cell_display(f, attr)
+            empty_value_display = cell_display.empty_value_display
+
+            if cell_display.display == DISPLAY_LABEL:
+                result_repr = display_for_label(
+                    value, empty_value_display, cell_display.label
+                )
+            elif cell_display.display == DISPLAY_DROPDOWN:
+                result_repr = display_for_dropdown(
+                    result, field_name, value, empty_value_display
+                )
+            elif cell_display.display == DISPLAY_HEADER:
+                result_repr = display_for_header(value, empty_value_display)
+            elif cell_display.display == DISPLAY_VALUE:
+                result_repr = display_for_value(
+                    value, empty_value_display, cell_display.boolean
+                )
+            elif cell_display.display == DISPLAY_RELATED:
+                field_val = getattr(result, f.name)
+                result_repr = empty_value_display if field_val is None else field_val
+            else:
+                result_repr = display_for_field(value, f, empty_value_display)
 
-                if isinstance(value, (datetime.date, datetime.time)):
-                    row_classes.append("nowrap")
+            if cell_display.display in (
+                DISPLAY_LABEL,
+                DISPLAY_DROPDOWN,
+                DISPLAY_HEADER,
+                DISPLAY_VALUE,
+            ):
+                is_value = True
+                nowrap = isinstance(value, (datetime.date, datetime.time))
             else:
-                if isinstance(f.remote_field, models.ManyToOneRel):
-                    field_val = getattr(result, f.name)
-                    if field_val is None:
-                        result_repr = empty_value_display
-                    else:
-                        result_repr = field_val
-                else:
-                    result_repr = display_for_field(value, f, empty_value_display)
-                if isinstance(
-                    f, (models.DateField, models.TimeField, models.ForeignKey)
-                ):
-                    row_classes.append("nowrap")
+                nowrap = cell_display.nowrap
 
-        # If list_display_links not defined, add the link tag to the first field
+        row_class = column.class_attrs[is_value, nowrap]
 
-        if link_in_col(first, field_name, cl):
-            table_tag = "th" if first else "td"
-            first = False
+        # If list_display_links not defined, add the link tag to the first field
+        if column.is_link:
+            table_tag = column.table_tag
 
             # Display link to the result's change_view if the url exists, else
             # display just the result's representation.
@@ -341,26 +534,21 @@ def items_for_result(
                 )
                 # Convert the pk to something that can be used in Javascript.
                 # Problem cases are non-ASCII strings.
-                if cl.to_field:
-                    attr = str(cl.to_field)
-                else:
-                    attr = pk
-                value = result.serializable_value(attr)
+                value = result.serializable_value(column_plan.pk_attname)
                 link_or_text = format_html(
                     '<a href="{}" class="{}" {}>{}</a>',
                     url,
-                    " ".join(link_classes),
+                    column_plan.link_classes,
                     format_html(' data-popup-opener="{}"', value)
                     if cl.is_popup
                     else "",
                     result_repr,
                 )
-            row_class = mark_safe(f' class="{" ".join(row_classes)}"{dir_attr}')
             yield format_html(
                 '<{}{} data-label="{}">{}</{}>',
                 table_tag,
                 row_class,
-                headers[field_index]["text"],
+                column_plan.labels[column.field_index],
                 link_or_text,
                 table_tag,
             )
@@ -385,15 +573,15 @@ def items_for_result(
                 )
 
                 if bf.errors:
-                    row_classes += ["group", "errors"]
-
-            row_class = mark_safe(f' class="{" ".join(row_classes)}"{dir_attr}')
+                    row_class = mark_safe(
+                        f' class="{column.classes[is_value, nowrap]} group errors"{dir_attr}'
+                    )
 
-            if field_index != 0:
+            if column.field_index != 0:
                 yield format_html(
                     '<td{} data-label="{}">{}</td>',
                     row_class,
-                    headers[field_index]["text"],
+                    column_plan.labels[column.field_index],
                     result_repr,
                 )
             else:
@@ -405,7 +593,7 @@ def items_for_result(
                 )
 
     if form and not form[cl.model._meta.pk.name].is_hidden:
-        yield format_html("<td{}>{}</td>", get_dir_attr(), form[cl.model._meta.pk.name])
+        yield format_html("<td{}>{}</td>", dir_attr, form[cl.model._meta.pk.name])
 
 
 class UnfoldResultList(ResultList):
@@ -432,12 +620,7 @@ def result_list(context: dict[str, Any], cl: ChangeList) -> dict[str, Any]:
     """
     Display the headers and data list together.
     """
-    headers = list(result_headers(cl))
-    num_sorted_fields = 0
-
-    for h in headers:
-        if h["sortable"] and h["sorted"]:
-            num_sorted_fields += 1
+    column_plan = get_column_plan(cl)
 
     # Add direction to context for template use if needed
     direction = "rtl" if get_language_bidi() else "ltr"
@@ -445,8 +628,8 @@ def result_list(context: dict[str, Any], cl: ChangeList) -> dict[str, Any]:
     return {
         "cl": cl,
         "result_hidden_fields": list(result_hidden_fields(cl)),
-        "result_headers": headers,
-        "num_sorted_fields": num_sorted_fields,
+        "result_headers": column_plan.headers,
+        "num_sorted_fields": column_plan.num_sorted_fields,
         "results": list(results(cl)),
         "actions_row": context.get("actions_row"),
         "has_add_permission": cl.model_admin.has_add_permission(context["request"]),
@@ -473,11 +656,15 @@ def paginator_number(cl: ChangeList, i: Union[str, int]) -> Union[str, SafeText]
     if i == cl.paginator.ELLIPSIS:
         return render_to_string(
             "unfold/helpers/pagination_ellipsis.html",
-            {"ellipsis": cl.paginator.ELLIPSIS, "dir": "rtl" if get_language_bidi() else "ltr"},
+            {
+                "ellipsis": cl.paginator.ELLIPSIS,
+                "dir": "rtl" if get_language_bidi() else "ltr",
+            },
         )
     elif i == cl.page_num:
         return render_to_string(
-            "unfold/helpers/pagination_current_item.html", {"number": i, "dir": "rtl" if get_language_bidi() else "ltr"}
+            "unfold/helpers/pagination_current_item.html",
+            {"number": i, "dir": "rtl" if get_language_bidi() else "ltr"},
         )
     else:
         return format_html(
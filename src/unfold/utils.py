@@ -1,17 +1,23 @@
 import datetime
 import decimal
 import json
+import re
+import unicodedata
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any, Optional
 
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.db import models
 from django.db.models import Model
+from django.dispatch import receiver
 from django.template.loader import render_to_string
 from django.utils import formats, timezone
 from django.utils.hashable import make_hashable
 from django.utils.html import format_html
 from django.utils.safestring import SafeText, mark_safe
+from django.utils.translation import get_language
 
 from .exceptions import UnfoldException
 
@@ -23,8 +29,144 @@ except ImportError:
     Money = None
 
 
+FRAGMENTS_CACHE_SIZE = 1024
+
+SEARCH_KEYS_CACHE_SIZE = 4096
+
+TATWEEL = "\u0640"
+
+# Letters written in several forms which are not unified by removing marks
+SEARCH_KEY_TRANSLATION = str.maketrans(
+    {
+        TATWEEL: None,
+        "\u0671": "\u0627",  # Alef wasla to alef
+        "\u0649": "\u064a",  # Alef maksura to yaa
+        "\u06cc": "\u064a",  # Farsi yeh to yaa
+    }
+)
+
+# Letters matching all their forms in regular expressions, the other forms
+# contain hamza or madda marks which are removed from search keys
+SEARCH_REGEX_VARIANTS = {
+    "\u0627": "\u0627\u0623\u0625\u0622\u0671",
+    "\u064a": "\u064a\u0649\u06cc\u0626",
+    "\u0648": "\u0648\u0624",
+}
+
+# Arabic diacritics, Quranic annotation marks and tatweel
+SEARCH_REGEX_MARKS = "[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]*"
+
+_fragments: dict[tuple, str] = {}
+
+
+@receiver(setting_changed)
+def reset_fragments(**kwargs: Any) -> None:
+    _fragments.clear()
+
+
+def get_fragment_key(value: Any) -> Optional[tuple]:
+    """
+    Hashable key for values which always render the same way. Returns None for
+    anything else, e.g. model instances or lazy objects.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        # Type is part of the key so that str and SafeString do not collide
+        return (type(value), value)
+
+    if isinstance(value, (list, tuple)):
+        keys = tuple(get_fragment_key(item) for item in value)
+
+        if None in keys:
+            return None
+
+        return (list, keys)
+
+    return None
+
+
+def render_fragment(template_name: str, context: dict[str, Any], key: tuple) -> str:
+    """
+    Renders the template only once for the same key and active language. Used
+    for small snippets displayed in every row of the changelist.
+    """
+    cache_key = (template_name, get_language(), key)
+
+    try:
+        return _fragments[cache_key]
+    except KeyError:
+        pass
+
+    fragment = render_to_string(template_name, context)
+
+    if len(_fragments) >= FRAGMENTS_CACHE_SIZE:
+        _fragments.clear()
+
+    _fragments[cache_key] = fragment
+
+    return fragment
+
+
+@lru_cache(maxsize=SEARCH_KEYS_CACHE_SIZE)
+def get_search_key(value: Any) -> str:
+    """
+    Folds case, diacritics, tatweel and alef and yaa forms so differently
+    written words share the same key and can be matched by plain substring.
+    """
+    value = str(value)
+
+    if value.isascii():
+        return value.lower()
+
+    value = unicodedata.normalize("NFKD", value)
+    value = "".join(char for char in value if unicodedata.category(char) != "Mn")
+
+    return value.translate(SEARCH_KEY_TRANSLATION).casefold()
+
+
+def get_search_regex(value: str) -> Optional[str]:
+    """
+    Case-insensitive regular expression matching all forms of an Arabic search
+    term in the database. Returns None when the search term has no Arabic
+    letters and a plain icontains lookup gives the same results.
+    """
+    if not any("\u0600" <= char <= "\u06ff" for char in value):
+        return None
+
+    parts = []
+
+    for char in get_search_key(value):
+        if char in SEARCH_REGEX_VARIANTS:
+            parts.append(f"[{SEARCH_REGEX_VARIANTS[char]}]")
+        else:
+            parts.append(re.escape(char))
+
+        if "\u0600" <= char <= "\u06ff":
+            parts.append(SEARCH_REGEX_MARKS)
+
+    return "".join(parts)
+
+
+def get_permission_scope(user: Any) -> list[Any]:
+    """
+    Describes what the user is allowed to see, so values cached for one user
+    can be shared with users having the same permissions.
+    """
+    return [
+        user.is_active,
+        user.is_staff,
+        user.is_superuser,
+        sorted(user.get_all_permissions()),
+    ]
+
+
 def _boolean_icon(field_val: Any) -> str:
-    return render_to_string("unfold/helpers/boolean.html", {"value": field_val})
+    # Template displays only three states so it is rendered once per state
+    if field_val == "" or field_val == None:  # noqa: E711
+        state = None
+    else:
+        state = bool(field_val)
+
+    return render_fragment("unfold/helpers/boolean.html", {"value": state}, (state,))
 
 
 def display_for_header(value: Iterable, empty_value_display: str) -> SafeText:
@@ -71,14 +213,22 @@ def display_for_label(value: Any, empty_value_display: str, label: Any) -> SafeT
     if isinstance(value, tuple) or isinstance(value, list):
         multiple = True
 
+    context = {
+        "label": value,
+        "label_type": label_type,
+        "multiple": multiple,
+    }
+    value_key = get_fragment_key(value)
+    label_type_key = get_fragment_key(label_type)
+
+    if value_key is None or label_type_key is None:
+        return mark_safe(render_to_string("unfold/helpers/display_label.html", context))
+
     return mark_safe(
-        render_to_string(
+        render_fragment(
             "unfold/helpers/display_label.html",
-            {
-                "label": value,
-                "label_type": label_type,
-                "multiple": multiple,
-            },
+            context,
+            (value_key, label_type_key, multiple),
         )
     )
 
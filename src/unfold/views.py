@@ -1,14 +1,43 @@
-from typing import Any
+import hashlib
+from functools import lru_cache
+from typing import Any, Callable, Optional
+from uuid import uuid4
 
 import django
+from django.contrib.admin import ListFilter
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.sites import all_sites
+from django.contrib.admin.utils import lookup_spawns_duplicates
 from django.contrib.admin.views.main import ERROR_FLAG, PAGE_VAR
 from django.contrib.admin.views.main import ChangeList as BaseChangeList
 from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import Aggregate, Model, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpRequest
 
 from unfold.exceptions import UnfoldException
+from unfold.paginator import (
+    CURSOR_VAR,
+    EstimatedCountPaginator,
+    InfinitePaginator,
+    KeysetPaginator,
+)
+from unfold.utils import get_permission_scope
+
+# Functions returning models watched by cache invalidation receivers, computed
+# once and cleared whenever a model admin is registered
+_watched_models_functions: list[Callable[[], frozenset[type[Model]]]] = []
 
 
 class ChangeList(BaseChangeList):
+    result_count_estimated = False
+    full_result_count_estimated = False
+    facet_counts = None
+
     def __init__(self, request, *args, **kwargs):
         super().__init__(request, *args, **kwargs)
 
@@ -17,6 +46,380 @@ class ChangeList(BaseChangeList):
             self.filter_params.pop(PAGE_VAR, None)
             self.filter_params.pop(ERROR_FLAG, None)
 
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_results(self, request):
+        paginator_class = getattr(self.model_admin, "paginator", None)
+
+        # Paginators without counting provide the page itself, which knows
+        # whether there are pages before and after it
+        if isinstance(paginator_class, type) and issubclass(
+            paginator_class, (InfinitePaginator, KeysetPaginator)
+        ):
+            return self.get_page_results(request)
+
+        return self.get_counted_results(request)
+
+    def get_page_results(self, request):
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+
+        if isinstance(paginator, KeysetPaginator):
+            # Cursor belongs only to the pagination links, sorting and
+            # filtering links start from the first page
+            cursor = request.GET.get(CURSOR_VAR)
+            self.params.pop(CURSOR_VAR, None)
+            self.filter_params.pop(CURSOR_VAR, None)
+
+            self.page = paginator.get_keyset_page(cursor, self.page_num)
+        else:
+            try:
+                self.page = paginator.page(self.page_num)
+            except InvalidPage as e:
+                raise IncorrectLookupParameters from e
+
+        if self.model_admin.show_full_result_count:
+            full_result_count = self.get_full_result_count(request)
+        else:
+            full_result_count = None
+
+        self.result_count = len(self.page.object_list)
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.show_admin_actions = not self.show_full_result_count or bool(
+            full_result_count
+        )
+        self.full_result_count = full_result_count
+        self.result_list = self.page.object_list
+        self.can_show_all = False
+        self.multi_page = self.page.has_next() or self.page.has_previous()
+        self.paginator = paginator
+
+    def get_counted_results(self, request):
+        """
+        Same as Django's get_results, but counts can be estimated by the
+        paginator and cached between requests.
+        """
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        result_count, self.result_count_estimated = self.get_cached_count(
+            request, "results", paginator
+        )
+
+        if self.count_cache_timeout is not None:
+            # Pages are calculated from the cached count instead of counting again
+            paginator.count = result_count
+
+            if isinstance(paginator, EstimatedCountPaginator):
+                paginator.estimate = (
+                    result_count if self.result_count_estimated else None
+                )
+
+        if self.model_admin.show_full_result_count:
+            full_result_count = self.get_full_result_count(request)
+        else:
+            full_result_count = None
+
+        can_show_all = result_count <= self.list_max_show_all
+        multi_page = result_count > self.list_per_page
+
+        if (self.show_all and can_show_all) or not multi_page:
+            result_list = self.queryset._clone()
+        else:
+            try:
+                result_list = paginator.page(self.page_num).object_list
+            except InvalidPage as e:
+                raise IncorrectLookupParameters from e
+
+        self.result_count = result_count
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.show_admin_actions = not self.show_full_result_count or bool(
+            full_result_count
+        )
+        self.full_result_count = full_result_count
+        self.result_list = result_list
+        self.can_show_all = can_show_all
+        self.multi_page = multi_page
+        self.paginator = paginator
+
+    def get_filter_facets(self, list_filter: ListFilter) -> Optional[dict[str, Any]]:
+        """
+        Facet counts of the filter. Counts of all filters are computed by one
+        query, the first time any filter needs them.
+        """
+        if self.facet_counts is None:
+            self.facet_counts = self.get_batched_facet_counts(list_filter.request)
+
+        return self.facet_counts.get(self.get_facet_key(list_filter))
+
+    def get_facet_key(self, list_filter: ListFilter) -> tuple[Any, ...]:
+        # Filters are instantiated again for every facet queryset, so they are
+        # matched by their class and parameters instead of identity
+        return type(list_filter), tuple(list_filter.expected_parameters())
+
+    def get_batched_facet_counts(
+        self, request: HttpRequest
+    ) -> dict[tuple[Any, ...], dict[str, Any]]:
+        """
+        Every filter counts its choices on the changelist queryset without its
+        own parameters. Filters sharing the same queryset are aggregated on it
+        directly, others are limited by a subquery within the same query.
+        Filters counting over multi-valued relations join rows which would be
+        counted by other filters as well, so they are not batched.
+        """
+        state = (
+            self.filter_specs,
+            self.has_filters,
+            self.has_active_filters,
+            self.clear_all_filters_qs,
+        )
+        groups = {}
+
+        try:
+            for list_filter in self.filter_specs:
+                if not getattr(list_filter, "batch_facets", False):
+                    continue
+
+                filtered_qs = self.get_queryset(
+                    request, exclude_parameters=list_filter.expected_parameters()
+                )
+                counts = list_filter.get_facet_counts(self.pk_attname, filtered_qs)
+
+                if not all(isinstance(count, Aggregate) for count in counts.values()):
+                    continue
+
+                # Left out filters count their choices alone
+                if self.facet_counts_spawn_duplicates(counts):
+                    continue
+
+                try:
+                    sql = repr(filtered_qs.query.sql_with_params())
+                except EmptyResultSet:
+                    continue
+
+                groups.setdefault(sql, (filtered_qs, []))[1].append(
+                    (self.get_facet_key(list_filter), counts)
+                )
+        finally:
+            # Facet querysets instantiate the filters again
+            (
+                self.filter_specs,
+                self.has_filters,
+                self.has_active_filters,
+                self.clear_all_filters_qs,
+            ) = state
+
+        if len(groups) == 1:
+            ((queryset, _filters),) = groups.values()
+        else:
+            queryset = self.root_queryset
+
+        aggregates = {}
+        aliases = {}
+
+        for filtered_qs, filters in groups.values():
+            condition = None
+
+            if len(groups) > 1:
+                condition = Q(pk__in=filtered_qs.order_by().values("pk"))
+
+            for key, counts in filters:
+                for name, count in counts.items():
+                    if condition is not None:
+                        count = count.copy()
+                        count.filter = (
+                            condition & count.filter if count.filter else condition
+                        )
+
+                    alias = f"facet_{len(aggregates)}"
+                    aggregates[alias] = count
+                    aliases[alias] = (key, name)
+
+        results = queryset.aggregate(**aggregates) if aggregates else {}
+        facet_counts = {}
+
+        for alias, (key, name) in aliases.items():
+            facet_counts.setdefault(key, {})[name] = results[alias]
+
+        return facet_counts
+
+    def facet_counts_spawn_duplicates(self, counts: dict[str, Aggregate]) -> bool:
+        lookups = []
+        conditions = [count.filter for count in counts.values() if count.filter]
+
+        while conditions:
+            condition = conditions.pop()
+
+            if not isinstance(condition, Q):
+                # Conditions other than lookups cannot be inspected
+                return True
+
+            for child in condition.children:
+                if isinstance(child, tuple):
+                    lookups.append(child[0])
+                else:
+                    conditions.append(child)
+
+        return any(
+            lookup_spawns_duplicates(self.lookup_opts, lookup) for lookup in lookups
+        )
+
+    @property
+    def count_cache_timeout(self) -> Optional[int]:
+        return getattr(self.model_admin, "list_count_cache_timeout", None)
+
+    def get_full_result_count(self, request: HttpRequest) -> int:
+        paginator_class = getattr(self.model_admin, "paginator", None)
+
+        if not isinstance(paginator_class, type) or not issubclass(
+            paginator_class, EstimatedCountPaginator
+        ):
+            paginator_class = Paginator
+
+        # Ordering has no effect on the count, only avoids a warning
+        paginator = paginator_class(
+            self.root_queryset.order_by("pk"), self.list_per_page
+        )
+        full_result_count, self.full_result_count_estimated = self.get_cached_count(
+            request, "full", paginator
+        )
+
+        return full_result_count
+
+    def get_cached_count(
+        self, request: HttpRequest, kind: str, paginator: Paginator
+    ) -> tuple[int, bool]:
+        """
+        Returns the count of the paginator and whether it is estimated. With
+        `list_count_cache_timeout` set, both are cached until the timeout or
+        until an object of the model is saved or deleted.
+        """
+        if self.count_cache_timeout is None:
+            return paginator.count, getattr(paginator, "is_estimated", False)
+
+        cache_key = self.get_count_cache_key(request, kind)
+        value = cache.get(cache_key)
+
+        if value is None:
+            value = (paginator.count, getattr(paginator, "is_estimated", False))
+            cache.set(cache_key, value, self.count_cache_timeout)
+
+        return value
+
+    def get_count_cache_key(self, request: HttpRequest, kind: str) -> str:
+        scope = [
+            self.get_count_cache_scope(request),
+            self.model_admin.admin_site.name,
+            kind,
+        ]
+
+        if kind != "full":
+            # Order of the values does not change the results
+            scope += [
+                self.query,
+                sorted(
+                    (key, sorted(value) if isinstance(value, list) else value)
+                    for key, value in self.get_filters_params().items()
+                ),
+            ]
+
+        scope_hash = hashlib.sha256(repr(scope).encode()).hexdigest()[:32]
+        version = get_count_cache_version(self.model)
+
+        return f"unfold_count_{self.model._meta.label_lower}_{version}_{scope_hash}"
+
+    def get_count_cache_scope(self, request: HttpRequest) -> list[Any]:
+        """
+        Counts are cached for each user, unless the admin declares that
+        querysets depend only on permissions and they can be shared.
+        """
+        scope = get_permission_scope(request.user)
+
+        if getattr(self.model_admin, "list_count_cache_scope", None) != "permissions":
+            scope.append(request.user.pk)
+
+        return scope
+
+
+class FilterSheetChangeList(ChangeList):
+    """
+    Changelist behind the deferred filter sheet. Filters and their facets
+    work on the same queryset as in the changelist, but results are neither
+    counted nor loaded.
+    """
+
+    def get_results(self, request):
+        self.result_count = None
+        self.full_result_count = None
+        self.result_list = self.queryset.none()
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = None
+
+
+def get_count_cache_version_key(model: type[Model]) -> str:
+    return f"unfold_count_version_{model._meta.concrete_model._meta.label_lower}"
+
+
+def get_count_cache_version(model: type[Model]) -> str:
+    """
+    Counts are cached under a version which is replaced on every change, so
+    all cached counts of the model are invalidated at once.
+    """
+    cache_key = get_count_cache_version_key(model)
+    version = cache.get(cache_key)
+
+    if version is None:
+        cache.add(cache_key, uuid4().hex, None)
+        version = cache.get(cache_key)
+
+    return version
+
+
+def watch_models(
+    func: Callable[[], frozenset[type[Model]]],
+) -> Callable[[], frozenset[type[Model]]]:
+    """
+    Caches models returned by the function until the next model admin is
+    registered, so signal receivers only check membership on every save.
+    """
+    cached_func = lru_cache(maxsize=None)(func)
+    _watched_models_functions.append(cached_func)
+
+    return cached_func
+
+
+def clear_watched_models() -> None:
+    for func in _watched_models_functions:
+        func.cache_clear()
+
+
+@watch_models
+def get_count_cached_models() -> frozenset[type[Model]]:
+    return frozenset(
+        registered_model._meta.concrete_model
+        for site in all_sites
+        for registered_model, model_admin in site._registry.items()
+        if getattr(model_admin, "list_count_cache_timeout", None) is not None
+    )
+
+
+def is_count_cached(model: type[Model]) -> bool:
+    return model._meta.concrete_model in get_count_cached_models()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_count_cache(
+    sender: type[Model], instance: Optional[Model] = None, **kwargs: Any
+) -> None:
+    if is_count_cached(sender):
+        cache.delete(get_count_cache_version_key(sender))
+
 
 class UnfoldModelAdminViewMixin(PermissionRequiredMixin):
     """
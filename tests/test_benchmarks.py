@@ -0,0 +1,189 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+
+from unfold.admin import ModelAdmin
+from unfold.decorators import display
+from unfold.settings import CONFIG_DEFAULTS
+from unfold.sites import UnfoldAdminSite
+from unfold.templatetags import unfold_list
+from unfold.utils import get_search_key
+
+User = get_user_model()
+
+BENCHMARK_LINKS = 500
+BENCHMARK_TABS = 50
+BENCHMARK_TAB_ITEMS = 10
+BENCHMARK_ROWS = 1000
+BENCHMARK_SEARCH_APPS = 100
+BENCHMARK_SEARCH_MODELS = 20
+# Differently written forms of the same words in a mixed Arabic and Latin corpus
+BENCHMARK_SEARCH_WORDS = [
+    "أَحْمَد",
+    "احـــمد",
+    "مستشفى",
+    "Café",
+    "Invoice",
+]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "SIDEBAR": {
+                "navigation": [
+                    {
+                        "items": [
+                            {
+                                "title": f"Link {i}",
+                                "link": f"/admin/app/model{i}/",
+                            }
+                            for i in range(BENCHMARK_LINKS)
+                        ],
+                    }
+                ],
+            },
+            "TABS": [
+                {
+                    "items": [
+                        {
+                            "title": f"Tab {i} {j}",
+                            "link": f"/admin/app/model{i * BENCHMARK_TAB_ITEMS + j}/",
+                        }
+                        for j in range(BENCHMARK_TAB_ITEMS)
+                    ],
+                }
+                for i in range(BENCHMARK_TABS)
+            ],
+        },
+    }
+)
+def test_benchmark_sidebar_active_links():
+    admin_site = UnfoldAdminSite()
+    request = RequestFactory().get("/admin/app/model42/")
+    request.user = AnonymousUser()
+
+    # Warm up compiled navigation and link index
+    admin_site.get_sidebar_list(request)
+    admin_site.get_tabs_list(request)
+
+    with (
+        patch("unfold.navigation.urlparse") as urlparse,
+        patch.object(
+            admin_site, "_get_is_active", wraps=admin_site._get_is_active
+        ) as get_is_active,
+    ):
+        items = admin_site.get_sidebar_list(request)[0]["items"]
+        tabs = admin_site.get_tabs_list(request)
+
+    assert urlparse.call_count == 0
+    assert get_is_active.call_count == BENCHMARK_LINKS + (
+        BENCHMARK_TABS * BENCHMARK_TAB_ITEMS
+    )
+    assert [item["title"] for item in items if item["active"]] == ["Link 42"]
+    assert [item["title"] for item in tabs[4]["items"] if item["active"]] == ["Tab 4 2"]
+
+
+class BenchmarkUserAdmin(ModelAdmin):
+    list_per_page = BENCHMARK_ROWS
+    # Action checkbox is added by the changelist as the 12th column
+    list_display = [
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "is_staff",
+        "is_active",
+        "date_joined",
+        "content_type",
+        "display_label",
+        "display_boolean",
+        "id",
+    ]
+
+    @display(label=True)
+    def display_label(self, obj):
+        return obj.username
+
+    @display(boolean=True)
+    def display_boolean(self, obj):
+        return obj.is_superuser
+
+
+@pytest.mark.django_db
+def test_benchmark_changelist_rows(admin_request):
+    User.objects.bulk_create(
+        [
+            User(username=f"user-{i}", email=f"user-{i}@example.com")
+            for i in range(BENCHMARK_ROWS)
+        ]
+    )
+
+    model_admin = BenchmarkUserAdmin(User, UnfoldAdminSite())
+    changelist = model_admin.get_changelist_instance(admin_request)
+    changelist.formset = None
+    list(changelist.result_list)
+
+    with (
+        patch.object(
+            unfold_list, "lookup_field", wraps=unfold_list.lookup_field
+        ) as lookup_field,
+        patch.object(
+            unfold_list, "label_for_field", wraps=unfold_list.label_for_field
+        ) as label_for_field,
+    ):
+        rows = [list(row) for row in unfold_list.results(changelist)]
+
+    assert len(rows) == BENCHMARK_ROWS
+    assert {len(row) for row in rows} == {12}
+    assert lookup_field.call_count == 0
+    assert label_for_field.call_count == 12
+
+
+def get_benchmark_app_list():
+    return [
+        {
+            "name": f"App {app}",
+            "models": [
+                {
+                    "name": f"{BENCHMARK_SEARCH_WORDS[model % len(BENCHMARK_SEARCH_WORDS)]} {app}-{model}",
+                    "admin_url": f"/admin/app{app}/model{model}/",
+                }
+                for model in range(BENCHMARK_SEARCH_MODELS)
+            ],
+        }
+        for app in range(BENCHMARK_SEARCH_APPS)
+    ]
+
+
+def test_benchmark_search_apps_normalized():
+    admin_site = UnfoldAdminSite()
+    models_per_word = (
+        BENCHMARK_SEARCH_APPS * BENCHMARK_SEARCH_MODELS // len(BENCHMARK_SEARCH_WORDS)
+    )
+    expected = {
+        "احمد": 2 * models_per_word,
+        "أحمد": 2 * models_per_word,
+        "مستشفي": models_per_word,
+        "cafe": models_per_word,
+        "INVOICE": models_per_word,
+    }
+
+    get_search_key.cache_clear()
+
+    # Search keys of all names are computed during the first search only
+    for search_term in expected:
+        admin_site._search_apps(get_benchmark_app_list(), search_term)
+
+    misses = get_search_key.cache_info().misses
+
+    for search_term, count in expected.items():
+        results = admin_site._search_apps(get_benchmark_app_list(), search_term)
+        assert len(results) == count
+
+    assert get_search_key.cache_info().misses == misses
@@ -0,0 +1,190 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from example.models import Tag
+
+from unfold.admin import ModelAdmin
+from unfold.sites import UnfoldAdminSite
+from unfold.templatetags import unfold_list
+from unfold.views import clear_watched_models, is_count_cached
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_changelist_headers_computed_once(admin_request, user_model_admin):
+    for i in range(5):
+        User.objects.create_user(username=f"user-{i}")
+
+    changelist = user_model_admin.get_changelist_instance(admin_request)
+    changelist.formset = None
+
+    with patch.object(
+        unfold_list, "result_headers", wraps=unfold_list.result_headers
+    ) as result_headers:
+        context = unfold_list.result_list({"request": admin_request}, changelist)
+        rows = [list(row) for row in context["results"]]
+
+    assert result_headers.call_count == 1
+    assert len(rows) == 6
+    assert context["result_headers"] is unfold_list.get_column_plan(changelist).headers
+
+
+@pytest.mark.parametrize("language, direction", [("en", "ltr"), ("ar", "rtl")])
+def test_changelist_directional_classes(language, direction):
+    with translation.override(language):
+        row_classes, checkbox_classes, link_classes = (
+            unfold_list.get_directional_classes()
+        )
+        classes = unfold_list.DIRECTIONAL_CLASSES[translation.get_language_bidi()]
+
+        assert classes.row == " ".join(row_classes)
+        assert classes.checkbox == " ".join(checkbox_classes)
+        assert classes.link == " ".join(link_classes)
+        assert classes.dir_attr == f' dir="{direction}"'
+        assert unfold_list.get_dir_attr() == classes.dir_attr
+
+
+@pytest.mark.django_db
+def test_changelist_rtl_cells(admin_request, user_model_admin):
+    User.objects.create_user(username="user")
+
+    with translation.override("ar"):
+        changelist = user_model_admin.get_changelist_instance(admin_request)
+        changelist.formset = None
+        rows = [list(row) for row in unfold_list.results(changelist)]
+
+    assert 'dir="rtl"' in rows[0][1]
+    assert "text-right" in rows[0][1]
+    assert "before:ml-auto" in rows[0][1]
+
+
+def _count_queries(queries, table="example_tag"):
+    return [
+        query["sql"]
+        for query in queries
+        if "COUNT" in query["sql"] and table in query["sql"]
+    ]
+
+
+@pytest.fixture
+def tag_admin_count_cache():
+    cache.clear()
+
+    with (
+        patch.object(admin.site._registry[Tag], "list_count_cache_timeout", 60),
+        patch.object(admin.site._registry[Tag], "list_per_page", 2),
+    ):
+        clear_watched_models()
+        yield admin.site._registry[Tag]
+
+    clear_watched_models()
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_changelist_count_cache(admin_client, tag_admin_count_cache):
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(5))
+
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get("/admin/example/tag/")
+
+    assert len(_count_queries(queries)) == 2
+    assert response.context_data["cl"].result_count == 5
+
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get("/admin/example/tag/", {"p": 2, "o": "-1"})
+
+    assert _count_queries(queries) == []
+    assert response.context_data["cl"].result_count == 5
+    assert response.context_data["cl"].full_result_count == 5
+    assert len(response.context_data["cl"].result_list) == 2
+
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get("/admin/example/tag/", {"q": "tag-1"})
+
+    assert len(_count_queries(queries)) == 1
+    assert response.context_data["cl"].result_count == 1
+
+
+@pytest.mark.django_db
+def test_changelist_count_cache_invalidation(admin_client, tag_admin_count_cache):
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(5))
+    admin_client.get("/admin/example/tag/")
+
+    tag = Tag.objects.create(name="new")
+    response = admin_client.get("/admin/example/tag/")
+
+    assert response.context_data["cl"].result_count == 6
+
+    tag.delete()
+    response = admin_client.get("/admin/example/tag/")
+
+    assert response.context_data["cl"].result_count == 5
+
+
+@pytest.mark.django_db
+def test_changelist_count_cache_scope(rf, admin_user, tag_admin_count_cache):
+    staff_user = User.objects.create_user(
+        username="staff", is_staff=True, password="password"
+    )
+    staff_user.user_permissions.add(Permission.objects.get(codename="view_tag"))
+
+    admin_request = rf.get("/admin/example/tag/")
+    admin_request.user = admin_user
+    staff_request = rf.get("/admin/example/tag/")
+    staff_request.user = User.objects.get(pk=staff_user.pk)
+
+    admin_cl = tag_admin_count_cache.get_changelist_instance(admin_request)
+    staff_cl = tag_admin_count_cache.get_changelist_instance(staff_request)
+
+    assert admin_cl.get_count_cache_key(
+        admin_request, "results"
+    ) != staff_cl.get_count_cache_key(staff_request, "results")
+
+
+@pytest.mark.parametrize("scope, shared", [("user", False), ("permissions", True)])
+@pytest.mark.django_db
+def test_changelist_count_cache_scope_superusers(
+    rf, tag_admin_count_cache, scope, shared
+):
+    cache_keys = set()
+
+    for username in ["first", "second"]:
+        request = rf.get("/admin/example/tag/")
+        request.user = User.objects.create_superuser(username=username)
+
+        with patch.object(tag_admin_count_cache, "list_count_cache_scope", scope):
+            changelist = tag_admin_count_cache.get_changelist_instance(request)
+            cache_keys.add(changelist.get_count_cache_key(request, "results"))
+
+    assert len(cache_keys) == (1 if shared else 2)
+
+
+def test_changelist_count_cached_models_rebuilt_on_register():
+    class TagCountCacheAdmin(ModelAdmin):
+        list_count_cache_timeout = 60
+
+    site = UnfoldAdminSite(name="count_cache")
+
+    assert not is_count_cached(Tag)
+
+    site.register(Tag, TagCountCacheAdmin)
+
+    assert is_count_cached(Tag)
+
+    # Receivers only check membership in the precomputed set
+    with patch.object(site, "_registry") as registry:
+        is_count_cached(Tag)
+
+    registry.items.assert_not_called()
+
+    site.unregister(Tag)
+    clear_watched_models()
@@ -1,11 +1,23 @@
+import time
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
+from django.contrib import admin
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
 from django.test import override_settings
 from django.urls import reverse
+from example.models import Tag
 
+from unfold.dataclasses import SearchResult
 from unfold.settings import CONFIG_DEFAULTS
+from unfold.sites import UnfoldAdminSite
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
 
 
 @pytest.mark.django_db
@@ -108,3 +120,520 @@ def test_command_search_extended_model_with_permission(
     )
     assert response.status_code == HTTPStatus.OK
     assert "sample-test-tag-with-permission" in response.content.decode()
+
+
+def _get_site():
+    site = UnfoldAdminSite()
+    site._registry = admin.site._registry
+    return site
+
+
+def _search_models(request, search_term):
+    site = _get_site()
+    app_list = site.get_app_list(request)
+    return site._search_models(request, app_list, search_term)
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_models": True,
+                "search_models_limit": 5,
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_models_limit(rf, admin_user, tag_factory):
+    tag_factory.create_batch(20, name="limited-tag")
+    request = rf.get("/")
+    request.user = admin_user
+
+    results = _search_models(request, "limited-tag")
+    assert len(results) == 5
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_models": True,
+                "search_models_limit": None,
+                "search_results_limit": 7,
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_results_limit(rf, admin_user, tag_factory):
+    tag_factory.create_batch(20, name="limited-tag")
+    request = rf.get("/")
+    request.user = admin_user
+
+    results = _search_models(request, "limited-tag")
+    assert len(results) == 7
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_models": True,
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_models_ranking(rf, admin_user, tag_factory):
+    tag_factory(name="my-ranked-tag")
+    tag_factory(name="ranked-tag-second")
+    tag_factory(name="ranked-tag")
+    request = rf.get("/")
+    request.user = admin_user
+
+    results = _search_models(request, "ranked-tag")
+    assert [result.title for result in results] == [
+        "ranked-tag",
+        "ranked-tag-second",
+        "my-ranked-tag",
+    ]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_models": True,
+                "search_time_budget": 0,
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_models_time_budget(rf, admin_user, tag_factory):
+    tag_factory(name="budget-tag")
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    app_list = site.get_app_list(request)
+
+    with patch.object(site, "_search_model", return_value=[]) as search_model:
+        site._search_models(request, app_list, "budget-tag")
+
+    # Only the first model is searched once the budget is spent
+    assert search_model.call_count == 1
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_models": True,
+                "search_concurrency": 4,
+            }
+        },
+    }
+)
+@pytest.mark.django_db(transaction=True)
+def test_command_search_models_concurrently(rf, admin_user, tag_factory):
+    tag_factory(name="concurrent-tag")
+    request = rf.get("/")
+    request.user = admin_user
+
+    results = _search_models(request, "concurrent-tag")
+    assert [result.title for result in results] == ["concurrent-tag"]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_models": True,
+                "search_concurrency": 4,
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_models_concurrently_stable_order(rf, admin_user):
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    app_list = site.get_app_list(request)
+    admin_instances = list(site._get_searchable_admins(request, app_list))
+
+    def search_model(request, admin_instance, search_term, limit):
+        # Models found first are the last ones to be searched sequentially
+        time.sleep(
+            0.01 * (len(admin_instances) - admin_instances.index(admin_instance))
+        )
+        return [SearchResult(str(admin_instance), "", "", None)]
+
+    with patch.object(site, "_search_model", side_effect=search_model):
+        results = site._search_models(request, app_list, "test")
+
+    assert [result.title for result in results] == [
+        str(admin_instance) for admin_instance in admin_instances
+    ]
+
+
+@pytest.mark.django_db
+def test_command_search_models_concurrently_timeout(rf, admin_user):
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    slow_admin, fast_admin = list(site._registry.values())[:2]
+
+    def search_model(request, admin_instance, search_term, limit):
+        if admin_instance is slow_admin:
+            time.sleep(0.5)
+
+        return [SearchResult(str(admin_instance), "", "", None)]
+
+    with patch.object(site, "_search_model", side_effect=search_model):
+        found = list(
+            site._iter_search_models_concurrently(
+                request, [slow_admin, fast_admin], "test", None, 0.1, 2
+            )
+        )
+
+    assert [
+        (position, [result.title for result in model_results])
+        for position, model_results in found
+    ] == [(1, [str(fast_admin)])]
+
+
+@pytest.mark.django_db
+def test_command_search_cache_narrowed(rf, admin_user, tag_factory):
+    tag_factory(name="invoice")
+    tag_factory(name="inventory")
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    tag_admin = site._registry[Tag]
+
+    results = site._search_model(request, tag_admin, "inv")
+    assert sorted(result.title for result in results) == ["inventory", "invoice"]
+    assert site.get_search_cache_stats() == {"hits": 0, "narrowed": 0, "misses": 1}
+
+    # Records created after caching the prefix are not searched
+    tag_factory(name="invoice-new")
+
+    results = site._search_model(request, tag_admin, "invo")
+    assert [result.title for result in results] == ["invoice"]
+    assert site.get_search_cache_stats() == {"hits": 0, "narrowed": 1, "misses": 1}
+
+    results = site._search_model(request, tag_admin, "invo")
+    assert [result.title for result in results] == ["invoice"]
+    assert site.get_search_cache_stats() == {"hits": 1, "narrowed": 1, "misses": 1}
+
+
+@pytest.mark.parametrize("search_narrowable", [False, True])
+def test_command_search_cache_narrowed_overridden_search(rf, search_narrowable):
+    site = _get_site()
+
+    class TagSearchAdmin(type(site._registry[Tag])):
+        def get_search_results(self, request, queryset, search_term):
+            return super().get_search_results(request, queryset, search_term[::-1])
+
+    tag_admin = TagSearchAdmin(Tag, site)
+    tag_admin.search_narrowable = search_narrowable
+
+    assert (
+        site._is_search_narrowable(rf.get("/"), tag_admin, "invo") is search_narrowable
+    )
+
+
+@pytest.mark.django_db
+def test_command_search_cache_not_narrowed_when_incomplete(rf, admin_user, tag_factory):
+    tag_factory(name="inventory")
+    tag_factory(name="invoice")
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    tag_admin = site._registry[Tag]
+
+    site._search_model(request, tag_admin, "inv", 1)
+    results = site._search_model(request, tag_admin, "invo", 1)
+
+    assert [result.title for result in results] == ["invoice"]
+    assert site.get_search_cache_stats() == {"hits": 0, "narrowed": 0, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_command_search_cache_apps_narrowed(rf, admin_user):
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+
+    site._search_apps_cached(request, "us")
+    results = site._search_apps_cached(request, "use")
+
+    assert [result.title for result in results] == [
+        result.title for result in site._search_apps(site.get_app_list(request), "use")
+    ]
+    assert site.get_search_cache_stats() == {"hits": 0, "narrowed": 1, "misses": 1}
+
+
+@pytest.mark.django_db
+def test_command_search_cache_shared_by_permissions(rf, user_factory):
+    permission = Permission.objects.get(codename="view_tag")
+    site = _get_site()
+
+    for username in ["first", "second"]:
+        user = user_factory(username=username, is_staff=True)
+        user.user_permissions.add(permission)
+        request = rf.get("/")
+        request.user = user
+        site._search_apps_cached(request, "tag")
+
+    assert site.get_search_cache_stats() == {"hits": 1, "narrowed": 0, "misses": 1}
+
+    other_user = user_factory(username="other", is_staff=True)
+    request = rf.get("/")
+    request.user = other_user
+    site._search_apps_cached(request, "tag")
+
+    assert site.get_search_cache_stats() == {"hits": 1, "narrowed": 0, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_command_search_cache_records_per_user(rf, user_factory):
+    site = _get_site()
+    tag_admin = site._registry[Tag]
+
+    for username in ["first", "second"]:
+        request = rf.get("/")
+        request.user = user_factory(username=username, is_superuser=True)
+        site._search_model(request, tag_admin, "tag")
+
+    assert site.get_search_cache_stats() == {"hits": 0, "narrowed": 0, "misses": 2}
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_cache_scope": "permissions",
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_cache_scope_permissions(rf, user_factory):
+    site = _get_site()
+    tag_admin = site._registry[Tag]
+
+    for username in ["first", "second"]:
+        request = rf.get("/")
+        request.user = user_factory(username=username, is_superuser=True)
+        site._search_model(request, tag_admin, "tag")
+
+    assert site.get_search_cache_stats() == {"hits": 1, "narrowed": 0, "misses": 1}
+
+
+@pytest.mark.django_db
+def test_command_search_cache_quoted_not_narrowed(rf, admin_user, tag_factory):
+    tag_factory(name="foo bar")
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    tag_admin = site._registry[Tag]
+    search_term = '"foo bar"'
+
+    # Typing the quoted phrase one character at a time
+    for i in range(1, len(search_term) + 1):
+        results = site._search_model(request, tag_admin, search_term[:i])
+
+    assert [result.title for result in results] == ["foo bar"]
+    assert site.get_search_cache_stats()["narrowed"] == 0
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "search_cache_timeout": 0,
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_cache_disabled(rf, admin_user):
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+
+    site._search_apps_cached(request, "tag")
+    site._search_apps_cached(request, "tag")
+
+    assert site.get_search_cache_stats() == {"hits": 0, "narrowed": 0, "misses": 2}
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "SIDEBAR": {
+                "navigation": [
+                    {
+                        "title": "Navigation",
+                        "items": [
+                            {
+                                "title": "Allowed item",
+                                "link": "/allowed/",
+                            },
+                            {
+                                "title": "Denied item",
+                                "link": "/denied/",
+                                "permission": lambda request: False,
+                            },
+                        ],
+                    }
+                ]
+            },
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_navigation_index(admin_client):
+    response = admin_client.get(reverse("admin:navigation_index"))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["ETag"] == f'"{response.json()["version"]}"'
+    assert "private" in response["Cache-Control"]
+
+    items = response.json()["items"]
+
+    assert items[0] == {
+        "title": "Allowed item",
+        "description": "Navigation",
+        "link": "/allowed/",
+        "icon": None,
+        "key": "allowed item\nnavigation",
+    }
+    assert "/denied/" not in [item["link"] for item in items]
+    assert {
+        "title": "Tags",
+        "description": "Example",
+        "link": reverse("admin:example_tag_changelist"),
+        "icon": "tag",
+        "key": "tags\nexample",
+    } in items
+
+
+@pytest.mark.django_db
+def test_command_navigation_index_not_modified(admin_client):
+    response = admin_client.get(reverse("admin:navigation_index"))
+    response = admin_client.get(
+        reverse("admin:navigation_index"), HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_command_navigation_index_permissions(client, admin_client, staff_user):
+    admin_response = admin_client.get(reverse("admin:navigation_index"))
+
+    client.force_login(staff_user)
+    response = client.get(
+        reverse("admin:navigation_index"),
+        HTTP_IF_NONE_MATCH=admin_response["ETag"],
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["ETag"] != admin_response["ETag"]
+    assert reverse("admin:example_tag_changelist") not in [
+        item["link"] for item in response.json()["items"]
+    ]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "COMMAND": {
+                "navigation_index": True,
+            }
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_search_navigation_index(admin_client):
+    response = admin_client.get(reverse("admin:search") + "?s=tag&extended=1")
+
+    # Command results are not filtered in the browser so apps are kept
+    assert "Tags" in response.content.decode()
+
+
+NAVIGATION_BY_USER = [
+    {
+        "title": "Navigation",
+        "items": [
+            {
+                "title": "First user item",
+                "link": "/first/",
+                "permission": lambda request: request.user.username == "first",
+            },
+        ],
+    }
+]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "SIDEBAR": {
+                "navigation": NAVIGATION_BY_USER,
+            },
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_navigation_index_cached_per_user(client, user_factory):
+    links = []
+
+    for username in ["first", "second"]:
+        client.force_login(
+            user_factory(username=username, is_staff=True, is_superuser=True)
+        )
+        response = client.get(reverse("admin:navigation_index"))
+        links.append([item["link"] for item in response.json()["items"]])
+
+    assert "/first/" in links[0]
+    assert "/first/" not in links[1]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "SIDEBAR": {
+                "cache_permissions": True,
+                "navigation": NAVIGATION_BY_USER,
+            },
+        },
+    }
+)
+@pytest.mark.django_db
+def test_command_navigation_index_cache_permissions(rf, user_factory):
+    site = _get_site()
+    cache_keys = set()
+
+    for username in ["first", "second"]:
+        request = rf.get("/")
+        request.user = user_factory(username=username, is_superuser=True)
+        cache_keys.add(site._get_search_cache_key(request, "navigation", ""))
+
+    assert len(cache_keys) == 1
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test.client import RequestFactory
+
+from unfold.sites import UnfoldAdminSite
+
+
+@pytest.mark.django_db
+def test_each_context_computed_once_per_request(admin_user):
+    admin_site = UnfoldAdminSite()
+    request = RequestFactory().get("/rand")
+    request.user = admin_user
+
+    with patch.object(
+        admin_site, "get_sidebar_list", wraps=admin_site.get_sidebar_list
+    ) as get_sidebar_list:
+        first = admin_site.each_context(request)
+        second = admin_site.each_context(request)
+
+    assert get_sidebar_list.call_count == 1
+    assert first == second
+    assert first is not second
+
+
+@pytest.mark.django_db
+def test_each_context_refresh(admin_user):
+    admin_site = UnfoldAdminSite()
+    request = RequestFactory().get("/rand")
+    request.user = admin_user
+
+    with patch.object(
+        admin_site, "get_sidebar_list", wraps=admin_site.get_sidebar_list
+    ) as get_sidebar_list:
+        admin_site.each_context(request)
+        admin_site.each_context(request, refresh=True)
+
+    assert get_sidebar_list.call_count == 2
+
+
+@pytest.mark.django_db
+def test_each_context_recomputed_for_different_user(admin_user):
+    admin_site = UnfoldAdminSite()
+    request = RequestFactory().get("/rand")
+    request.user = AnonymousUser()
+
+    assert admin_site.each_context(request)["sidebar_navigation"] == []
+
+    request.user = admin_user
+    context = admin_site.each_context(request)
+
+    assert context["sidebar_navigation"] == []
+    assert context["has_permission"] is True
+
+
+def test_each_context_returns_copy():
+    admin_site = UnfoldAdminSite()
+    request = RequestFactory().get("/rand")
+    request.user = AnonymousUser()
+
+    admin_site.each_context(request)["title"] = "Changed"
+
+    assert "title" not in admin_site.each_context(request)
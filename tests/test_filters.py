@@ -1,12 +1,29 @@
+from unittest.mock import patch
+
 import pytest
+from django.contrib import admin
 from django.contrib.admin.templatetags.admin_list import admin_list_filter
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from example.models import Tag
 
 from unfold.contrib.filters.admin.autocomplete_filters import (
     AutocompleteSelectFilter,
     AutocompleteSelectMultipleFilter,
 )
+from unfold.contrib.filters.admin.choice_filters import (
+    AllValuesCheckboxFilter,
+    BooleanRadioFilter,
+    RadioFilter,
+    RelatedCheckboxFilter,
+)
+from unfold.contrib.filters.admin.numeric_filters import SliderNumericFilter
 from unfold.contrib.filters.admin.text_filters import FieldTextFilter
+from unfold.contrib.filters.cache import get_cached_filter_models
+from unfold.views import clear_watched_models
 
 
 @pytest.mark.django_db
@@ -57,3 +74,554 @@ def test_filters_autocomplete_select_filter(
     )
 
     assert "id_content_type__id__exact" in admin_list_filter(user_changelist, filter)
+
+
+@pytest.mark.django_db
+def test_filters_field_text_filter_arabic_forms(
+    admin_request, user_model_admin, user_factory
+):
+    for username in ["أَحْمَد", "احـــمد", "إحمد", "محمود", "ahmed"]:
+        user_factory(username=username)
+
+    filter = FieldTextFilter(
+        request=admin_request,
+        params={"username__icontains": ["احمد"]},
+        model=get_user_model(),
+        model_admin=user_model_admin,
+        field=get_user_model()._meta.get_field("username"),
+        field_path="username",
+    )
+    queryset = filter.queryset(admin_request, get_user_model().objects.all())
+
+    assert sorted(queryset.values_list("username", flat=True)) == sorted(
+        ["أَحْمَد", "احـــمد", "إحمد"]
+    )
+
+
+@pytest.mark.django_db
+def test_filters_field_text_filter_latin(admin_request, user_model_admin, user_factory):
+    user_factory(username="Ahmed")
+    user_factory(username="Mohamed")
+
+    filter = FieldTextFilter(
+        request=admin_request,
+        params={"username__icontains": ["ahm"]},
+        model=get_user_model(),
+        model_admin=user_model_admin,
+        field=get_user_model()._meta.get_field("username"),
+        field_path="username",
+    )
+    queryset = filter.queryset(admin_request, get_user_model().objects.all())
+
+    assert list(queryset.values_list("username", flat=True)) == ["Ahmed"]
+
+
+@pytest.fixture
+def user_admin_slider_filter():
+    cache.clear()
+    model_admin = admin.site._registry[get_user_model()]
+
+    with (
+        patch.object(model_admin, "list_filter", [("id", SliderNumericFilter)]),
+        patch.object(SliderNumericFilter, "cache_timeout", 60),
+    ):
+        clear_watched_models()
+        yield model_admin
+
+    clear_watched_models()
+    cache.clear()
+
+
+def _get_slider_filter(request, model_admin):
+    return SliderNumericFilter(
+        request=request,
+        params={},
+        model=get_user_model(),
+        model_admin=model_admin,
+        field=get_user_model()._meta.get_field("id"),
+        field_path="id",
+    )
+
+
+@pytest.mark.django_db
+def test_filters_slider_numeric_filter_bounds(
+    admin_request, user_admin_slider_filter, user_factory
+):
+    users = [user_factory(username=f"user-{i}") for i in range(3)]
+
+    with CaptureQueriesContext(connection) as queries:
+        (choice,) = _get_slider_filter(admin_request, user_admin_slider_filter).choices(
+            None
+        )
+
+    # Permissions of the cache scope are loaded once per user
+    assert len([query for query in queries if "MAX" in query["sql"]]) == 1
+    assert not any(
+        "COUNT" in query["sql"] and "MAX" not in query["sql"] for query in queries
+    )
+    assert choice["min"] == admin_request.user.pk
+    assert choice["max"] == users[-1].pk
+
+    with CaptureQueriesContext(connection) as queries:
+        (choice,) = _get_slider_filter(admin_request, user_admin_slider_filter).choices(
+            None
+        )
+
+    assert choice["max"] == users[-1].pk
+    assert not any("MAX" in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_filters_slider_numeric_filter_bounds_invalidation(
+    admin_request, user_admin_slider_filter, user_factory
+):
+    _get_slider_filter(admin_request, user_admin_slider_filter).choices(None)
+
+    user = user_factory()
+    (choice,) = _get_slider_filter(admin_request, user_admin_slider_filter).choices(
+        None
+    )
+
+    assert choice["max"] == user.pk
+
+    user.delete()
+    (choice,) = _get_slider_filter(admin_request, user_admin_slider_filter).choices(
+        None
+    )
+
+    assert choice["max"] is None
+
+
+@pytest.mark.django_db
+def test_filters_slider_numeric_filter_without_cache(
+    admin_request, user_model_admin, user_factory
+):
+    user_factory()
+
+    # Bounds depend on the queryset of the user so they are not cached by default
+    for _i in range(2):
+        with CaptureQueriesContext(connection) as queries:
+            _get_slider_filter(admin_request, user_model_admin).choices(None)
+
+        assert len(queries) == 1
+
+
+@pytest.fixture
+def user_admin_facet_filters():
+    model_admin = admin.site._registry[get_user_model()]
+
+    with patch.object(
+        model_admin,
+        "list_filter",
+        [
+            ("is_staff", BooleanRadioFilter),
+            ("is_active", BooleanRadioFilter),
+            ("username", AllValuesCheckboxFilter),
+        ],
+    ):
+        yield model_admin
+
+
+def _get_facet_choices(request, model_admin):
+    changelist = model_admin.get_changelist_instance(request)
+
+    with CaptureQueriesContext(connection) as queries:
+        choices = {
+            list_filter.field_path: [
+                str(label)
+                for choice in list_filter.choices(changelist)
+                for _value, label in choice["form"]
+                .fields[list_filter.lookup_kwarg]
+                .choices
+            ]
+            for list_filter in changelist.filter_specs
+        }
+
+    return choices, [query for query in queries if "COUNT" in query["sql"]]
+
+
+@pytest.mark.django_db
+def test_filters_batched_facets(rf, admin_user, user_admin_facet_filters, user_factory):
+    user_factory(username="staff", is_staff=True)
+    user_factory(username="inactive", is_active=False)
+
+    request = rf.get("/", {"_facets": "True"})
+    request.user = admin_user
+    choices, queries = _get_facet_choices(request, user_admin_facet_filters)
+
+    assert len(queries) == 1
+    assert "Yes (2)" in choices["is_staff"]
+    assert "No (1)" in choices["is_staff"]
+    assert "No (1)" in choices["is_active"]
+    assert "inactive (1)" in choices["username"]
+
+
+@pytest.mark.django_db
+def test_filters_batched_facets_active_filter(
+    rf, admin_user, user_admin_facet_filters, user_factory
+):
+    user_factory(username="staff", is_staff=True)
+    user_factory(username="inactive", is_active=False)
+
+    request = rf.get("/", {"_facets": "True", "is_staff__exact": "1"})
+    request.user = admin_user
+    choices, queries = _get_facet_choices(request, user_admin_facet_filters)
+
+    # Active filter is counted without its own parameters, others with them
+    assert len(queries) == 1
+    assert "No (1)" in choices["is_staff"]
+    assert "Yes (2)" in choices["is_active"]
+    assert "No (0)" in choices["is_active"]
+    assert "staff (1)" in choices["username"]
+    assert "inactive (0)" in choices["username"]
+
+
+@pytest.mark.django_db
+def test_filters_batched_facets_many_to_many(
+    rf, admin_user, user_model_admin, user_factory, tag_factory
+):
+    tags = [tag_factory(name=name) for name in ["alpha", "beta", "gamma"]]
+    user_factory(username="tagged").tags.set(tags)
+    user_factory(username="inactive", is_active=False).tags.set(tags[:1])
+
+    request = rf.get("/", {"_facets": "True"})
+    request.user = admin_user
+
+    with patch.object(
+        user_model_admin,
+        "list_filter",
+        [("tags", RelatedCheckboxFilter), ("is_active", BooleanRadioFilter)],
+    ):
+        choices, _queries = _get_facet_choices(request, user_model_admin)
+
+    # Joined tags do not multiply users counted by other filters
+    assert "Yes (2)" in choices["is_active"]
+    assert "No (1)" in choices["is_active"]
+    assert "alpha (2)" in choices["tags"]
+    assert "beta (1)" in choices["tags"]
+
+
+class LazyRelatedCheckboxFilter(RelatedCheckboxFilter):
+    lazy_choices = True
+    lazy_choices_per_page = 2
+
+
+class LazyAllValuesCheckboxFilter(AllValuesCheckboxFilter):
+    lazy_choices = True
+    lazy_choices_per_page = 2
+
+
+@pytest.fixture
+def user_admin_lazy_filters():
+    cache.clear()
+    model_admin = admin.site._registry[get_user_model()]
+
+    with patch.object(
+        model_admin,
+        "list_filter",
+        [
+            ("tags", LazyRelatedCheckboxFilter),
+            ("username", LazyAllValuesCheckboxFilter),
+        ],
+    ):
+        yield model_admin
+
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_filters_lazy_choices(
+    admin_request, user_changelist, user_admin_lazy_filters, tag_factory
+):
+    tags = [tag_factory(name=name) for name in ["alpha", "beta", "gamma"]]
+
+    filter = LazyRelatedCheckboxFilter(
+        field=get_user_model()._meta.get_field("tags"),
+        request=admin_request,
+        params={"tags__id__exact": [str(tags[2].pk)]},
+        model=get_user_model(),
+        model_admin=user_admin_lazy_filters,
+        field_path="tags",
+    )
+
+    # Selected choice and the first page of the others
+    assert filter.lookup_choices == [
+        (tags[2].pk, "gamma"),
+        (tags[0].pk, "alpha"),
+        (tags[1].pk, "beta"),
+    ]
+    assert filter.has_more_choices
+
+    output = admin_list_filter(user_changelist, filter)
+
+    assert "lazy-choices" in output
+    assert reverse("admin:example_user_filter_choices", args=["tags"]) in output
+
+
+@pytest.mark.django_db
+def test_filters_lazy_choices_all_values(
+    admin_request, user_changelist, user_admin_lazy_filters, user_factory
+):
+    user_factory(username="lazy-user")
+
+    filter = LazyAllValuesCheckboxFilter(
+        field=get_user_model()._meta.get_field("username"),
+        request=admin_request,
+        params={},
+        model=get_user_model(),
+        model_admin=user_admin_lazy_filters,
+        field_path="username",
+    )
+
+    # Choices are loaded when the filter is rendered
+    assert filter.lookup_choices is None
+    assert "lazy-user" in admin_list_filter(user_changelist, filter)
+
+
+@pytest.mark.django_db
+def test_filters_lazy_choices_view(admin_client, user_admin_lazy_filters, tag_factory):
+    tags = [tag_factory(name=name) for name in ["alpha", "beta", "gamma"]]
+    url = reverse("admin:example_user_filter_choices", args=["tags"])
+
+    response = admin_client.get(url, {"page": 2})
+
+    assert response.json() == {
+        "results": [{"id": str(tags[2].pk), "text": "gamma"}],
+        "pagination": {"more": False},
+    }
+
+    response = admin_client.get(url, {"term": "bet"})
+
+    assert response.json()["results"] == [{"id": str(tags[1].pk), "text": "beta"}]
+
+
+@pytest.mark.django_db
+def test_filters_lazy_choices_view_all_values(
+    admin_client, user_admin_lazy_filters, user_factory
+):
+    user_factory(username="lazy-user")
+    url = reverse("admin:example_user_filter_choices", args=["username"])
+
+    # Only the requested page is loaded, not the choices rendered in the sheet
+    with patch.object(
+        LazyAllValuesCheckboxFilter, "get_lazy_choices"
+    ) as get_lazy_choices:
+        response = admin_client.get(url, {"term": "lazy"})
+
+    get_lazy_choices.assert_not_called()
+
+    assert response.json() == {
+        "results": [{"id": "lazy-user", "text": "lazy-user"}],
+        "pagination": {"more": False},
+    }
+
+
+@pytest.mark.django_db
+def test_filters_lazy_choices_view_not_lazy(admin_client, user_admin_lazy_filters):
+    url = reverse("admin:example_user_filter_choices", args=["is_staff"])
+
+    assert admin_client.get(url).status_code == 404
+
+
+@pytest.fixture
+def user_admin_deferred_filters():
+    model_admin = admin.site._registry[get_user_model()]
+
+    with (
+        patch.object(model_admin, "list_filter", [("is_staff", BooleanRadioFilter)]),
+        patch.object(model_admin, "list_filter_defer", True),
+    ):
+        yield model_admin
+
+
+@pytest.mark.django_db
+def test_filters_deferred_sheet(admin_client, user_admin_deferred_filters):
+    with patch.object(BooleanRadioFilter, "choices") as choices:
+        response = admin_client.get(
+            reverse("admin:example_user_changelist"), {"is_staff__exact": "1"}
+        )
+
+    choices.assert_not_called()
+    assert (
+        reverse("admin:example_user_changelist_filters") + "?is_staff__exact=1"
+        in response.content.decode()
+    )
+
+
+@pytest.mark.django_db
+def test_filters_deferred_sheet_view(admin_client, user_admin_deferred_filters):
+    response = admin_client.get(
+        reverse("admin:example_user_changelist_filters"), {"is_staff__exact": "1"}
+    )
+
+    assert response.status_code == 200
+    assert 'name="is_staff__exact" value="1"' in response.content.decode()
+    assert "<html" not in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_filters_deferred_sheet_view_without_results(
+    admin_client, user_admin_deferred_filters
+):
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get(reverse("admin:example_user_changelist_filters"))
+
+    assert response.context_data["cl"].result_count is None
+    assert not any("COUNT" in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_filters_deferred_sheet_related_choices(
+    admin_client, user_admin_deferred_filters, user_factory, tag_factory
+):
+    tag = tag_factory(name="deferred-tag")
+    user_factory(username="tagged").tags.add(tag)
+    user_factory(username="untagged")
+
+    with (
+        patch.object(
+            user_admin_deferred_filters,
+            "list_filter",
+            [("tags", RelatedCheckboxFilter)],
+        ),
+        CaptureQueriesContext(connection) as queries,
+    ):
+        response = admin_client.get(
+            reverse("admin:example_user_changelist"), {"tags__id__exact": tag.pk}
+        )
+
+    # Choices are not loaded, yet the filter still narrows the changelist
+    assert not any('FROM "example_tag"' in query["sql"] for query in queries)
+    assert [user.username for user in response.context_data["cl"].result_list] == [
+        "tagged"
+    ]
+
+
+@pytest.fixture
+def user_admin_cached_filters():
+    cache.clear()
+    model_admin = admin.site._registry[get_user_model()]
+
+    with (
+        patch.object(model_admin, "list_filter", [("tags", RelatedCheckboxFilter)]),
+        patch.object(RelatedCheckboxFilter, "cache_timeout", 60),
+    ):
+        clear_watched_models()
+        yield model_admin
+
+    clear_watched_models()
+    cache.clear()
+
+
+def _get_related_filter(request, model_admin):
+    return RelatedCheckboxFilter(
+        field=get_user_model()._meta.get_field("tags"),
+        request=request,
+        params={},
+        model=get_user_model(),
+        model_admin=model_admin,
+        field_path="tags",
+    )
+
+
+@pytest.mark.django_db
+def test_filters_cached_lookups(admin_request, user_admin_cached_filters, tag_factory):
+    tag = tag_factory(name="alpha")
+
+    assert _get_related_filter(
+        admin_request, user_admin_cached_filters
+    ).lookup_choices == [(tag.pk, "alpha")]
+
+    with CaptureQueriesContext(connection) as queries:
+        _get_related_filter(admin_request, user_admin_cached_filters)
+
+    assert not any("example_tag" in query["sql"] for query in queries)
+
+    # Saving the related model invalidates the choices
+    other_tag = tag_factory(name="beta")
+
+    assert _get_related_filter(
+        admin_request, user_admin_cached_filters
+    ).lookup_choices == [(tag.pk, "alpha"), (other_tag.pk, "beta")]
+
+
+@pytest.mark.django_db
+def test_filters_cached_models(user_admin_cached_filters, tag_factory):
+    assert Tag in get_cached_filter_models()
+
+    # Receivers only check membership in the precomputed set
+    with patch(
+        "unfold.contrib.filters.cache.get_fields_from_path"
+    ) as get_fields_from_path:
+        tag_factory(name="alpha")
+
+    get_fields_from_path.assert_not_called()
+
+
+class CachedRadioFilter(RadioFilter):
+    title = "cached"
+    parameter_name = "cached"
+    cache_timeout = 60
+    lookups_calls = 0
+
+    def lookups(self, request, model_admin):
+        CachedRadioFilter.lookups_calls += 1
+        return [("1", "One")]
+
+    def queryset(self, request, queryset):
+        return queryset
+
+
+class CachedRadioSubclassFilter(CachedRadioFilter):
+    def lookups(self, request, model_admin):
+        return [*super().lookups(request, model_admin), ("2", "Two")]
+
+
+@pytest.fixture
+def user_admin_cached_radio_filter():
+    cache.clear()
+    model_admin = admin.site._registry[get_user_model()]
+    CachedRadioFilter.lookups_calls = 0
+
+    with patch.object(
+        model_admin, "list_filter", [CachedRadioFilter, CachedRadioSubclassFilter]
+    ):
+        clear_watched_models()
+        yield model_admin
+
+    clear_watched_models()
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_filters_cached_simple_lookups(admin_request, user_admin_cached_radio_filter):
+    for _i in range(2):
+        filter = CachedRadioFilter(
+            admin_request, {}, get_user_model(), user_admin_cached_radio_filter
+        )
+
+        assert filter.lookup_choices == [("1", "One")]
+
+    assert CachedRadioFilter.lookups_calls == 1
+
+    # Lookups of the parent are computed as part of the subclass lookups
+    for _i in range(2):
+        filter = CachedRadioSubclassFilter(
+            admin_request, {}, get_user_model(), user_admin_cached_radio_filter
+        )
+
+        assert filter.lookup_choices == [("1", "One"), ("2", "Two")]
+
+    assert CachedRadioFilter.lookups_calls == 2
+
+
+@pytest.mark.django_db
+def test_filters_cached_simple_lookups_not_listed(admin_request, user_model_admin):
+    cache.clear()
+    CachedRadioFilter.lookups_calls = 0
+
+    # Not invalidated without being listed in list_filter, so not cached
+    for _i in range(2):
+        CachedRadioFilter(admin_request, {}, get_user_model(), user_model_admin)
+
+    assert CachedRadioFilter.lookups_calls == 2
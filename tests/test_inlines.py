@@ -1,7 +1,13 @@
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from example.admin import UserTagInline
+
+from unfold.paginator import KeysetPaginator
 
 from .factories import TagFactory
 
@@ -50,3 +56,104 @@ def test_inline_collapsible(client, admin_user):
     response = client.get(reverse("admin:example_user_change", args=(admin_user.pk,)))
     assert response.status_code == HTTPStatus.OK
     assert 'x-on:click="open = !open' in response.content.decode()
+
+
+@pytest.fixture
+def keyset_user_tag_inline():
+    with patch.object(UserTagInline, "paginator", KeysetPaginator):
+        yield UserTagInline
+
+
+@pytest.mark.django_db
+def test_inline_keyset_pagination(client, admin_user, keyset_user_tag_inline):
+    for i in range(3):
+        admin_user.tags.add(TagFactory(name=f"Tag {i}"))
+
+    client.force_login(admin_user)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(
+            reverse("admin:example_user_change", args=(admin_user.pk,))
+        )
+
+    formset = response.context_data["inline_admin_formsets"][0].formset
+    content = response.content.decode()
+
+    assert response.status_code == HTTPStatus.OK
+    assert isinstance(formset.paginator, KeysetPaginator)
+    assert formset.page.has_next()
+    assert "user-tag relationships" not in content
+    assert (
+        reverse("admin:example_user_inline_page", args=(admin_user.pk, formset.prefix))
+        in content
+    )
+    assert 'hx-swap="outerHTML"' in content
+    assert not any(
+        "COUNT" in query["sql"] and "example_user_tags" in query["sql"]
+        for query in queries
+    )
+
+
+@pytest.mark.django_db
+def test_inline_keyset_page_view(client, admin_user, keyset_user_tag_inline):
+    tags = [TagFactory(name=f"Tag {i}") for i in range(3)]
+    admin_user.tags.add(*tags)
+    client.force_login(admin_user)
+
+    response = client.get(reverse("admin:example_user_change", args=(admin_user.pk,)))
+    formset = response.context_data["inline_admin_formsets"][0].formset
+    url = reverse(
+        "admin:example_user_inline_page", args=(admin_user.pk, formset.prefix)
+    )
+
+    response = client.get(
+        url, {formset.get_cursor_key(): formset.page.next_params["cursor"]}
+    )
+    page_formset = response.context_data["inline_admin_formset"].formset
+    content = response.content.decode()
+
+    assert response.status_code == HTTPStatus.OK
+    assert [form.instance.tag for form in page_formset.forms[:1]] == [tags[1]]
+    assert content.lstrip().startswith('<div class="js-inline-admin-formset')
+    assert 'name="csrfmiddlewaretoken"' not in content
+    assert page_formset.page.has_previous()
+    assert page_formset.page.has_next()
+
+
+@pytest.mark.django_db
+def test_inline_keyset_page_numbers_fallback(
+    client, admin_user, keyset_user_tag_inline
+):
+    tags = [TagFactory(name=f"Tag {i}") for i in range(3)]
+    admin_user.tags.add(*tags)
+    client.force_login(admin_user)
+
+    # Relations can't be continued by values so pages are numbered instead
+    with patch.object(UserTagInline, "ordering", ["tag"]):
+        response = client.get(
+            reverse("admin:example_user_change", args=(admin_user.pk,))
+        )
+        formset = response.context_data["inline_admin_formsets"][0].formset
+        url = reverse(
+            "admin:example_user_inline_page", args=(admin_user.pk, formset.prefix)
+        )
+
+        assert f"{url}?{formset.get_pagination_key()}=2" in response.content.decode()
+
+        response = client.get(url, {formset.get_pagination_key(): 2})
+
+    page_formset = response.context_data["inline_admin_formset"].formset
+
+    assert [form.instance.tag for form in page_formset.forms[:1]] == [tags[1]]
+    assert page_formset.page.previous_params == {"p": 1}
+
+
+@pytest.mark.django_db
+def test_inline_page_view_unknown_prefix(client, admin_user):
+    client.force_login(admin_user)
+
+    response = client.get(
+        reverse("admin:example_user_inline_page", args=(admin_user.pk, "unknown"))
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -1,6 +1,7 @@
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
 
+from unfold.navigation import LinkIndex
 from unfold.settings import CONFIG_DEFAULTS
 from unfold.sites import UnfoldAdminSite
 
@@ -111,3 +112,43 @@ def test_navigations_check_tab_path_allow_permission():
     request = RequestFactory().get("/rand")
     tabs = admin_site.get_tabs_list(request)
     assert tabs[0]["items"][0]["has_permission"]
+
+
+def test_navigations_link_index_prefix_match():
+    index = LinkIndex(
+        "/admin/",
+        [
+            "/admin/",
+            "/admin/example/",
+            "/admin/example/user/",
+            "/admin/example/tag/",
+        ],
+    )
+
+    assert index.match("/admin/example/user/1/change/") == {
+        "/admin/",
+        "/admin/example/",
+        "/admin/example/user/",
+    }
+    assert index.match("/other/") == frozenset()
+
+
+def test_navigations_link_index_is_active():
+    index = LinkIndex("/admin/", ["/admin/", "/admin/example/user/?status=1"])
+    request = RequestFactory().get("/admin/example/user/", {"status": "2"})
+
+    assert index.is_active(request, "/admin/example/user/?status=1")
+    assert not index.is_active(request, "/admin/example/user/?status=1", True)
+    assert not index.is_active(request, "/admin/")
+    assert not index.is_active(request, "/example/user/")
+    assert not index.is_active(request, "https://example.com")
+    assert index.is_active(RequestFactory().get("/admin/"), "/admin/")
+
+
+def test_navigations_link_index_not_indexed_link():
+    index = LinkIndex("/admin/")
+    request = RequestFactory().get("/admin/example/user/")
+
+    assert index.is_active(request, "/admin/example/")
+    assert index.is_active(request, "example/user/")
+    assert not index.is_active(request, "/admin/example/tag/")
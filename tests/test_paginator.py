@@ -0,0 +1,308 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.contrib import admin
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from example.models import Tag, User
+
+from unfold.paginator import (
+    CURSOR_VAR,
+    EstimatedCountPaginator,
+    InfinitePaginator,
+    KeysetPaginator,
+)
+from unfold.templatetags.unfold import approximate_count
+from unfold.views import ChangeList
+
+
+@pytest.mark.django_db
+def test_infinite_paginator_has_next_without_count():
+    Tag.objects.bulk_create(Tag(name=name) for name in "abcde")
+    paginator = InfinitePaginator(Tag.objects.order_by("name"), 2)
+
+    with CaptureQueriesContext(connection) as queries:
+        pages = [paginator.page(number) for number in (1, 2, 3)]
+        names = [[tag.name for tag in page.object_list] for page in pages]
+
+    assert names == [["a", "b"], ["c", "d"], ["e"]]
+    assert [page.has_next() for page in pages] == [True, True, False]
+    assert [page.has_previous() for page in pages] == [False, True, True]
+    assert len(queries) == 3
+    assert not any("COUNT" in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_infinite_paginator_exact_last_page():
+    Tag.objects.bulk_create(Tag(name=name) for name in "abcd")
+    paginator = InfinitePaginator(Tag.objects.order_by("name"), 2)
+
+    page = paginator.page(2)
+
+    assert not page.has_next()
+    assert len(page) == 2
+
+
+def test_infinite_paginator_list():
+    paginator = InfinitePaginator(list(range(5)), 2)
+
+    assert list(paginator.page(2)) == [2, 3]
+    assert paginator.page(2).has_next()
+    assert not paginator.page(3).has_next()
+
+
+@pytest.mark.django_db
+def test_infinite_paginator_changelist(admin_client):
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(4))
+
+    with (
+        patch.object(admin.site._registry[Tag], "paginator", InfinitePaginator),
+        patch.object(admin.site._registry[Tag], "show_full_result_count", False),
+        patch.object(admin.site._registry[Tag], "list_per_page", 2),
+        CaptureQueriesContext(connection) as queries,
+    ):
+        response = admin_client.get("/admin/example/tag/", {"p": 2})
+
+    changelist = response.context_data["cl"]
+
+    assert response.status_code == 200
+    assert changelist.page.has_previous()
+    assert not changelist.page.has_next()
+    assert "?p=3" not in response.content.decode()
+    assert not any(
+        "COUNT" in query["sql"] and "example_tag" in query["sql"] for query in queries
+    )
+
+
+class SmallEstimatedCountPaginator(EstimatedCountPaginator):
+    estimate_threshold = 10
+
+
+def _analyze():
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+@pytest.mark.django_db
+def test_estimated_count_paginator_uses_statistics():
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(20))
+    _analyze()
+    Tag.objects.bulk_create(Tag(name=f"new-{i}") for i in range(5))
+
+    paginator = SmallEstimatedCountPaginator(Tag.objects.order_by("pk"), 10)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert paginator.count == 20
+
+    assert paginator.is_estimated
+    assert not any("COUNT" in query["sql"] for query in queries)
+
+    # Estimate may be lower than the real count, last page stays reachable
+    assert [tag.name for tag in paginator.page(3)] == [f"new-{i}" for i in range(5)]
+
+
+@pytest.mark.django_db
+def test_estimated_count_paginator_exact_below_threshold():
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(5))
+    _analyze()
+    Tag.objects.create(name="new")
+
+    paginator = SmallEstimatedCountPaginator(Tag.objects.order_by("pk"), 10)
+
+    assert paginator.count == 6
+    assert not paginator.is_estimated
+
+
+@pytest.mark.django_db
+def test_estimated_count_paginator_exact_without_statistics():
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(20))
+
+    filtered = SmallEstimatedCountPaginator(
+        Tag.objects.filter(name__startswith="tag-1").order_by("pk"), 10
+    )
+    _analyze()
+    paginator = SmallEstimatedCountPaginator(Tag.objects.order_by("pk"), 10)
+
+    # SQLite has no row estimates for filtered queries
+    assert filtered.count == 11
+    assert not filtered.is_estimated
+    assert paginator.count == 20
+    assert paginator.is_estimated
+
+
+@pytest.mark.django_db
+def test_estimated_count_paginator_changelist(admin_client):
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(1_500))
+    _analyze()
+
+    with (
+        patch.object(
+            admin.site._registry[Tag], "paginator", SmallEstimatedCountPaginator
+        ),
+        CaptureQueriesContext(connection) as queries,
+    ):
+        response = admin_client.get("/admin/example/tag/")
+
+    assert response.status_code == 200
+    assert response.context_data["cl"].result_count == 1_500
+    assert response.context_data["cl"].full_result_count_estimated
+    assert "~1.5K" in response.content.decode()
+    assert not any(
+        "COUNT" in query["sql"] and "example_tag" in query["sql"] for query in queries
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (950, "~950"),
+        (1_000, "~1K"),
+        (12_345, "~12.3K"),
+        (1_234_567, "~1.2M"),
+        (3_000_000_000, "~3B"),
+    ],
+)
+def test_approximate_count(value, expected):
+    assert approximate_count(value) == expected
+
+
+def _get_pages(paginator):
+    page = paginator.get_keyset_page(None)
+    pages = [[tag.name for tag in page.object_list]]
+
+    while page.has_next():
+        page = paginator.get_keyset_page(page.next_params[CURSOR_VAR])
+        pages.append([tag.name for tag in page.object_list])
+
+    return page, pages
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_pages():
+    Tag.objects.bulk_create(Tag(name=name) for name in "bbaacdde")
+    paginator = KeysetPaginator(Tag.objects.order_by("name"), 3)
+
+    page, pages = _get_pages(paginator)
+
+    assert pages == [["a", "a", "b"], ["b", "c", "d"], ["d", "e"]]
+    assert page.has_previous()
+
+    page = paginator.get_keyset_page(page.previous_params[CURSOR_VAR])
+    assert [tag.name for tag in page.object_list] == ["b", "c", "d"]
+
+    page = paginator.get_keyset_page(page.previous_params[CURSOR_VAR])
+    assert [tag.name for tag in page.object_list] == ["a", "a", "b"]
+    assert not page.has_previous()
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_descending():
+    Tag.objects.bulk_create(Tag(name=name) for name in "abcde")
+    paginator = KeysetPaginator(Tag.objects.order_by("-name"), 2)
+
+    _page, pages = _get_pages(paginator)
+
+    assert pages == [["e", "d"], ["c", "b"], ["a"]]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["date_joined", "-date_joined"])
+def test_keyset_paginator_sub_millisecond_datetimes(ordering):
+    date_joined = timezone.now().replace(microsecond=0)
+    User.objects.bulk_create(
+        User(
+            username=f"u{i}",
+            date_joined=date_joined + datetime.timedelta(microseconds=100 * i),
+        )
+        for i in range(6)
+    )
+    paginator = KeysetPaginator(User.objects.order_by(ordering), 2)
+    page = paginator.get_keyset_page(None)
+    usernames = [user.username for user in page.object_list]
+
+    # Bounded, repeated rows would otherwise never reach the last page
+    for _i in range(5):
+        if not page.has_next():
+            break
+
+        page = paginator.get_keyset_page(page.next_params[CURSOR_VAR])
+        usernames.extend(user.username for user in page.object_list)
+
+    expected = [f"u{i}" for i in range(6)]
+    assert usernames == (expected if ordering == "date_joined" else expected[::-1])
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_deep_page_without_offset_or_count():
+    Tag.objects.bulk_create(Tag(name=f"tag-{i:03}") for i in range(100))
+    paginator = KeysetPaginator(Tag.objects.order_by("name"), 10)
+    page = paginator.get_keyset_page(None)
+
+    for _i in range(8):
+        page = paginator.get_keyset_page(page.next_params[CURSOR_VAR])
+
+    with CaptureQueriesContext(connection) as queries:
+        page = paginator.get_keyset_page(page.next_params[CURSOR_VAR])
+        names = [tag.name for tag in page.object_list]
+
+    assert names == [f"tag-{i:03}" for i in range(90, 100)]
+    assert not page.has_next()
+    assert len(queries) == 2
+    assert not any("OFFSET" in query["sql"] for query in queries)
+    assert not any("COUNT" in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_invalid_cursor():
+    Tag.objects.bulk_create(Tag(name=name) for name in "abc")
+    paginator = KeysetPaginator(Tag.objects.order_by("name"), 2)
+
+    for cursor in [
+        "invalid",
+        "W10",
+        KeysetPaginator(Tag.objects.order_by("-pk"), 2).encode_cursor("next", (1,)),
+    ]:
+        page = paginator.get_keyset_page(cursor)
+
+        assert [tag.name for tag in page.object_list] == ["a", "b"]
+        assert not page.has_previous()
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_offset_fallback():
+    Tag.objects.bulk_create(Tag(name=name) for name in "abc")
+    paginator = KeysetPaginator(Tag.objects.order_by("?"), 2)
+
+    assert paginator.keyset is None
+
+    page = paginator.get_keyset_page(None, 2)
+
+    assert len(page.object_list) == 1
+    assert page.previous_params == {"p": 1}
+    assert not page.has_next()
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_changelist(admin_client):
+    Tag.objects.bulk_create(Tag(name=f"tag-{i}") for i in range(5))
+
+    with (
+        patch.object(admin.site._registry[Tag], "paginator", KeysetPaginator),
+        patch.object(admin.site._registry[Tag], "list_per_page", 2),
+    ):
+        response = admin_client.get("/admin/example/tag/")
+        changelist = response.context_data["cl"]
+
+        assert isinstance(changelist, ChangeList)
+        assert changelist.multi_page
+        assert changelist.page.has_next()
+        assert "cursor=" in response.content.decode()
+
+        response = admin_client.get("/admin/example/tag/", changelist.page.next_params)
+        changelist = response.context_data["cl"]
+
+    assert response.status_code == 200
+    assert [tag.name for tag in changelist.result_list] == ["tag-2", "tag-1"]
+    assert CURSOR_VAR not in changelist.get_query_string()
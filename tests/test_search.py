@@ -0,0 +1,277 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib import admin
+from django.test import override_settings
+from example.models import Tag
+
+from unfold.search import SQLiteSearchIndex, get_search_index
+from unfold.settings import CONFIG_DEFAULTS
+from unfold.sites import UnfoldAdminSite
+
+SEARCH_INDEX_SETTINGS = {
+    **CONFIG_DEFAULTS,
+    **{
+        "COMMAND": {
+            "search_models": True,
+            "search_cache_timeout": 0,
+            "search_index": {
+                "models": ["example.tag"],
+            },
+        }
+    },
+}
+
+
+def _get_site():
+    site = UnfoldAdminSite()
+    site._registry = admin.site._registry
+    return site
+
+
+def test_search_index_disabled():
+    assert get_search_index() is None
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+def test_search_index_default_backend():
+    search_index = get_search_index()
+
+    assert isinstance(search_index, SQLiteSearchIndex)
+    assert get_search_index() is search_index
+    assert search_index.is_indexed(Tag)
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_records(tag_factory):
+    tag_factory(name="Invoice 2024")
+    tag_factory(name="Inventory")
+    search_index = get_search_index()
+
+    def titles(search_term):
+        return sorted(
+            title for _pk, title in search_index.search_records(Tag, search_term)
+        )
+
+    assert titles("nvo") == ["Invoice 2024"]
+    assert titles("in") == ["Inventory", "Invoice 2024"]
+    assert titles("invoice 24") == ["Invoice 2024"]
+    assert titles("missing") == []
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_records_normalized(tag_factory):
+    tag_factory(name="السيد أَحْمَـــد")
+    tag_factory(name="Café")
+    search_index = get_search_index()
+
+    assert [title for _pk, title in search_index.search_records(Tag, "احمد")] == [
+        "السيد أَحْمَـــد"
+    ]
+    assert [title for _pk, title in search_index.search_records(Tag, "cafe")] == [
+        "Café"
+    ]
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_updated_by_signals(
+    tag_factory, django_capture_on_commit_callbacks
+):
+    tag = tag_factory(name="first-name")
+    search_index = get_search_index()
+    search_index.search_records(Tag, "first")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tag.name = "second-name"
+        tag.save()
+
+    assert search_index.search_records(Tag, "first") == []
+    assert search_index.search_records(Tag, "second") == [(tag.pk, "second-name")]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tag.delete()
+
+    assert search_index.search_records(Tag, "second") == []
+
+
+@pytest.mark.parametrize("search_term", ["us", "tag", "authentication", "missing"])
+@pytest.mark.django_db
+def test_search_index_apps(rf, admin_user, search_term):
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    expected = site._search_apps(site.get_app_list(request), search_term)
+
+    with override_settings(UNFOLD=SEARCH_INDEX_SETTINGS):
+        results = site._search_apps_index(request, get_search_index(), search_term)
+
+    assert results == expected
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_apps_permissions(rf, staff_user):
+    request = rf.get("/")
+    request.user = staff_user
+    site = _get_site()
+
+    assert site._search_apps_index(request, get_search_index(), "tag") == []
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_models(rf, admin_user, tag_factory):
+    tag_factory(name="indexed-tag")
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+
+    with patch.object(site._registry[Tag], "get_search_results") as get_search_results:
+        results = site._search_model(request, site._registry[Tag], "indexed-tag")
+
+    get_search_results.assert_not_called()
+    assert [result.title for result in results] == ["indexed-tag"]
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_models_queryset(rf, admin_user, tag_factory):
+    tag_factory(name="visible-tag")
+    hidden_tag = tag_factory(name="hidden-tag")
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    tag_admin = site._registry[Tag]
+
+    with patch.object(
+        tag_admin,
+        "get_queryset",
+        return_value=Tag.objects.exclude(pk=hidden_tag.pk),
+    ):
+        results = site._search_model(request, tag_admin, "tag")
+
+    assert [result.title for result in results] == ["visible-tag"]
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_records_limit(tag_factory):
+    for name in ["tag-1", "tag-2", "tag-3"]:
+        tag_factory(name=name)
+
+    search_index = get_search_index()
+
+    def titles(**kwargs):
+        return [
+            title for _pk, title in search_index.search_records(Tag, "tag", **kwargs)
+        ]
+
+    assert titles(limit=2) == ["tag-1", "tag-2"]
+    assert titles(limit=2, offset=2) == ["tag-3"]
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_records_built_without_lock(tag_factory):
+    tag_factory(name="unlocked-tag")
+    search_index = get_search_index()
+    get_record = search_index.get_record
+
+    def get_unlocked_record(instance):
+        assert not search_index.lock.locked()
+        return get_record(instance)
+
+    with patch.object(search_index, "get_record", side_effect=get_unlocked_record):
+        search_index.search_records(Tag, "unlocked")
+
+    assert [title for _pk, title in search_index.search_records(Tag, "unlocked")] == [
+        "unlocked-tag"
+    ]
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_models_queryset_limit(rf, admin_user, tag_factory):
+    hidden_tag = tag_factory(name="hidden-tag")
+    tag_factory(name="visible-tag")
+    request = rf.get("/")
+    request.user = admin_user
+    site = _get_site()
+    tag_admin = site._registry[Tag]
+
+    # Hidden records do not count towards the limit of records read from index
+    with patch.object(
+        tag_admin,
+        "get_queryset",
+        return_value=Tag.objects.exclude(pk=hidden_tag.pk),
+    ):
+        results = site._search_model(request, tag_admin, "tag", 1)
+
+    assert [result.title for result in results] == ["visible-tag"]
+
+
+@override_settings(UNFOLD=SEARCH_INDEX_SETTINGS)
+@pytest.mark.django_db
+def test_search_index_records_changed_while_built(tag_factory):
+    renamed_tag = tag_factory(name="renamed-tag")
+    deleted_tag = tag_factory(name="deleted-tag")
+    search_index = get_search_index()
+    get_record = search_index.get_record
+    changed = False
+
+    def get_record_and_change(instance):
+        nonlocal changed
+
+        if not changed:
+            # Saved and deleted by another request after the records were read
+            changed = True
+            Tag.objects.filter(pk=renamed_tag.pk).update(name="updated-tag")
+            renamed_tag.refresh_from_db()
+            search_index.update_record(renamed_tag)
+            search_index.delete_record(Tag, deleted_tag.pk)
+
+        return get_record(instance)
+
+    with patch.object(search_index, "get_record", side_effect=get_record_and_change):
+        search_index.search_records(Tag, "tag")
+
+    assert search_index.search_records(Tag, "tag") == [(renamed_tag.pk, "updated-tag")]
+
+
+@pytest.mark.django_db
+def test_search_index_records_shared_file(tmp_path, tag_factory):
+    tag = tag_factory(name="shared-tag")
+    path = str(tmp_path / "index.sqlite3")
+    first_index = SQLiteSearchIndex(["example.tag"], path=path)
+    second_index = SQLiteSearchIndex(["example.tag"], path=path)
+    get_record = first_index.get_record
+
+    def get_record_and_build(instance):
+        # Another process indexes the model while the first one reads records
+        second_index.search_records(Tag, "shared")
+        return get_record(instance)
+
+    with patch.object(first_index, "get_record", side_effect=get_record_and_build):
+        assert first_index.search_records(Tag, "shared") == [(tag.pk, "shared-tag")]
+
+    assert second_index.search_records(Tag, "shared") == [(tag.pk, "shared-tag")]
+
+
+def test_search_index_names_versioned(tmp_path):
+    path = str(tmp_path / "index.sqlite3")
+    model_names = [("example.tag", "Example", "Tags")]
+
+    with patch.object(SQLiteSearchIndex, "get_model_names", return_value=model_names):
+        assert SQLiteSearchIndex(path=path).search_models("tags") == ["example.tag"]
+
+    # Restarted with a renamed model
+    model_names = [("example.tag", "Example", "Labels")]
+
+    with patch.object(SQLiteSearchIndex, "get_model_names", return_value=model_names):
+        search_index = SQLiteSearchIndex(path=path)
+
+        assert search_index.search_models("labels") == ["example.tag"]
+        assert search_index.search_models("tags") == []
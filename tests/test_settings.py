@@ -1,17 +1,69 @@
+import pytest
 from django.conf import settings
 from django.test.utils import override_settings
 
-from unfold.settings import CONFIG_DEFAULTS, get_config
+from unfold.settings import CONFIG_DEFAULTS, freeze_dict, get_config
 
 
 def test_settings_default_config():
-    assert get_config() == CONFIG_DEFAULTS
+    # Lists of the defaults are frozen into tuples
+    assert get_config() == freeze_dict(CONFIG_DEFAULTS)
 
 
 def test_settings_default_config_with_custom_settings_name():
-    assert get_config("CUSTOM_SETTINGS_NAME") == CONFIG_DEFAULTS
+    assert get_config("CUSTOM_SETTINGS_NAME") == freeze_dict(CONFIG_DEFAULTS)
 
 
 @override_settings(UNFOLD={**CONFIG_DEFAULTS, **{"SITE_TITLE": "Test site title"}})
 def test_settings_extended_config():
     assert settings.UNFOLD["SITE_TITLE"] == "Test site title"
+
+
+def test_settings_config_is_cached():
+    assert get_config() is get_config()
+
+
+def test_settings_config_is_read_only():
+    config = get_config()
+
+    with pytest.raises(TypeError):
+        config["SITE_TITLE"] = "Test site title"
+
+    with pytest.raises(TypeError):
+        config["COMMAND"]["search_models"] = True
+
+
+@override_settings(
+    UNFOLD={
+        "SIDEBAR": {
+            "navigation": [
+                {
+                    "title": "Navigation",
+                    "items": [{"title": "Item", "link": "/item/"}],
+                }
+            ]
+        }
+    }
+)
+def test_settings_config_nested_is_read_only():
+    navigation = get_config()["SIDEBAR"]["navigation"]
+
+    with pytest.raises(TypeError):
+        navigation[0]["items"][0]["link"] = "/changed/"
+
+    with pytest.raises(AttributeError):
+        navigation[0]["items"].append({"title": "Added", "link": "/added/"})
+
+    assert get_config()["SIDEBAR"]["navigation"][0]["items"] == (
+        {"title": "Item", "link": "/item/"},
+    )
+
+
+def test_settings_config_reset_on_setting_changed():
+    assert get_config()["SITE_TITLE"] is None
+
+    with override_settings(UNFOLD={"SITE_TITLE": "Test site title"}):
+        assert get_config()["SITE_TITLE"] == "Test site title"
+        assert get_config()["SITE_URL"] == "/"
+
+    assert get_config()["SITE_TITLE"] is None
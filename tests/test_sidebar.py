@@ -116,3 +116,85 @@ def test_sidebar_navigation_with_lambda_link(admin_user):
     assert (
         context["sidebar_navigation"][0]["items"][0]["link"](request) == "/lambda/link"
     )
+
+
+def badge_callback(request):
+    return "10"
+
+
+NAVIGATION = [
+    {
+        "title": _("Navigation"),
+        "items": [
+            {
+                "title": _("Dashboard"),
+                "link": reverse_lazy("admin:index"),
+                "badge": "tests.test_sidebar.badge_callback",
+                "permission": lambda request: request.user.is_superuser,
+            },
+            {
+                "title": _("Users"),
+                "link": "/admin/example/user/",
+            },
+        ],
+    }
+]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "SIDEBAR": {
+                "navigation": NAVIGATION,
+            },
+        },
+    }
+)
+@pytest.mark.django_db
+def test_sidebar_navigation_compiled_once(admin_user):
+    admin_site = UnfoldAdminSite()
+    request = RequestFactory().get("/admin/example/user/")
+    request.user = admin_user
+
+    first = admin_site.get_sidebar_list(request)
+    compiled = admin_site._compiled_navigation
+    second = admin_site.get_sidebar_list(request)
+
+    assert admin_site._compiled_navigation is compiled
+    assert first == second
+    assert first[0]["items"][0] is not second[0]["items"][0]
+    assert first[0]["items"][0]["has_permission"] is True
+    assert first[0]["items"][0]["badge_callback"] == "10"
+    assert first[0]["items"][0]["active"] is False
+    assert first[0]["items"][1]["active"] is True
+    assert "has_permission" not in NAVIGATION[0]["items"][0]
+
+
+@override_settings(
+    UNFOLD={
+        **CONFIG_DEFAULTS,
+        **{
+            "SIDEBAR": {
+                "cache_permissions": True,
+                "navigation": NAVIGATION,
+            },
+        },
+    }
+)
+@pytest.mark.django_db
+def test_sidebar_navigation_permissions_cache(admin_user, staff_user):
+    admin_site = UnfoldAdminSite()
+
+    for user, has_permission in [
+        (admin_user, True),
+        (staff_user, False),
+        (admin_user, True),
+    ]:
+        request = RequestFactory().get("/rand")
+        request.user = user
+        items = admin_site.get_sidebar_list(request)[0]["items"]
+        assert items[0]["has_permission"] is has_permission
+        assert items[1]["has_permission"] is True
+
+    assert len(admin_site._compiled_navigation[2]) == 2
@@ -1,9 +1,22 @@
+import re
+from unittest.mock import patch
+
+import pytest
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 from django.utils.translation import override
 from djmoney.models.fields import MoneyField
 from djmoney.money import Money
 
+from unfold import utils
 from unfold.templatetags.unfold import element_classes
-from unfold.utils import display_for_field
+from unfold.utils import (
+    display_for_field,
+    display_for_label,
+    display_for_value,
+    get_search_key,
+    get_search_regex,
+)
 
 
 def test_display_for_field_money():
@@ -63,3 +76,82 @@ def test_element_classes_list():
 
     result = element_classes(context, "test")
     assert result == "test-class test-class-2"
+
+
+def test_display_for_value_boolean_rendered_once_per_state():
+    utils._fragments.clear()
+
+    values = [True, False, None, "", 1, 0, "yes"] * 100
+
+    with patch.object(utils, "render_to_string", wraps=render_to_string) as render:
+        results = [display_for_value(value, "-", boolean=True) for value in values]
+
+    assert render.call_count <= 3
+    assert results[:7] == [
+        render_to_string("unfold/helpers/boolean.html", {"value": value})
+        for value in values[:7]
+    ]
+
+
+def test_display_for_value_boolean_per_language():
+    utils._fragments.clear()
+
+    with patch.object(utils, "render_to_string", wraps=render_to_string) as render:
+        with override("en"):
+            display_for_value(True, "-", boolean=True)
+            display_for_value(True, "-", boolean=True)
+
+        with override("de"):
+            display_for_value(True, "-", boolean=True)
+
+    assert render.call_count == 2
+
+
+def test_display_for_label_cached():
+    utils._fragments.clear()
+
+    with patch.object(utils, "render_to_string", wraps=render_to_string) as render:
+        first = display_for_label("active", "-", {"active": "success"})
+        second = display_for_label("active", "-", {"active": "success"})
+        multiple = display_for_label(["a", "b"], "-", True)
+
+    assert render.call_count == 2
+    assert first == second
+    assert "bg-green-100" in first
+    assert "a" in multiple
+
+
+def test_display_for_label_safe_string_not_shared():
+    escaped = display_for_label("<b>label</b>", "-", True)
+    safe = display_for_label(mark_safe("<b>label</b>"), "-", True)
+
+    assert "&lt;b&gt;label&lt;/b&gt;" in escaped
+    assert "<b>label</b>" in safe
+
+
+@pytest.mark.parametrize(
+    "value,search_key",
+    [
+        ("Invoice", "invoice"),
+        ("Café", "cafe"),
+        ("أَحْمَد", "احمد"),
+        ("احـــمد", "احمد"),
+        ("إحمد", "احمد"),
+        ("آمال", "امال"),
+        ("ٱلله", "الله"),
+        ("مستشفى", "مستشفي"),
+        ("کتابی", "کتابي"),
+        ("مسؤول", "مسوول"),
+    ],
+)
+def test_get_search_key(value, search_key):
+    assert get_search_key(value) == search_key
+
+
+def test_get_search_regex():
+    search_regex = get_search_regex("احمد")
+
+    assert get_search_regex("invoice") is None
+    assert re.search(search_regex, "السيد أَحْمَـــد", re.IGNORECASE)
+    assert re.search(search_regex, "إحمد", re.IGNORECASE)
+    assert not re.search(search_regex, "محمود", re.IGNORECASE)